@@ -1,10 +1,32 @@
-from flask import Blueprint, request, jsonify
-from ..services.resume_tailor import ResumeTailor
-from ..services.ats_analyzer import ATSAnalyzer
+import json
+from flask import Blueprint, Response, request, jsonify, stream_with_context, url_for
+from ..services.task_queue import FINISHED, get_analysis_queue
+from ..services.worker_pool import (
+    PoolBusyError, PoolTimeoutError, get_analysis_pool,
+    analyze_resume_task, extraction_cache_stats_task, score_jobs_task, tailor_resume_task
+)
 
 resume_bp = Blueprint('resume', __name__)
-resume_tailor = ResumeTailor()
-ats_analyzer = ATSAnalyzer()
+analysis_pool = get_analysis_pool()
+
+def pool_busy_response():
+    response = jsonify({'error': 'Server is busy, please retry shortly'})
+    response.headers['Retry-After'] = '5'
+    return response, 503
+
+def pool_timeout_response():
+    return jsonify({'error': 'Resume processing timed out'}), 504
+
+def wants_async() -> bool:
+    """Clients opt into a queued job with ?async=1 or an 'async' form field."""
+    value = request.args.get('async', request.form.get('async', ''))
+    return value.lower() in ('1', 'true', 'yes')
+
+def enqueue(kind, file_content, file_type, job_description=None):
+    job = get_analysis_queue().submit(kind, file_content, file_type, job_description)
+    job['status_url'] = url_for('resume.get_job', job_id=job['job_id'])
+    job['events_url'] = url_for('resume.job_events', job_id=job['job_id'])
+    return jsonify(job), 200 if job['status'] == 'done' else 202
 
 @resume_bp.route('/analyze', methods=['POST'])
 def analyze_resume():
@@ -24,10 +46,17 @@ def analyze_resume():
         # Read file content
         file_content = file.read()
         
-        # Analyze resume
-        result = ats_analyzer.analyze_resume(file_content, file_type)
+        if wants_async():
+            return enqueue('analyze', file_content, file_type)
+        
+        # Analyze resume in a worker process
+        result = analysis_pool.run(analyze_resume_task, file_content, file_type)
         
         return jsonify(result)
+    except PoolBusyError:
+        return pool_busy_response()
+    except PoolTimeoutError:
+        return pool_timeout_response()
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
@@ -54,18 +83,114 @@ def tailor_resume():
         # Read file content
         file_content = file.read()
         
-        # Extract text based on file type
-        if file_type == 'pdf':
-            resume_text = ats_analyzer.extract_text_from_pdf(file_content)
-        else:  # doc or docx
-            resume_text = ats_analyzer.extract_text_from_docx(file_content)
+        if wants_async():
+            return enqueue('tailor', file_content, file_type, job_description)
         
-        # Tailor resume
-        optimized_resume, analysis = resume_tailor.get_optimized_resume(resume_text, job_description)
+        # Extract and tailor in a worker process
+        result = analysis_pool.run(tailor_resume_task, file_content, file_type, job_description)
         
-        return jsonify({
-            'analysis': analysis,
-            'optimized_resume': optimized_resume
-        })
+        return jsonify(result)
+    except PoolBusyError:
+        return pool_busy_response()
+    except PoolTimeoutError:
+        return pool_timeout_response()
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+@resume_bp.route('/tailor/batch', methods=['POST'])
+def score_jobs():
+    """Rank many jobs against one resume.
+
+    Form fields: 'jobs' is a JSON list of {"job_id", "description"} objects
+    (or 'job_descriptions', a JSON list of strings); 'top_k' is optional.
+    """
+    if 'file' not in request.files:
+        return jsonify({'error': 'No file provided'}), 400
+
+    try:
+        if 'jobs' in request.form:
+            jobs = json.loads(request.form['jobs'])
+        elif 'job_descriptions' in request.form:
+            jobs = [{'description': description} for description in json.loads(request.form['job_descriptions'])]
+        else:
+            return jsonify({'error': 'No jobs provided'}), 400
+        top_k = int(request.form['top_k']) if request.form.get('top_k') else None
+    except (ValueError, TypeError):
+        return jsonify({'error': 'Invalid jobs payload'}), 400
+
+    if not isinstance(jobs, list) or not all(isinstance(job, dict) for job in jobs):
+        return jsonify({'error': 'Invalid jobs payload'}), 400
+
+    file = request.files['file']
+    if file.filename == '':
+        return jsonify({'error': 'No file selected'}), 400
+
+    # Get file extension
+    file_type = file.filename.split('.')[-1].lower()
+    if file_type not in ['pdf', 'doc', 'docx']:
+        return jsonify({'error': 'Unsupported file type'}), 400
+
+    try:
+        # Extract the resume once for the whole batch
+        file_content = file.read()
+        result = analysis_pool.run(score_jobs_task, file_content, file_type, jobs, top_k)
+
+        return jsonify(result)
+    except PoolBusyError:
+        return pool_busy_response()
+    except PoolTimeoutError:
+        return pool_timeout_response()
     except Exception as e:
-        return jsonify({'error': str(e)}), 500 
\ No newline at end of file
+        return jsonify({'error': str(e)}), 500
+
+@resume_bp.route('/cache/stats', methods=['GET'])
+def extraction_cache_stats():
+    # Extraction runs in the worker processes, so the counters come from one of them
+    try:
+        return jsonify(analysis_pool.run(extraction_cache_stats_task))
+    except PoolBusyError:
+        return pool_busy_response()
+    except PoolTimeoutError:
+        return pool_timeout_response()
+
+@resume_bp.route('/pool/stats', methods=['GET'])
+def analysis_pool_stats():
+    return jsonify(analysis_pool.stats())
+
+@resume_bp.route('/jobs/<job_id>', methods=['GET'])
+def get_job(job_id):
+    job = get_analysis_queue().get(job_id)
+    if job is None:
+        return jsonify({'error': 'Job not found'}), 404
+    return jsonify(job)
+
+@resume_bp.route('/jobs/<job_id>/events', methods=['GET'])
+def job_events(job_id):
+    """Server-sent events with the job's status until it finishes."""
+    analysis_queue = get_analysis_queue()
+    if analysis_queue.get(job_id) is None:
+        return jsonify({'error': 'Job not found'}), 404
+
+    def events():
+        status = None
+        while True:
+            job = analysis_queue.wait_for_change(job_id, status, timeout=15)
+            if job is None:
+                return
+            if job['status'] == status:
+                yield ': keep-alive\n\n'
+                continue
+            status = job['status']
+            yield f"event: status\ndata: {json.dumps(job)}\n\n"
+            if status in FINISHED:
+                return
+
+    return Response(
+        stream_with_context(events()),
+        mimetype='text/event-stream',
+        headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'}
+    )
+
+@resume_bp.route('/jobs/stats', methods=['GET'])
+def analysis_queue_stats():
+    return jsonify(get_analysis_queue().stats())
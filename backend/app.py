@@ -1,15 +1,24 @@
 from flask import Flask, request, jsonify
 from flask_cors import CORS
-from services.ats_analyzer import ATSAnalyzer
-from services.resume_tailor import ResumeTailor
-import os
+from services.worker_pool import (
+    PoolBusyError, PoolTimeoutError, get_analysis_pool, analyze_resume_task, tailor_analysis_task
+)
 
 app = Flask(__name__)
 CORS(app)
 
-# Initialize services
-ats_analyzer = ATSAnalyzer()
-resume_tailor = ResumeTailor()
+# Parsing and analysis run in worker processes so one large upload can't stall other requests
+analysis_pool = get_analysis_pool()
+
+@app.errorhandler(PoolBusyError)
+def pool_busy(e):
+    response = jsonify({'error': 'Server is busy, please retry shortly'})
+    response.headers['Retry-After'] = '5'
+    return response, 503
+
+@app.errorhandler(PoolTimeoutError)
+def pool_timeout(e):
+    return jsonify({'error': 'Resume processing timed out'}), 504
 
 @app.route('/api/resume/analyze', methods=['POST'])
 def analyze_resume():
@@ -20,21 +29,20 @@ def analyze_resume():
     if file.filename == '':
         return jsonify({'error': 'No file selected'}), 400
 
+    file_type = file.filename.split('.')[-1].lower()
+    if file_type not in ['pdf', 'doc', 'docx']:
+        return jsonify({'error': 'Unsupported file type'}), 400
+
     try:
-        # Save the file temporarily
-        temp_path = os.path.join('/tmp', file.filename)
-        file.save(temp_path)
-        
         # Analyze the resume
-        score, recommendations = ats_analyzer.analyze(temp_path)
-        
-        # Clean up
-        os.remove(temp_path)
+        result = analysis_pool.run(analyze_resume_task, file.read(), file_type)
         
         return jsonify({
-            'score': score,
-            'recommendations': recommendations
+            'score': result['score'],
+            'recommendations': result['recommendations']
         })
+    except (PoolBusyError, PoolTimeoutError):
+        raise
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
@@ -45,13 +53,20 @@ def tailor_resume():
         return jsonify({'error': 'Missing required fields'}), 400
 
     try:
-        tailored_resume = resume_tailor.tailor_resume(
+        tailored_resume = analysis_pool.run(
+            tailor_analysis_task,
             data['resume'],
             data['job_description']
         )
         return jsonify({'tailored_resume': tailored_resume})
+    except (PoolBusyError, PoolTimeoutError):
+        raise
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
+@app.route('/api/resume/pool/stats', methods=['GET'])
+def analysis_pool_stats():
+    return jsonify(analysis_pool.stats())
+
 if __name__ == '__main__':
     app.run(debug=True) 
\ No newline at end of file
@@ -1,22 +1,95 @@
-from fastapi import APIRouter, HTTPException
-from app.schemas.job import JobSearchParams, JobResponse
+import json
+from typing import Optional
+from fastapi import APIRouter, HTTPException, Response
+from fastapi.responses import StreamingResponse
+from app.job_boards.answer_bank import CONFIRMED
+from app.schemas.job import JobSearchParams, JobResponse, ScreeningAnswer
 from app.schemas.settings import Settings, SettingsUpdate
+from app.services.browser_pool import BoardTimeoutError
 from app.services.job_service import JobService
+from app.services.scrape_tasks import ScrapeTaskManager
 from app.services.settings_service import SettingsService
 
 router = APIRouter()
 job_service = JobService()
+scrape_tasks = ScrapeTaskManager(job_service)
 settings_service = SettingsService()
 
 @router.post("/jobs/search")
-async def search_jobs(params: JobSearchParams) -> list[JobResponse]:
-    """Search for jobs based on the provided parameters"""
+async def search_jobs(params: JobSearchParams, response: Response, refresh: bool = False) -> list[JobResponse]:
+    """Search for jobs based on the provided parameters
+    
+    Results are cached; X-Cache reports HIT, STALE or MISS and Age their age in seconds.
+    Pass ?refresh=true to bypass the cache.
+    """
     try:
-        jobs = await job_service.search_jobs(params)
+        jobs, cache_status, age = await job_service.cached_search_jobs(params, refresh=refresh)
+        response.headers["X-Cache"] = cache_status
+        response.headers["Age"] = str(int(age))
         return jobs
+    except BoardTimeoutError as e:
+        raise HTTPException(status_code=504, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
+@router.post("/jobs/search/tasks", status_code=202)
+async def start_search_task(params: JobSearchParams):
+    """Start a search in the background and return its task id"""
+    task = scrape_tasks.start(params)
+    return {
+        **task.summary(),
+        "status_url": f"/api/jobs/search/tasks/{task.id}",
+        "stream_url": f"/api/jobs/search/tasks/{task.id}/stream",
+    }
+
+@router.get("/jobs/search/tasks/{task_id}")
+async def get_search_task(task_id: str):
+    """Status of a background search and the jobs found so far"""
+    task = scrape_tasks.get(task_id)
+    if not task:
+        raise HTTPException(status_code=404, detail="Search task not found")
+    return {**task.summary(), "jobs": task.jobs}
+
+@router.get("/jobs/search/tasks/{task_id}/stream")
+async def stream_search_task(task_id: str, format: str = "sse", start: int = 0):
+    """Stream a background search's jobs as they are found, as Server-Sent Events or NDJSON"""
+    task = scrape_tasks.get(task_id)
+    if not task:
+        raise HTTPException(status_code=404, detail="Search task not found")
+    if format not in ("sse", "ndjson"):
+        raise HTTPException(status_code=400, detail="format must be 'sse' or 'ndjson'")
+
+    def encode(event: str, data: dict) -> str:
+        if format == "ndjson":
+            return json.dumps({"type": event, **data}) + "\n"
+        return f"event: {event}\ndata: {json.dumps(data)}\n\n"
+
+    async def events():
+        async for job in task.follow(start):
+            yield encode("job", {"job": job.model_dump()})
+        yield encode("status", task.summary())
+
+    media_type = "application/x-ndjson" if format == "ndjson" else "text/event-stream"
+    return StreamingResponse(events(), media_type=media_type, headers={"Cache-Control": "no-cache"})
+
+@router.delete("/jobs/search/tasks/{task_id}")
+async def cancel_search_task(task_id: str):
+    """Cancel a running background search"""
+    if not scrape_tasks.cancel(task_id):
+        raise HTTPException(status_code=404, detail="No running search task with that id")
+    return {"message": "Search cancelled"}
+
+@router.get("/jobs/search/cache")
+async def search_cache_stats():
+    """Search result cache hit, stale and miss counts"""
+    return job_service.search_cache.stats()
+
+@router.delete("/jobs/search/cache")
+async def clear_search_cache():
+    """Drop every cached search result"""
+    job_service.search_cache.invalidate()
+    return {"message": "Search cache cleared"}
+
 @router.post("/jobs/apply/{job_id}")
 async def apply_to_job(job_id: str):
     """Apply to a specific job"""
@@ -25,9 +98,35 @@ async def apply_to_job(job_id: str):
         if not success:
             raise HTTPException(status_code=400, detail="Failed to apply to job")
         return {"message": "Successfully applied to job"}
+    except HTTPException:
+        raise
+    except BoardTimeoutError as e:
+        raise HTTPException(status_code=504, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
+@router.get("/jobs/questions/pending")
+async def pending_questions(limit: Optional[int] = None):
+    """Screening questions with no stored answer, most often seen first"""
+    return job_service.answer_bank.pending(limit=limit)
+
+@router.get("/jobs/questions/answers")
+async def stored_answers():
+    """Every stored screening-question answer"""
+    return job_service.answer_bank.answers()
+
+@router.put("/jobs/questions/answers")
+async def answer_question(answer: ScreeningAnswer):
+    """Store a confirmed answer, used for this and similar questions from now on"""
+    if not job_service.answer_bank.learn(answer.question, answer.answer, source=CONFIRMED):
+        raise HTTPException(status_code=400, detail="Question and answer must not be empty")
+    return {"message": "Answer stored"}
+
+@router.get("/jobs/browsers")
+async def browser_stats():
+    """Browser session usage per job board"""
+    return job_service.browsers.stats()
+
 @router.get("/settings")
 async def get_settings() -> Settings:
     """Get current application settings"""
@@ -1,6 +1,13 @@
 from pydantic_settings import BaseSettings
 from typing import Optional
 from pathlib import Path
+import sys
+
+REPO_ROOT = Path(__file__).resolve().parents[3]
+# The repo-root job_boards package (answer bank, form discovery) is shared with the Selenium scripts.
+# Appended, not prepended, so the repo root's app.py never shadows this app package
+if str(REPO_ROOT) not in sys.path:
+    sys.path.append(str(REPO_ROOT))
 
 class Settings(BaseSettings):
     # API settings
@@ -23,6 +30,19 @@ class Settings(BaseSettings):
     
     # Browser settings
     HEADLESS: bool = False
+    BROWSER_SESSIONS: int = 2  # Browsers per job board
+    BOARD_TIMEOUT_SECONDS: float = 180.0
+    SESSION_DIR: Path = Path("data/sessions")  # Saved board cookies
+    
+    # Search result cache
+    SEARCH_CACHE_TTL_SECONDS: float = 3600
+    SEARCH_CACHE_STALE_SECONDS: float = 3600  # Served while a background refresh runs
+    SEARCH_CACHE_MAX_ENTRIES: int = 256
+    
+    # Screening-question answers, shared with the job_boards package
+    ANSWER_BANK_PATH: Path = REPO_ROOT / "data" / "answer_bank.db"
+    ANSWER_MATCH_THRESHOLD: float = 0.75
+    ANSWER_FALLBACK: bool = True  # Give required questions with no stored answer a default one
     USER_AGENT: str = "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
     
     class Config:
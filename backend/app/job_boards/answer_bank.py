@@ -0,0 +1,15 @@
+import threading
+from typing import Optional
+from app.core.config import settings
+from job_boards.answer_bank import AnswerBank, CONFIRMED, resolve_path
+
+_bank: Optional[AnswerBank] = None
+_bank_lock = threading.Lock()
+
+def get_answer_bank() -> AnswerBank:
+    """The process-wide answer bank, shared by every board session"""
+    global _bank
+    with _bank_lock:
+        if _bank is None:
+            _bank = AnswerBank(resolve_path(settings.ANSWER_BANK_PATH), threshold=settings.ANSWER_MATCH_THRESHOLD)
+        return _bank
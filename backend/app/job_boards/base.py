@@ -4,14 +4,40 @@ from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.chrome.options import Options
 from webdriver_manager.chrome import ChromeDriverManager
 import logging
-from typing import Optional, List, Dict, Any
+import random
+import threading
+from typing import Callable, Optional, List, Dict, Any
+from app.core.config import settings
+from .answer_bank import AnswerBank, get_answer_bank
+from job_boards.forms import group_questions, apply_answer
+from job_boards.sessions import SessionLoginMixin, SessionStore
 
 logger = logging.getLogger(__name__)
 
-class JobBoard(ABC):
-    def __init__(self, driver: Optional[webdriver.Chrome] = None):
+DEFAULT_ANSWER_TEXT = "I am interested in this position and would be a great fit for the role."
+
+class BoardCancelled(Exception):
+    """Raised inside a board operation once it has been cancelled"""
+
+class JobBoard(SessionLoginMixin, ABC):
+    """A job board driven by one Selenium browser.
+
+    Board methods are blocking and must run on the browser session's own
+    thread (see BrowserPool), never on the event loop.
+    """
+
+    BOARD_NAME: str = ""
+    LOGIN_URL_MARKERS = ("login", "signin", "auth", "checkpoint")
+
+    def __init__(self, driver: Optional[webdriver.Chrome] = None, session_store: Optional[SessionStore] = None,
+                 answer_bank: Optional[AnswerBank] = None):
+        self.cancel_event = threading.Event()
+        self.session_store = session_store or SessionStore(settings.SESSION_DIR)
+        self.answer_bank = answer_bank or get_answer_bank()
+        self.logged_in = False
         self.driver = driver or self._setup_driver()
         
+
     def _setup_driver(self) -> webdriver.Chrome:
         """Set up the Chrome WebDriver with appropriate options"""
         chrome_options = Options()
@@ -32,22 +58,78 @@ class JobBoard(ABC):
         
         return driver
     
+    @property
+    def board_name(self) -> str:
+        """Name used for the board's saved session and in logs"""
+        return self.BOARD_NAME
+
+    def check_cancelled(self):
+        """Abort the current operation if it has been cancelled"""
+        if self.cancel_event.is_set():
+            raise BoardCancelled("Board operation cancelled")
+    
+    def pause(self, min_seconds: float, max_seconds: float):
+        """Sleep for a random interval, waking early if the operation is cancelled"""
+        if self.cancel_event.wait(random.uniform(min_seconds, max_seconds)):
+            raise BoardCancelled("Board operation cancelled")
+    
+    def answer_questions(self, fields: List[Dict[str, Any]]) -> List[str]:
+        """Answer a form's screening questions from the answer bank
+        
+        Known questions are answered from the bank, and questions the board
+        prefilled teach it their answer. The rest are recorded as pending;
+        required ones still get the first option, a ticked box or a default
+        text when ANSWER_FALLBACK is on. Returns the unanswered question texts.
+        """
+        unanswered = []
+        for question in group_questions(fields):
+            self.check_cancelled()
+            text = question["text"]
+            try:
+                answer = self.answer_bank.lookup(text)
+                if answer is not None and apply_answer(question, answer):
+                    continue
+                if question["value"]:
+                    self.answer_bank.learn(text, question["value"])
+                    continue
+                
+                unanswered.append(text)
+                self.answer_bank.record_pending(text, question["type"], question["options"], self.BOARD_NAME)
+                if not question["required"] or not settings.ANSWER_FALLBACK:
+                    continue
+                if question["options"]:
+                    apply_answer(question, question["options"][0])
+                elif question["type"] == "checkbox":
+                    apply_answer(question, "Yes")
+                elif question["type"] == "textarea":
+                    apply_answer(question, DEFAULT_ANSWER_TEXT)
+            except Exception as e:
+                logger.warning(f"Error answering question {text!r}: {str(e)}")
+        
+        if unanswered:
+            logger.info(f"No stored answer for {len(unanswered)} questions: {unanswered}")
+        return unanswered
+    
     @abstractmethod
-    async def login(self, email: str, password: str) -> bool:
+    def login(self, email: str, password: str) -> bool:
         """Login to the job board"""
         pass
     
     @abstractmethod
-    async def search_jobs(self, keywords: str, location: str) -> List[Dict[str, Any]]:
-        """Search for jobs with the given criteria"""
+    def search_jobs(self, keywords: str, location: str,
+                    on_job: Optional[Callable[[Dict[str, Any]], None]] = None) -> List[Dict[str, Any]]:
+        """Search for jobs with the given criteria, calling on_job for each job as it is parsed"""
         pass
     
     @abstractmethod
-    async def apply_to_job(self, job_id: str, resume_path: str, cover_letter_path: Optional[str] = None) -> bool:
+    def apply_to_job(self, job_id: str, resume_path: str, cover_letter_path: Optional[str] = None) -> bool:
         """Apply to a specific job"""
         pass
     
     def close(self):
         """Close the browser"""
         if self.driver:
-            self.driver.quit() 
\ No newline at end of file
+            if self.logged_in:
+                self.save_session()
+            self.driver.quit()
+            self.logged_in = False 
\ No newline at end of file
@@ -2,21 +2,23 @@ from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException
-import time
-import random
 import logging
-from typing import List, Dict, Any, Optional
-from .base import JobBoard
+from typing import Callable, List, Dict, Any, Optional
+from .base import BoardCancelled, JobBoard
+from job_boards.forms import discover_form
 
 logger = logging.getLogger(__name__)
 
 class LinkedInJobBoard(JobBoard):
     BASE_URL = "https://www.linkedin.com"
+    BOARD_NAME = "linkedin"
+    LOGIN_URL = f"{BASE_URL}/login"
+    AUTH_COOKIES = ("li_at",)
     
-    async def login(self, email: str, password: str) -> bool:
+    def login(self, email: str, password: str) -> bool:
         """Login to LinkedIn"""
         try:
-            self.driver.get(f"{self.BASE_URL}/login")
+            self.driver.get(self.LOGIN_URL)
             
             # Wait for and fill in email
             email_field = WebDriverWait(self.driver, 10).until(
@@ -44,12 +46,13 @@ class LinkedInJobBoard(JobBoard):
             logger.error(f"Failed to login to LinkedIn: {str(e)}")
             return False
     
-    async def search_jobs(self, keywords: str, location: str) -> List[Dict[str, Any]]:
-        """Search for jobs on LinkedIn"""
+    def search_jobs(self, keywords: str, location: str,
+                    on_job: Optional[Callable[[Dict[str, Any]], None]] = None) -> List[Dict[str, Any]]:
+        """Search for jobs on LinkedIn, passing each job to on_job as soon as its card is parsed"""
         try:
             # Navigate to jobs page
             self.driver.get(f"{self.BASE_URL}/jobs")
-            time.sleep(random.uniform(2, 3))
+            self.pause(2, 3)
             
             # Fill in search fields
             keyword_field = WebDriverWait(self.driver, 10).until(
@@ -67,13 +70,14 @@ class LinkedInJobBoard(JobBoard):
             search_button.click()
             
             # Wait for results
-            time.sleep(random.uniform(3, 4))
+            self.pause(3, 4)
             
             # Extract job listings
             jobs = []
             job_cards = self.driver.find_elements(By.CSS_SELECTOR, ".job-card-container")
             
             for card in job_cards[:10]:  # Limit to first 10 results
+                self.check_cancelled()
                 try:
                     job = {
                         "id": card.get_attribute("data-job-id"),
@@ -81,25 +85,30 @@ class LinkedInJobBoard(JobBoard):
                         "company": card.find_element(By.CSS_SELECTOR, ".job-card-container__company-name").text,
                         "location": card.find_element(By.CSS_SELECTOR, ".job-card-container__metadata-item").text,
                         "url": card.find_element(By.CSS_SELECTOR, "a").get_attribute("href"),
+                        "description": "",  # Search cards don't include the description
                         "job_board": "linkedin"
                     }
                     jobs.append(job)
+                    if on_job:
+                        on_job(job)
                 except Exception as e:
                     logger.warning(f"Failed to extract job details: {str(e)}")
                     continue
             
             return jobs
             
+        except BoardCancelled:
+            raise
         except Exception as e:
             logger.error(f"Error searching jobs on LinkedIn: {str(e)}")
             return []
     
-    async def apply_to_job(self, job_id: str, resume_path: str, cover_letter_path: Optional[str] = None) -> bool:
+    def apply_to_job(self, job_id: str, resume_path: str, cover_letter_path: Optional[str] = None) -> bool:
         """Apply to a job on LinkedIn"""
         try:
             # Navigate to job page
             self.driver.get(f"{self.BASE_URL}/jobs/view/{job_id}")
-            time.sleep(random.uniform(2, 3))
+            self.pause(2, 3)
             
             # Click Easy Apply button
             easy_apply_button = WebDriverWait(self.driver, 10).until(
@@ -108,13 +117,15 @@ class LinkedInJobBoard(JobBoard):
             easy_apply_button.click()
             
             # Handle the application form
-            return await self._handle_application_form(resume_path, cover_letter_path)
+            return self._handle_application_form(resume_path, cover_letter_path)
             
+        except BoardCancelled:
+            raise
         except Exception as e:
             logger.error(f"Error applying to job on LinkedIn: {str(e)}")
             return False
     
-    async def _handle_application_form(self, resume_path: str, cover_letter_path: Optional[str] = None) -> bool:
+    def _handle_application_form(self, resume_path: str, cover_letter_path: Optional[str] = None) -> bool:
         """Handle the LinkedIn Easy Apply form"""
         try:
             # Wait for the form to load
@@ -144,7 +155,7 @@ class LinkedInJobBoard(JobBoard):
             submit_button.click()
             
             # Wait for confirmation
-            time.sleep(random.uniform(2, 3))
+            self.pause(2, 3)
             
             # Check for success message
             try:
@@ -157,43 +168,19 @@ class LinkedInJobBoard(JobBoard):
                 logger.warning("No explicit success message found")
                 return True  # Still return True as the application might have been submitted
             
+        except BoardCancelled:
+            raise
         except Exception as e:
             logger.error(f"Error handling application form: {str(e)}")
             return False
     
     def _handle_additional_questions(self):
-        """Handle additional questions in the application form"""
+        """Answer the screening questions in the application form from the answer bank"""
         try:
-            # Look for common question types
-            question_selectors = [
-                "input[type='radio']",  # Radio buttons
-                "input[type='checkbox']",  # Checkboxes
-                "select",  # Dropdowns
-                "textarea"  # Text areas
-            ]
-            
-            for selector in question_selectors:
-                elements = self.driver.find_elements(By.CSS_SELECTOR, selector)
-                for element in elements:
-                    try:
-                        if element.tag_name == "select":
-                            # For dropdowns, select the first option
-                            element.click()
-                            time.sleep(0.5)
-                            first_option = element.find_element(By.CSS_SELECTOR, "option:not([value=''])")
-                            first_option.click()
-                        elif element.get_attribute("type") in ["radio", "checkbox"]:
-                            # For radio buttons and checkboxes, click if not selected
-                            if not element.is_selected():
-                                element.click()
-                        elif element.tag_name == "textarea":
-                            # For text areas, enter a generic response
-                            element.send_keys("I am interested in this position and would be a great fit for the role.")
-                        
-                        time.sleep(random.uniform(0.5, 1))
-                    except Exception as e:
-                        logger.warning(f"Error handling question element: {str(e)}")
-                        continue
-                        
+            form = discover_form(self.driver, ".jobs-easy-apply-content")
+            self.answer_questions(form["fields"])
+            self.pause(0.5, 1)
+        except BoardCancelled:
+            raise
         except Exception as e:
             logger.error(f"Error handling additional questions: {str(e)}") 
\ No newline at end of file
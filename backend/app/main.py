@@ -1,6 +1,6 @@
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from app.api.routes import router as api_router
+from app.api.routes import router as api_router, job_service
 
 app = FastAPI(
     title="AutoJobApply API",
@@ -20,6 +20,10 @@ app.add_middleware(
 # Include API routes
 app.include_router(api_router, prefix="/api")
 
+@app.on_event("shutdown")
+def shutdown():
+    job_service.cleanup()
+
 @app.get("/")
 async def root():
     return {"message": "Welcome to AutoJobApply API"} 
\ No newline at end of file
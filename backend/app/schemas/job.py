@@ -16,4 +16,8 @@ class JobResponse(BaseModel):
     job_board: str
     posted_date: Optional[str] = None
     salary: Optional[str] = None
-    requirements: Optional[list[str]] = None 
\ No newline at end of file
+    requirements: Optional[list[str]] = None 
+
+class ScreeningAnswer(BaseModel):
+    question: str
+    answer: str
\ No newline at end of file
@@ -0,0 +1,130 @@
+import asyncio
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Type
+from app.job_boards.base import JobBoard
+
+logger = logging.getLogger(__name__)
+
+class BoardTimeoutError(Exception):
+    """Raised when a board operation exceeds its timeout"""
+
+class BrowserSession:
+    """One browser and the single thread allowed to drive it.
+
+    Selenium drivers are not thread-safe, so the board is created on the
+    session's thread and every operation on it is queued to that thread.
+    """
+
+    def __init__(self, board_name: str, board_class: Type[JobBoard]):
+        self.board_name = board_name
+        self.board_class = board_class
+        self.board: Optional[JobBoard] = None
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix=f"browser-{board_name}")
+
+    def _call(self, fn: Callable[[JobBoard], Any]) -> Any:
+        if self.board is None:
+            self.board = self.board_class()
+        self.board.cancel_event.clear()
+        return fn(self.board)
+
+    async def run(self, fn: Callable[[JobBoard], Any]) -> Any:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, self._call, fn)
+
+    def cancel(self):
+        """Ask the running operation to stop at its next pause"""
+        if self.board:
+            self.board.cancel_event.set()
+
+    def close(self):
+        """Quit the browser; a command blocked on it fails and frees the thread"""
+        if self.board:
+            try:
+                self.board.close()
+            except Exception as e:
+                logger.warning(f"Error closing {self.board_name} browser: {str(e)}")
+            self.board = None
+        self._executor.shutdown(wait=False)
+
+class BrowserPool:
+    """Dispatches blocking board operations to per-browser threads.
+
+    Each board gets up to max_sessions browsers, created on demand and reused
+    between requests, so concurrent API calls run in parallel up to that limit
+    instead of blocking the event loop. An operation that times out or whose
+    request is cancelled has its browser cancelled and discarded.
+    """
+
+    def __init__(self, board_classes: Dict[str, Type[JobBoard]], max_sessions: int = 2, timeout: float = 180.0):
+        self.board_classes = board_classes
+        self.max_sessions = max_sessions
+        self.timeout = timeout
+        self._idle: Dict[str, List[BrowserSession]] = {}
+        self._slots: Dict[str, asyncio.Semaphore] = {}
+        self._busy: List[BrowserSession] = []
+        self._stats = {"completed": 0, "failed": 0, "timed_out": 0, "cancelled": 0}
+
+    def _semaphore(self, board_name: str) -> asyncio.Semaphore:
+        if board_name not in self._slots:
+            self._slots[board_name] = asyncio.Semaphore(self.max_sessions)
+        return self._slots[board_name]
+
+    async def run(self, board_name: str, fn: Callable[[JobBoard], Any], timeout: Optional[float] = None) -> Any:
+        """Run fn(board) on an idle browser for board_name and return its result"""
+        board_class = self.board_classes.get(board_name)
+        if not board_class:
+            raise ValueError(f"Unsupported job board: {board_name}")
+
+        slots = self._semaphore(board_name)
+        await slots.acquire()
+        idle = self._idle.setdefault(board_name, [])
+        session = idle.pop() if idle else BrowserSession(board_name, board_class)
+        self._busy.append(session)
+
+        try:
+            result = await asyncio.wait_for(session.run(fn), timeout or self.timeout)
+        except asyncio.TimeoutError:
+            self._stats["timed_out"] += 1
+            self._discard(session)
+            raise BoardTimeoutError(f"{board_name} operation timed out")
+        except asyncio.CancelledError:
+            self._stats["cancelled"] += 1
+            self._discard(session)
+            raise
+        except Exception:
+            self._stats["failed"] += 1
+            self._return(session)
+            raise
+        finally:
+            self._busy.remove(session)
+            slots.release()
+
+        self._stats["completed"] += 1
+        self._return(session)
+        return result
+
+    def _return(self, session: BrowserSession):
+        self._idle.setdefault(session.board_name, []).append(session)
+
+    def _discard(self, session: BrowserSession):
+        session.cancel()
+        # Quitting the driver can block, so do it off the event loop
+        threading.Thread(target=session.close, name=f"close-{session.board_name}", daemon=True).start()
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            **self._stats,
+            "busy": len(self._busy),
+            "idle": {board_name: len(sessions) for board_name, sessions in self._idle.items()},
+            "max_sessions": self.max_sessions,
+        }
+
+    def close(self):
+        """Quit every browser, cancelling operations still in progress"""
+        for session in self._busy:
+            session.cancel()
+        for session in list(self._busy) + [s for sessions in self._idle.values() for s in sessions]:
+            session.close()
+        self._idle.clear()
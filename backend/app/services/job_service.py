@@ -1,34 +1,56 @@
 from app.schemas.job import JobSearchParams, JobResponse
 from app.core.config import settings
+from app.job_boards.answer_bank import get_answer_bank
+from app.job_boards.base import JobBoard
 from app.job_boards.linkedin import LinkedInJobBoard
+from app.services.browser_pool import BrowserPool
+from job_boards.search_cache import SearchCache, search_key, MISS, STALE
+import asyncio
 import logging
-from typing import Dict, Type
-from .base import JobBoard
+from typing import Any, Callable, Dict, Hashable, List, Optional, Tuple, Type
 
 logger = logging.getLogger(__name__)
 
+def _search_key(params: JobSearchParams) -> Hashable:
+    """Cache key over every search parameter, normalized like the scripts' searches"""
+    filters = params.model_dump(exclude={"job_board", "keywords", "location"})
+    return search_key(params.job_board, params.keywords, params.location, filters)
+
 class JobService:
     def __init__(self):
         self.job_boards: Dict[str, Type[JobBoard]] = {
             "linkedin": LinkedInJobBoard,
             # Add other job boards here as they are implemented
         }
-        self.active_boards: Dict[str, JobBoard] = {}
+        # Selenium calls block, so they run on per-browser threads, never on the event loop
+        self.browsers = BrowserPool(
+            self.job_boards,
+            max_sessions=settings.BROWSER_SESSIONS,
+            timeout=settings.BOARD_TIMEOUT_SECONDS
+        )
+        self.search_cache = SearchCache(
+            ttl=settings.SEARCH_CACHE_TTL_SECONDS,
+            stale_ttl=settings.SEARCH_CACHE_STALE_SECONDS,
+            max_entries=settings.SEARCH_CACHE_MAX_ENTRIES
+        )
+        # The same bank every board session answers screening questions from
+        self.answer_bank = get_answer_bank()
+        self._searches_in_flight: Dict[Hashable, asyncio.Task] = {}
     
-    def _get_job_board(self, board_name: str) -> JobBoard:
-        """Get or create a job board instance"""
-        if board_name not in self.active_boards:
-            board_class = self.job_boards.get(board_name)
-            if not board_class:
-                raise ValueError(f"Unsupported job board: {board_name}")
-            self.active_boards[board_name] = board_class()
-        return self.active_boards[board_name]
+    @staticmethod
+    def _login_and_search(board: JobBoard, email: str, password: str, keywords: str, location: str,
+                          on_job: Optional[Callable[[Dict[str, Any]], None]] = None) -> List[Dict[str, Any]]:
+        if not board.ensure_logged_in(email, password):
+            raise Exception(f"Failed to login to {board.__class__.__name__}")
+        return board.search_jobs(keywords, location, on_job=on_job)
     
-    async def search_jobs(self, params: JobSearchParams) -> list[JobResponse]:
-        """Search for jobs using the specified parameters"""
+    async def search_jobs(self, params: JobSearchParams,
+                          on_job: Optional[Callable[[JobResponse], None]] = None) -> list[JobResponse]:
+        """Search for jobs using the specified parameters
+        
+        on_job is called from the browser thread with each job as it is parsed.
+        """
         try:
-            board = self._get_job_board(params.job_board)
-            
             # Get credentials from settings
             email = settings.LINKEDIN_EMAIL
             password = settings.LINKEDIN_PASSWORD
@@ -36,12 +58,14 @@ class JobService:
             if not email or not password:
                 raise ValueError("Job board credentials not configured")
             
-            # Login to the job board
-            if not await board.login(email, password):
-                raise Exception(f"Failed to login to {params.job_board}")
-            
-            # Search for jobs
-            jobs = await board.search_jobs(params.keywords, params.location)
+            # Login and search on one browser session
+            jobs = await self.browsers.run(
+                params.job_board,
+                lambda board: self._login_and_search(
+                    board, email, password, params.keywords, params.location,
+                    on_job=(lambda job: on_job(JobResponse(**job))) if on_job else None
+                )
+            )
             
             # Convert to JobResponse objects
             return [JobResponse(**job) for job in jobs]
@@ -50,12 +74,45 @@ class JobService:
             logger.error(f"Error searching jobs: {str(e)}")
             raise
     
+    def _search_and_store(self, params: JobSearchParams, key: Hashable) -> asyncio.Task:
+        """Run one live search per key, shared by every caller waiting on it"""
+        task = self._searches_in_flight.get(key)
+        if task is None:
+            async def search():
+                try:
+                    jobs = await self.search_jobs(params)
+                    # An empty list usually means the scrape failed, so it isn't cached
+                    if jobs:
+                        self.search_cache.put(key, [job.model_dump() for job in jobs])
+                    return jobs
+                finally:
+                    self._searches_in_flight.pop(key, None)
+                    self.search_cache.end_refresh(key)
+
+            task = asyncio.create_task(search())
+            self._searches_in_flight[key] = task
+        return task
+    
+    async def cached_search_jobs(self, params: JobSearchParams, refresh: bool = False) -> Tuple[list[JobResponse], str, float]:
+        """Search through the result cache
+        
+        Returns:
+            The jobs, the cache status (HIT, STALE or MISS) and the results' age in seconds.
+            A STALE result is returned at once and refreshed in the background.
+        """
+        key = _search_key(params)
+        jobs, status, age = (None, MISS, None) if refresh else self.search_cache.get(key)
+        if status == MISS:
+            # Shielded so a disconnecting client doesn't cancel a search others are waiting on
+            jobs = await asyncio.shield(self._search_and_store(params, key))
+            return jobs, MISS, 0.0
+        if status == STALE and self.search_cache.begin_refresh(key):
+            self._search_and_store(params, key)
+        return [JobResponse(**job) for job in jobs], status, age
+    
     async def apply_to_job(self, job_id: str) -> bool:
         """Apply to a specific job"""
         try:
-            # For now, we only support LinkedIn
-            board = self._get_job_board("linkedin")
-            
             # Get resume and cover letter paths from settings
             resume_path = settings.RESUME_PATH
             cover_letter_path = settings.COVER_LETTER_PATH
@@ -63,8 +120,11 @@ class JobService:
             if not resume_path:
                 raise ValueError("Resume path not configured")
             
-            # Apply to the job
-            return await board.apply_to_job(job_id, resume_path, cover_letter_path)
+            # Apply to the job (for now, we only support LinkedIn)
+            return await self.browsers.run(
+                "linkedin",
+                lambda board: board.apply_to_job(job_id, resume_path, cover_letter_path)
+            )
             
         except Exception as e:
             logger.error(f"Error applying to job: {str(e)}")
@@ -72,6 +132,4 @@ class JobService:
     
     def cleanup(self):
         """Clean up job board instances"""
-        for board in self.active_boards.values():
-            board.close()
-        self.active_boards.clear() 
\ No newline at end of file
+        self.browsers.close() 
\ No newline at end of file
@@ -0,0 +1,121 @@
+import asyncio
+import logging
+import time
+import uuid
+from typing import AsyncIterator, Dict, List, Optional
+from app.schemas.job import JobResponse, JobSearchParams
+from app.services.job_service import JobService
+
+logger = logging.getLogger(__name__)
+
+RUNNING, DONE, FAILED, CANCELLED = "running", "done", "failed", "cancelled"
+
+class ScrapeTask:
+    """A background search whose jobs are stored as soon as each card is parsed"""
+
+    def __init__(self, params: JobSearchParams):
+        self.id = uuid.uuid4().hex
+        self.params = params
+        self.status = RUNNING
+        self.jobs: List[JobResponse] = []
+        self.error: Optional[str] = None
+        self.created_at = time.time()
+        self.first_result_at: Optional[float] = None
+        self.finished_at: Optional[float] = None
+        self._changed = asyncio.Condition()
+        self._runner: Optional[asyncio.Task] = None
+
+    @property
+    def finished(self) -> bool:
+        return self.status != RUNNING
+
+    async def _notify(self):
+        async with self._changed:
+            self._changed.notify_all()
+
+    def add_job(self, job: JobResponse):
+        """Store one job; must be called on the event loop"""
+        if self.first_result_at is None:
+            self.first_result_at = time.time()
+        self.jobs.append(job)
+        asyncio.ensure_future(self._notify())
+
+    async def finish(self, status: str, error: Optional[str] = None):
+        self.status = status
+        self.error = error
+        self.finished_at = time.time()
+        await self._notify()
+
+    async def follow(self, start: int = 0) -> AsyncIterator[JobResponse]:
+        """Yield stored jobs from index start, then new ones as they arrive, until the task finishes"""
+        index = start
+        while True:
+            async with self._changed:
+                await self._changed.wait_for(lambda: len(self.jobs) > index or self.finished)
+            while index < len(self.jobs):
+                yield self.jobs[index]
+                index += 1
+            if self.finished and index >= len(self.jobs):
+                return
+
+    def summary(self) -> Dict:
+        return {
+            "task_id": self.id,
+            "status": self.status,
+            "job_board": self.params.job_board,
+            "count": len(self.jobs),
+            "error": self.error,
+            "created_at": self.created_at,
+            "seconds_to_first_result": (
+                round(self.first_result_at - self.created_at, 2) if self.first_result_at else None
+            ),
+            "finished_at": self.finished_at,
+        }
+
+class ScrapeTaskManager:
+    """Runs searches in the background and keeps their results for ttl seconds after they finish"""
+
+    def __init__(self, job_service: JobService, ttl: float = 3600.0):
+        self.job_service = job_service
+        self.ttl = ttl
+        self.tasks: Dict[str, ScrapeTask] = {}
+
+    def _prune(self):
+        cutoff = time.time() - self.ttl
+        for task_id, task in list(self.tasks.items()):
+            if task.finished and task.finished_at < cutoff:
+                del self.tasks[task_id]
+
+    def start(self, params: JobSearchParams) -> ScrapeTask:
+        self._prune()
+        task = ScrapeTask(params)
+        self.tasks[task.id] = task
+        task._runner = asyncio.create_task(self._run(task))
+        return task
+
+    async def _run(self, task: ScrapeTask):
+        loop = asyncio.get_running_loop()
+        try:
+            # The board parses cards on its browser thread; hand each job back to the loop
+            await self.job_service.search_jobs(
+                task.params, on_job=lambda job: loop.call_soon_threadsafe(task.add_job, job)
+            )
+        except asyncio.CancelledError:
+            await task.finish(CANCELLED)
+            return
+        except Exception as e:
+            logger.error(f"Background search {task.id} failed: {str(e)}")
+            await task.finish(FAILED, str(e))
+            return
+        # Jobs were queued with call_soon_threadsafe before the search returned, so all are stored
+        await task.finish(DONE)
+
+    def get(self, task_id: str) -> Optional[ScrapeTask]:
+        return self.tasks.get(task_id)
+
+    def cancel(self, task_id: str) -> bool:
+        task = self.tasks.get(task_id)
+        if not task or task.finished or not task._runner:
+            return False
+        task._runner.cancel()
+        return True
@@ -1,11 +1,15 @@
 import re
-from typing import Dict, List, Tuple
-import PyPDF2
+from typing import Dict, Iterable, List, Optional, Tuple
 import docx
 import io
+from .extraction_cache import ExtractionCache, get_extraction_cache
+from .pdf_stream import PdfBudget, PdfPageStream
+from .keyword_matcher import KeywordMatcher, TermIndex, get_keyword_matcher
 
 class ATSAnalyzer:
-    def __init__(self):
+    def __init__(self, extraction_cache: Optional[ExtractionCache] = None, pdf_budget: Optional[PdfBudget] = None):
+        self.extraction_cache = extraction_cache or get_extraction_cache()
+        self.pdf_budget = pdf_budget or PdfBudget.from_env()
         self.common_keywords = {
             'technical': ['python', 'javascript', 'java', 'c++', 'sql', 'react', 'node.js', 'aws', 'docker', 'kubernetes'],
             'soft_skills': ['leadership', 'communication', 'teamwork', 'problem-solving', 'time management'],
@@ -13,37 +17,57 @@ class ATSAnalyzer:
             'experience': ['experience', 'years', 'worked', 'developed', 'implemented', 'managed']
         }
 
+    def _parse_docx(self, file_content: bytes) -> str:
+        doc = docx.Document(io.BytesIO(file_content))
+        return "".join(paragraph.text + "\n" for paragraph in doc.paragraphs).lower()
+
+    def open_pdf(self, file_content: bytes) -> PdfPageStream:
+        """Stream a PDF page by page within the configured budgets.
+
+        A cached text is yielded as a single chunk; a fully read document is
+        added to the cache, a truncated one is not.
+        """
+        key = self.extraction_cache.key_for(file_content, 'pdf')
+        return PdfPageStream(
+            file_content,
+            self.pdf_budget,
+            cached_text=self.extraction_cache.get(key),
+            on_complete=lambda text: self.extraction_cache.put(key, text)
+        )
+
     def extract_text_from_pdf(self, file_content: bytes) -> str:
         try:
-            pdf_file = io.BytesIO(file_content)
-            pdf_reader = PyPDF2.PdfReader(pdf_file)
-            text = ""
-            for page in pdf_reader.pages:
-                text += page.extract_text()
-            return text.lower()
+            return "".join(self.open_pdf(file_content))
         except Exception as e:
             print(f"Error extracting text from PDF: {e}")
             return ""
 
     def extract_text_from_docx(self, file_content: bytes) -> str:
         try:
-            docx_file = io.BytesIO(file_content)
-            doc = docx.Document(docx_file)
-            text = ""
-            for paragraph in doc.paragraphs:
-                text += paragraph.text + "\n"
-            return text.lower()
+            return self.extraction_cache.get_or_extract(file_content, 'docx', self._parse_docx)
         except Exception as e:
             print(f"Error extracting text from DOCX: {e}")
             return ""
 
+    def extract_text(self, file_content: bytes, file_type: str) -> str:
+        """Extract text from a pdf, doc or docx upload through the extraction cache."""
+        if file_type == 'pdf':
+            return self.extract_text_from_pdf(file_content)
+        return self.extract_text_from_docx(file_content)
+
+    @property
+    def keyword_matcher(self) -> KeywordMatcher:
+        return get_keyword_matcher(self.common_keywords)
+
     def analyze_keywords(self, text: str) -> Dict[str, List[str]]:
-        found_keywords = {}
-        for category, keywords in self.common_keywords.items():
-            found = [keyword for keyword in keywords if keyword in text]
-            if found:
-                found_keywords[category] = found
-        return found_keywords
+        return self.keyword_matcher.match_categories(text)
+
+    def keyword_positions(self, text: str) -> Dict[str, List[Tuple[int, int]]]:
+        return self.keyword_matcher.positions(text)
+
+    def keywords_from_index(self, index: TermIndex) -> Dict[str, List[str]]:
+        """Answer analyze_keywords from an index built by a matcher covering these keywords."""
+        return index.group(self.common_keywords)
 
     def check_formatting(self, text: str) -> List[str]:
         issues = []
@@ -75,10 +99,35 @@ class ATSAnalyzer:
         
         return max(min(score, 100), 0)  # Ensure score is between 0 and 100
 
+    def _read_until_settled(self, chunks: Iterable[str]) -> str:
+        """Consume text chunks until later ones can no longer change the analysis.
+
+        Reading stops once every keyword has been seen and no formatting issue
+        remains, since more text could only repeat what was already found.
+        """
+        wanted = {keyword.lower() for keywords in self.common_keywords.values() for keyword in keywords}
+        text_parts = []
+        seen = set()
+        open_issues = None
+        for chunk in chunks:
+            text_parts.append(chunk)
+            seen.update(self.keyword_matcher.positions(chunk))
+            chunk_issues = set(self.check_formatting(chunk))
+            open_issues = chunk_issues if open_issues is None else open_issues & chunk_issues
+            if not open_issues and seen >= wanted:
+                break
+        return "".join(text_parts)
+
     def analyze_resume(self, file_content: bytes, file_type: str) -> Dict:
         # Extract text based on file type
+        pdf_stream = None
         if file_type == 'pdf':
-            text = self.extract_text_from_pdf(file_content)
+            try:
+                pdf_stream = self.open_pdf(file_content)
+                text = self._read_until_settled(pdf_stream)
+            except Exception as e:
+                print(f"Error extracting text from PDF: {e}")
+                text = ""
         elif file_type in ['doc', 'docx']:
             text = self.extract_text_from_docx(file_content)
         else:
@@ -93,9 +142,18 @@ class ATSAnalyzer:
             "score": score,
             "found_keywords": found_keywords,
             "formatting_issues": formatting_issues,
-            "recommendations": self.generate_recommendations(found_keywords, formatting_issues)
+            "recommendations": self.generate_recommendations(found_keywords, formatting_issues),
+            **self._pdf_stream_report(pdf_stream)
         }
 
+    def _pdf_stream_report(self, pdf_stream: Optional[PdfPageStream]) -> Dict:
+        if pdf_stream is None or pdf_stream.cached_text is not None:
+            return {}
+        report = {"pages_read": pdf_stream.pages_read, "total_pages": pdf_stream.total_pages}
+        if pdf_stream.stopped_reason:
+            report["truncated"] = pdf_stream.stopped_reason
+        return report
+
     def generate_recommendations(self, found_keywords: Dict[str, List[str]], formatting_issues: List[str]) -> List[str]:
         recommendations = []
         
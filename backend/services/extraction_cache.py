@@ -0,0 +1,143 @@
+from typing import Callable, Dict, Optional
+import hashlib
+import os
+import tempfile
+import threading
+from collections import OrderedDict
+from pathlib import Path
+
+class ExtractionCache:
+    """Two-tier cache of extracted document text, keyed by the SHA-256 of the file bytes.
+
+    Recently used texts stay in an in-memory LRU; every text is also written to
+    a disk directory that is trimmed oldest-first once it grows past max_disk_bytes,
+    so repeated uploads survive restarts without being parsed again.
+    """
+
+    def __init__(self, memory_size: int = 64, disk_dir: Optional[str] = None, max_disk_bytes: int = 64 * 1024 * 1024):
+        self.memory_size = memory_size
+        self.disk_dir = Path(disk_dir) if disk_dir else None
+        self.max_disk_bytes = max_disk_bytes
+        self._memory: "OrderedDict[str, str]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._stats = {'memory_hits': 0, 'disk_hits': 0, 'misses': 0, 'evictions': 0}
+        if self.disk_dir:
+            self.disk_dir.mkdir(parents=True, exist_ok=True)
+
+    @staticmethod
+    def key_for(file_content: bytes, kind: str) -> str:
+        return f"{hashlib.sha256(file_content).hexdigest()}.{kind}"
+
+    def _disk_path(self, key: str) -> Path:
+        return self.disk_dir / f"{key}.txt"
+
+    def _remember(self, key: str, text: str) -> None:
+        self._memory[key] = text
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.memory_size:
+            self._memory.popitem(last=False)
+
+    def get(self, key: str) -> Optional[str]:
+        with self._lock:
+            text = self._memory.get(key)
+            if text is not None:
+                self._memory.move_to_end(key)
+                self._stats['memory_hits'] += 1
+                return text
+
+        if self.disk_dir:
+            path = self._disk_path(key)
+            try:
+                text = path.read_text(encoding='utf-8')
+                os.utime(path)  # Keep recently read files out of the next trim
+            except OSError:
+                text = None
+            if text is not None:
+                with self._lock:
+                    self._remember(key, text)
+                    self._stats['disk_hits'] += 1
+                return text
+
+        with self._lock:
+            self._stats['misses'] += 1
+        return None
+
+    def put(self, key: str, text: str) -> None:
+        with self._lock:
+            self._remember(key, text)
+        if not self.disk_dir:
+            return
+
+        # Write to a temp file and rename so readers never see a partial entry
+        fd, tmp_path = tempfile.mkstemp(dir=self.disk_dir, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                f.write(text)
+            os.replace(tmp_path, self._disk_path(key))
+        except OSError:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            return
+        self._trim_disk()
+
+    def _trim_disk(self) -> None:
+        entries = []
+        total = 0
+        for path in self.disk_dir.glob('*.txt'):
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+            total += stat.st_size
+
+        entries.sort()
+        for _, size, path in entries:
+            if total <= self.max_disk_bytes:
+                break
+            try:
+                path.unlink()
+            except OSError:
+                continue
+            total -= size
+            with self._lock:
+                self._stats['evictions'] += 1
+
+    def get_or_extract(self, file_content: bytes, kind: str, extract: Callable[[bytes], str]) -> str:
+        """Return the cached text for these bytes, running extract only on a miss."""
+        key = self.key_for(file_content, kind)
+        text = self.get(key)
+        if text is None:
+            text = extract(file_content)
+            self.put(key, text)
+        return text
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            stats = dict(self._stats)
+            stats['memory_entries'] = len(self._memory)
+        lookups = stats['memory_hits'] + stats['disk_hits'] + stats['misses']
+        stats['hit_rate'] = round((stats['memory_hits'] + stats['disk_hits']) / lookups, 3) if lookups else 0.0
+        return stats
+
+    def clear(self) -> None:
+        with self._lock:
+            self._memory.clear()
+        if self.disk_dir:
+            for path in self.disk_dir.glob('*.txt'):
+                path.unlink(missing_ok=True)
+
+_shared_cache: Optional[ExtractionCache] = None
+_shared_lock = threading.Lock()
+
+def get_extraction_cache() -> ExtractionCache:
+    """Return the process-wide cache, configured from EXTRACTION_CACHE_* environment variables."""
+    global _shared_cache
+    with _shared_lock:
+        if _shared_cache is None:
+            _shared_cache = ExtractionCache(
+                memory_size=int(os.environ.get('EXTRACTION_CACHE_MEMORY_SIZE', 64)),
+                disk_dir=os.environ.get('EXTRACTION_CACHE_DIR', 'data/extraction_cache') or None,
+                max_disk_bytes=int(os.environ.get('EXTRACTION_CACHE_MAX_MB', 64)) * 1024 * 1024
+            )
+        return _shared_cache
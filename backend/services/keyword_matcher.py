@@ -0,0 +1,90 @@
+from typing import Dict, List, Tuple
+import re
+from dataclasses import dataclass
+from functools import lru_cache
+
+@dataclass(frozen=True)
+class KeywordMatch:
+    keyword: str
+    categories: Tuple[str, ...]
+    start: int
+    end: int
+
+@dataclass
+class TermIndex:
+    """Keyword positions for one document, built in a single matcher pass and reused by every lookup."""
+    positions: Dict[str, List[Tuple[int, int]]]
+
+    def __contains__(self, keyword: str) -> bool:
+        return keyword.lower() in self.positions
+
+    def group(self, categories: Dict[str, List[str]]) -> Dict[str, List[str]]:
+        """Group the indexed keywords by category, in each category's configured order."""
+        grouped = {}
+        for category, keywords in categories.items():
+            hits = [keyword for keyword in keywords if keyword.lower() in self.positions]
+            if hits:
+                grouped[category] = hits
+        return grouped
+
+class KeywordMatcher:
+    """Finds every category's keywords in a single pass over the text.
+
+    All keywords are compiled into one alternation, longest first, guarded so a
+    match cannot start or end inside a word. That keeps "java" from matching
+    inside "javascript" while still handling keywords such as "c++" and "node.js".
+    """
+
+    def __init__(self, categories: Dict[str, List[str]]):
+        self.categories = {category: list(keywords) for category, keywords in categories.items()}
+        self._keyword_categories: Dict[str, Tuple[str, ...]] = {}
+        for category, keywords in self.categories.items():
+            for keyword in keywords:
+                key = keyword.lower()
+                self._keyword_categories[key] = self._keyword_categories.get(key, ()) + (category,)
+
+        alternation = '|'.join(
+            re.escape(keyword) for keyword in sorted(self._keyword_categories, key=len, reverse=True)
+        )
+        # The lookahead captures at every start position, so overlapping keywords
+        # such as "time management" and "management" are both found
+        self._pattern = re.compile(
+            rf'(?<![a-z0-9])(?=({alternation})(?![a-z0-9]))',
+            re.IGNORECASE
+        ) if alternation else None
+
+    def find_all(self, text: str) -> List[KeywordMatch]:
+        """Return every keyword occurrence with its position."""
+        if not self._pattern or not text:
+            return []
+        matches = []
+        for match in self._pattern.finditer(text):
+            keyword = match.group(1).lower()
+            matches.append(KeywordMatch(
+                keyword, self._keyword_categories[keyword], match.start(1), match.end(1)
+            ))
+        return matches
+
+    def match_categories(self, text: str) -> Dict[str, List[str]]:
+        """Return the keywords found in the text, grouped by category."""
+        return self.index(text).group(self.categories)
+
+    def positions(self, text: str) -> Dict[str, List[Tuple[int, int]]]:
+        """Return the (start, end) offsets of every keyword found in the text."""
+        positions: Dict[str, List[Tuple[int, int]]] = {}
+        for match in self.find_all(text):
+            positions.setdefault(match.keyword, []).append((match.start, match.end))
+        return positions
+
+    def index(self, text: str) -> TermIndex:
+        """Scan the text once and return a reusable index of every keyword found."""
+        return TermIndex(self.positions(text))
+
+@lru_cache(maxsize=32)
+def _cached_matcher(frozen_categories: Tuple[Tuple[str, Tuple[str, ...]], ...]) -> KeywordMatcher:
+    return KeywordMatcher({category: list(keywords) for category, keywords in frozen_categories})
+
+def get_keyword_matcher(categories: Dict[str, List[str]]) -> KeywordMatcher:
+    """Return a compiled matcher for the categories, shared by every caller that uses the same lists."""
+    frozen = tuple((category, tuple(keywords)) for category, keywords in categories.items())
+    return _cached_matcher(frozen)
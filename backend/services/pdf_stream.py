@@ -0,0 +1,73 @@
+from typing import Callable, Iterator, Optional
+import io
+import os
+import time
+from dataclasses import dataclass
+import PyPDF2
+
+@dataclass
+class PdfBudget:
+    """Limits on how much of an uploaded PDF is parsed."""
+    max_pages: int = 50
+    max_bytes: int = 10 * 1024 * 1024
+    max_seconds: float = 10.0
+
+    @classmethod
+    def from_env(cls) -> 'PdfBudget':
+        return cls(
+            max_pages=int(os.environ.get('PDF_MAX_PAGES', cls.max_pages)),
+            max_bytes=int(os.environ.get('PDF_MAX_BYTES', cls.max_bytes)),
+            max_seconds=float(os.environ.get('PDF_MAX_SECONDS', cls.max_seconds))
+        )
+
+class PdfPageStream:
+    """Yields a PDF's text one page at a time, stopping at the first exhausted budget.
+
+    PyPDF2 parses pages lazily, so a consumer that stops iterating early never
+    pays for the remaining pages. After iteration, stopped_reason names the
+    budget that cut the document short ('pages', 'bytes' or 'time'), and
+    complete is True only if every page was read; on_complete then receives
+    the full text.
+    """
+
+    def __init__(self, file_content: bytes, budget: Optional[PdfBudget] = None,
+                 cached_text: Optional[str] = None, on_complete: Optional[Callable[[str], None]] = None):
+        self.file_content = file_content
+        self.budget = budget or PdfBudget()
+        self.cached_text = cached_text
+        self.on_complete = on_complete
+        self.pages_read = 0
+        self.total_pages: Optional[int] = None
+        self.stopped_reason: Optional[str] = None
+        self.complete = False
+
+    def __iter__(self) -> Iterator[str]:
+        if self.cached_text is not None:
+            self.complete = True
+            yield self.cached_text
+            return
+
+        if len(self.file_content) > self.budget.max_bytes:
+            self.stopped_reason = 'bytes'
+            return
+
+        started = time.monotonic()
+        pdf_reader = PyPDF2.PdfReader(io.BytesIO(self.file_content))
+        self.total_pages = len(pdf_reader.pages)
+        pages = []
+        for page_number in range(self.total_pages):
+            if page_number >= self.budget.max_pages:
+                self.stopped_reason = 'pages'
+                return
+            if time.monotonic() - started > self.budget.max_seconds:
+                self.stopped_reason = 'time'
+                return
+
+            page_text = (pdf_reader.pages[page_number].extract_text() or "").lower()
+            self.pages_read += 1
+            pages.append(page_text)
+            yield page_text
+
+        self.complete = True
+        if self.on_complete:
+            self.on_complete("".join(pages))
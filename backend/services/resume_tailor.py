@@ -1,7 +1,10 @@
-from typing import Dict, List, Tuple
-import re
+from typing import Dict, List, Tuple, Union
+import hashlib
+from collections import OrderedDict
+import numpy as np
 from dataclasses import dataclass
 from .ats_analyzer import ATSAnalyzer
+from .keyword_matcher import KeywordMatcher, TermIndex, get_keyword_matcher
 
 @dataclass
 class JobRequirement:
@@ -9,66 +12,102 @@ class JobRequirement:
     keywords: List[str]
     importance: float  # 0.0 to 1.0
 
+@dataclass
+class ResumeIndex:
+    """Everything the tailoring steps need from a resume, computed in one pass."""
+    text: str
+    terms: TermIndex
+    ats_keywords: Dict[str, List[str]]
+    formatting_issues: List[str]
+    ats_score: int
+
 class ResumeTailor:
+    RESUME_INDEX_CACHE_SIZE = 16
+
     def __init__(self):
         self.ats_analyzer = ATSAnalyzer()
+        self._resume_indexes: "OrderedDict[str, ResumeIndex]" = OrderedDict()
         self.requirement_categories = {
             'technical_skills': ['python', 'javascript', 'java', 'c++', 'sql', 'react', 'node.js', 'aws', 'docker', 'kubernetes'],
             'soft_skills': ['leadership', 'communication', 'teamwork', 'problem-solving', 'time management'],
             'education': ['bachelor', 'master', 'phd', 'degree', 'university', 'college'],
             'experience': ['experience', 'years', 'worked', 'developed', 'implemented', 'managed']
         }
+        self.category_importance = {
+            'technical_skills': 0.8,
+            'soft_skills': 0.6,
+            'education': 0.7,
+            'experience': 0.9
+        }
+
+    @property
+    def keyword_matcher(self) -> KeywordMatcher:
+        return get_keyword_matcher(self.requirement_categories)
+
+    @property
+    def vocabulary_matcher(self) -> KeywordMatcher:
+        """One matcher over both the requirement and ATS keyword lists, so each document is scanned once."""
+        categories = dict(self.requirement_categories)
+        for category, keywords in self.ats_analyzer.common_keywords.items():
+            categories[f'ats_{category}'] = keywords
+        return get_keyword_matcher(categories)
+
+    def extract_resume_text(self, file_content: bytes, file_type: str) -> str:
+        """Extract an uploaded resume's text, reusing the cached text for bytes seen before."""
+        return self.ats_analyzer.extract_text(file_content, file_type)
 
-    def extract_job_requirements(self, job_description: str) -> List[JobRequirement]:
+    def index_document(self, text: str) -> TermIndex:
+        """Tokenize and index a document once; every later lookup is answered from the index."""
+        return self.vocabulary_matcher.index(text)
+
+    def index_resume(self, resume_text: str) -> ResumeIndex:
+        """Index a resume and precompute its ATS analysis, reusing the result for repeated text."""
+        key = hashlib.sha256(resume_text.encode('utf-8')).hexdigest()
+        cached = self._resume_indexes.get(key)
+        if cached is not None:
+            self._resume_indexes.move_to_end(key)
+            return cached
+
+        terms = self.index_document(resume_text)
+        ats_keywords = self.ats_analyzer.keywords_from_index(terms)
+        formatting_issues = self.ats_analyzer.check_formatting(resume_text)
+        resume_index = ResumeIndex(
+            text=resume_text,
+            terms=terms,
+            ats_keywords=ats_keywords,
+            formatting_issues=formatting_issues,
+            ats_score=self.ats_analyzer.calculate_score(ats_keywords, formatting_issues)
+        )
+
+        self._resume_indexes[key] = resume_index
+        if len(self._resume_indexes) > self.RESUME_INDEX_CACHE_SIZE:
+            self._resume_indexes.popitem(last=False)
+        return resume_index
+
+    def extract_job_requirements(self, job_description: Union[str, TermIndex]) -> List[JobRequirement]:
         """Extract requirements from job description and categorize them."""
-        requirements = []
-        job_desc_lower = job_description.lower()
-
-        # Extract technical skills
-        tech_skills = []
-        for skill in self.requirement_categories['technical_skills']:
-            if skill in job_desc_lower:
-                tech_skills.append(skill)
-        if tech_skills:
-            requirements.append(JobRequirement('technical_skills', tech_skills, 0.8))
-
-        # Extract soft skills
-        soft_skills = []
-        for skill in self.requirement_categories['soft_skills']:
-            if skill in job_desc_lower:
-                soft_skills.append(skill)
-        if soft_skills:
-            requirements.append(JobRequirement('soft_skills', soft_skills, 0.6))
-
-        # Extract education requirements
-        education = []
-        for edu in self.requirement_categories['education']:
-            if edu in job_desc_lower:
-                education.append(edu)
-        if education:
-            requirements.append(JobRequirement('education', education, 0.7))
-
-        # Extract experience requirements
-        experience = []
-        for exp in self.requirement_categories['experience']:
-            if exp in job_desc_lower:
-                experience.append(exp)
-        if experience:
-            requirements.append(JobRequirement('experience', experience, 0.9))
-
-        return requirements
-
-    def analyze_resume_match(self, resume_text: str, requirements: List[JobRequirement]) -> Dict:
+        if isinstance(job_description, str):
+            job_description = self.index_document(job_description)
+        found = job_description.group(self.requirement_categories)
+        return [
+            JobRequirement(category, found[category], importance)
+            for category, importance in self.category_importance.items()
+            if category in found
+        ]
+
+    def analyze_resume_match(self, resume_text: Union[str, ResumeIndex], requirements: List[JobRequirement]) -> Dict:
         """Analyze how well the resume matches the job requirements."""
         matches = {}
-        resume_lower = resume_text.lower()
+        if isinstance(resume_text, str):
+            resume_text = self.index_resume(resume_text)
+        resume_keywords = resume_text.terms
 
         for req in requirements:
-            matched_keywords = [kw for kw in req.keywords if kw in resume_lower]
+            matched_keywords = [kw for kw in req.keywords if kw in resume_keywords]
             match_percentage = len(matched_keywords) / len(req.keywords) if req.keywords else 0
             matches[req.category] = {
                 'matched_keywords': matched_keywords,
-                'missing_keywords': [kw for kw in req.keywords if kw not in resume_lower],
+                'missing_keywords': [kw for kw in req.keywords if kw not in resume_keywords],
                 'match_percentage': match_percentage,
                 'importance': req.importance
             }
@@ -89,13 +128,15 @@ class ResumeTailor:
 
         return suggestions
 
-    def tailor_resume(self, resume_text: str, job_description: str) -> Dict:
+    def tailor_resume(self, resume_text: Union[str, ResumeIndex], job_description: str) -> Dict:
         """Main function to tailor a resume for a specific job."""
+        resume_index = self.index_resume(resume_text) if isinstance(resume_text, str) else resume_text
+        
         # Extract requirements from job description
         requirements = self.extract_job_requirements(job_description)
         
         # Analyze how well the resume matches
-        matches = self.analyze_resume_match(resume_text, requirements)
+        matches = self.analyze_resume_match(resume_index, requirements)
         
         # Generate suggestions
         suggestions = self.generate_tailoring_suggestions(matches)
@@ -107,10 +148,7 @@ class ResumeTailor:
         ) / len(matches) if matches else 0
         
         # Ensure ATS score stays high
-        ats_score = self.ats_analyzer.calculate_score(
-            self.ats_analyzer.analyze_keywords(resume_text),
-            self.ats_analyzer.check_formatting(resume_text)
-        )
+        ats_score = resume_index.ats_score
         
         return {
             'overall_match_score': round(overall_score * 100, 2),
@@ -120,6 +158,79 @@ class ResumeTailor:
             'is_ats_compliant': ats_score >= 80
         }
 
+    def _requirement_columns(self) -> Tuple[Dict[str, List[int]], np.ndarray, np.ndarray]:
+        """Map every (category, keyword) pair to a column of the term matrix."""
+        keyword_columns: Dict[str, List[int]] = {}
+        column_categories = []
+        categories = list(self.category_importance)
+        for category_index, category in enumerate(categories):
+            for keyword in self.requirement_categories.get(category, []):
+                keyword_columns.setdefault(keyword.lower(), []).append(len(column_categories))
+                column_categories.append(category_index)
+
+        # category_mask[v, k] is 1 when column v belongs to category k
+        category_mask = np.zeros((len(column_categories), len(categories)), dtype=np.float64)
+        category_mask[np.arange(len(column_categories)), column_categories] = 1.0
+        importance = np.array([self.category_importance[category] for category in categories], dtype=np.float64)
+        return keyword_columns, category_mask, importance
+
+    def _term_vector(self, terms: TermIndex, keyword_columns: Dict[str, List[int]], size: int) -> np.ndarray:
+        vector = np.zeros(size, dtype=np.float64)
+        for keyword in terms.positions:
+            for column in keyword_columns.get(keyword, ()):
+                vector[column] = 1.0
+        return vector
+
+    def score_jobs(self, resume_text: Union[str, ResumeIndex], job_descriptions: List[str]) -> np.ndarray:
+        """Compute overall_match_score for one resume against many job descriptions at once.
+
+        Each description is indexed once into a row of a binary term matrix;
+        per-category requirement counts and resume matches then fall out of two
+        matrix products instead of a Python loop per job. Scores match what
+        tailor_resume reports for the same pair.
+        """
+        resume_index = self.index_resume(resume_text) if isinstance(resume_text, str) else resume_text
+        keyword_columns, category_mask, importance = self._requirement_columns()
+        size = category_mask.shape[0]
+        if not job_descriptions:
+            return np.zeros(0, dtype=np.float64)
+
+        job_matrix = np.vstack([
+            self._term_vector(self.index_document(description), keyword_columns, size)
+            for description in job_descriptions
+        ])
+        resume_vector = self._term_vector(resume_index.terms, keyword_columns, size)
+
+        required = job_matrix @ category_mask                      # (jobs, categories)
+        matched = (job_matrix * resume_vector) @ category_mask     # (jobs, categories)
+        present = required > 0
+        match_percentage = np.divide(matched, required, out=np.zeros_like(required), where=present)
+
+        weighted = (match_percentage * importance).sum(axis=1)
+        category_counts = present.sum(axis=1)
+        overall = np.divide(weighted, category_counts, out=np.zeros_like(weighted), where=category_counts > 0)
+        return np.round(overall * 100, 2)
+
+    def rank_jobs(self, resume_text: Union[str, ResumeIndex], jobs: List[Dict], top_k: int = None) -> List[Dict]:
+        """Rank jobs by overall_match_score, best first.
+
+        Args:
+            resume_text: Resume text or a prebuilt ResumeIndex
+            jobs: Dicts with a 'description' and an optional 'job_id'
+            top_k: Only return the best top_k jobs
+        """
+        scores = self.score_jobs(resume_text, [job.get('description', '') for job in jobs])
+        order = np.argsort(-scores, kind='stable')
+        if top_k is not None:
+            order = order[:top_k]
+        return [
+            {
+                'job_id': jobs[i].get('job_id', int(i)),
+                'overall_match_score': float(scores[i])
+            }
+            for i in order
+        ]
+
     def get_optimized_resume(self, original_resume: str, job_description: str) -> Tuple[str, Dict]:
         """Generate an optimized version of the resume for the job."""
         # First, get the tailoring analysis
@@ -144,10 +255,7 @@ class ResumeTailor:
                         optimized_resume += f"\n• Strong {keyword} abilities"
         
         # Recalculate ATS score for the optimized version
-        new_ats_score = self.ats_analyzer.calculate_score(
-            self.ats_analyzer.analyze_keywords(optimized_resume),
-            self.ats_analyzer.check_formatting(optimized_resume)
-        )
+        new_ats_score = self.index_resume(optimized_resume).ats_score
         
         # Update analysis with new ATS score
         analysis['optimized_ats_score'] = new_ats_score
@@ -0,0 +1,253 @@
+from typing import Callable, Dict, Optional
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+import uuid
+from datetime import datetime, timezone
+from pathlib import Path
+from .worker_pool import (
+    AnalysisPool, PoolBusyError, PoolTimeoutError, get_analysis_pool,
+    analyze_resume_task, tailor_resume_task
+)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS analysis_jobs (
+    job_id TEXT PRIMARY KEY,
+    kind TEXT NOT NULL,
+    dedup_key TEXT NOT NULL UNIQUE,
+    status TEXT NOT NULL,
+    file_type TEXT NOT NULL,
+    file_content BLOB,
+    job_description TEXT,
+    result TEXT,
+    error TEXT,
+    created_at TIMESTAMP NOT NULL,
+    updated_at TIMESTAMP NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_analysis_jobs_status ON analysis_jobs (status, created_at);
+"""
+
+QUEUED, RUNNING, DONE, FAILED = 'queued', 'running', 'done', 'failed'
+FINISHED = (DONE, FAILED)
+
+# Work each job kind runs in the analysis pool
+TASKS: Dict[str, Callable] = {
+    'analyze': lambda row: (analyze_resume_task, row['file_content'], row['file_type']),
+    'tailor': lambda row: (tailor_resume_task, row['file_content'], row['file_type'], row['job_description']),
+}
+
+def _now() -> str:
+    return datetime.now(timezone.utc).isoformat(timespec='seconds')
+
+def dedup_key(kind: str, file_content: bytes, file_type: str, job_description: Optional[str]) -> str:
+    """Identical uploads for the same kind of work and job description share one job."""
+    digest = hashlib.sha256()
+    for part in (kind, file_type, hashlib.sha256(file_content).hexdigest(), job_description or ''):
+        digest.update(part.encode('utf-8'))
+        digest.update(b'\0')
+    return digest.hexdigest()
+
+class AnalysisJobQueue:
+    """Durable SQLite queue of analyze/tailor jobs, drained into the analysis pool.
+
+    Submissions return a job id immediately; drainer threads claim queued rows
+    and run them on the worker processes, and clients poll get() or
+    wait_for_change(). Jobs left running by a crash are requeued on startup,
+    and failed jobs are retried when the same work is submitted again.
+    """
+
+    def __init__(self, path: str = 'data/analysis_jobs.db', pool: Optional[AnalysisPool] = None,
+                 drainers: Optional[int] = None, poll_interval: float = 0.5):
+        self.path = Path(path)
+        if str(path) != ':memory:':
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.pool = pool or get_analysis_pool()
+        self.drainers = drainers or self.pool.max_workers
+        self.poll_interval = poll_interval
+        self._lock = threading.Lock()
+        self._changed = threading.Condition()
+        self._threads = []
+        self._stopping = threading.Event()
+        self._conn = sqlite3.connect(str(path), check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        with self._lock, self._conn:
+            self._conn.execute('PRAGMA journal_mode=WAL')
+            self._conn.executescript(SCHEMA)
+            self._conn.execute(
+                'UPDATE analysis_jobs SET status = ?, updated_at = ? WHERE status = ?',
+                (QUEUED, _now(), RUNNING)
+            )
+
+    @classmethod
+    def from_env(cls) -> 'AnalysisJobQueue':
+        return cls(os.environ.get('ANALYSIS_QUEUE_PATH', 'data/analysis_jobs.db'))
+
+    def submit(self, kind: str, file_content: bytes, file_type: str, job_description: Optional[str] = None) -> Dict:
+        """Enqueue a job, or return the existing job for identical work."""
+        if kind not in TASKS:
+            raise ValueError(f"Unknown job kind: {kind}")
+        key = dedup_key(kind, file_content, file_type, job_description)
+        now = _now()
+        with self._lock, self._conn:
+            row = self._conn.execute(
+                'SELECT job_id, status FROM analysis_jobs WHERE dedup_key = ?', (key,)
+            ).fetchone()
+            if row is None:
+                job_id = uuid.uuid4().hex
+                self._conn.execute(
+                    """
+                    INSERT INTO analysis_jobs (job_id, kind, dedup_key, status, file_type, file_content,
+                                               job_description, created_at, updated_at)
+                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+                    """,
+                    (job_id, kind, key, QUEUED, file_type, file_content, job_description, now, now)
+                )
+                deduplicated = False
+            else:
+                job_id = row['job_id']
+                deduplicated = True
+                if row['status'] == FAILED:
+                    self._conn.execute(
+                        """
+                        UPDATE analysis_jobs SET status = ?, file_content = ?, error = NULL, updated_at = ?
+                        WHERE job_id = ?
+                        """,
+                        (QUEUED, file_content, now, job_id)
+                    )
+        self.start()
+        self._notify()
+        job = self.get(job_id)
+        job['deduplicated'] = deduplicated
+        return job
+
+    def get(self, job_id: str) -> Optional[Dict]:
+        with self._lock:
+            row = self._conn.execute(
+                'SELECT job_id, kind, status, result, error, created_at, updated_at FROM analysis_jobs WHERE job_id = ?',
+                (job_id,)
+            ).fetchone()
+        if row is None:
+            return None
+        job = {key: row[key] for key in ('job_id', 'kind', 'status', 'created_at', 'updated_at')}
+        if row['status'] == DONE:
+            job['result'] = json.loads(row['result'])
+        elif row['status'] == FAILED:
+            job['error'] = row['error']
+        return job
+
+    def wait_for_change(self, job_id: str, last_status: Optional[str], timeout: float) -> Optional[Dict]:
+        """Return the job once its status differs from last_status, or as it is after timeout."""
+        deadline = time.monotonic() + timeout
+        while True:
+            job = self.get(job_id)
+            remaining = deadline - time.monotonic()
+            if job is None or job['status'] != last_status or remaining <= 0:
+                return job
+            # Other processes draining the same file don't notify us, so keep polling too
+            with self._changed:
+                self._changed.wait(min(self.poll_interval, remaining))
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            rows = self._conn.execute('SELECT status, COUNT(*) AS n FROM analysis_jobs GROUP BY status').fetchall()
+        stats = {status: 0 for status in (QUEUED, RUNNING, DONE, FAILED)}
+        stats.update({row['status']: row['n'] for row in rows})
+        return stats
+
+    def start(self) -> None:
+        """Start the drainer threads if they aren't running yet."""
+        with self._lock:
+            if self._threads:
+                return
+            self._stopping.clear()
+            for index in range(self.drainers):
+                thread = threading.Thread(target=self._drain, name=f'analysis-drainer-{index}', daemon=True)
+                thread.start()
+                self._threads.append(thread)
+
+    def stop(self) -> None:
+        self._stopping.set()
+        self._notify()
+        for thread in self._threads:
+            thread.join(timeout=5)
+        self._threads = []
+
+    def _notify(self) -> None:
+        with self._changed:
+            self._changed.notify_all()
+
+    def _claim(self) -> Optional[sqlite3.Row]:
+        with self._lock, self._conn:
+            row = self._conn.execute(
+                'SELECT * FROM analysis_jobs WHERE status = ? ORDER BY created_at LIMIT 1', (QUEUED,)
+            ).fetchone()
+            if row is None:
+                return None
+            # Another process may have claimed it between the select and the update
+            claimed = self._conn.execute(
+                'UPDATE analysis_jobs SET status = ?, updated_at = ? WHERE job_id = ? AND status = ?',
+                (RUNNING, _now(), row['job_id'], QUEUED)
+            ).rowcount
+        return row if claimed else None
+
+    def _finish(self, job_id: str, status: str, result: Optional[Dict] = None, error: Optional[str] = None) -> None:
+        with self._lock, self._conn:
+            if status == QUEUED:
+                self._conn.execute(
+                    'UPDATE analysis_jobs SET status = ?, updated_at = ? WHERE job_id = ?',
+                    (QUEUED, _now(), job_id)
+                )
+            else:
+                # The upload isn't needed once the job has an outcome
+                self._conn.execute(
+                    """
+                    UPDATE analysis_jobs SET status = ?, result = ?, error = ?, file_content = NULL, updated_at = ?
+                    WHERE job_id = ?
+                    """,
+                    (status, json.dumps(result) if result is not None else None, error, _now(), job_id)
+                )
+        self._notify()
+
+    def _drain(self) -> None:
+        while not self._stopping.is_set():
+            row = self._claim()
+            if row is None:
+                with self._changed:
+                    self._changed.wait(self.poll_interval)
+                continue
+
+            self._notify()
+            fn, *args = TASKS[row['kind']](row)
+            try:
+                result = self.pool.run(fn, *args)
+            except PoolBusyError:
+                # Synchronous requests hold every slot; put the job back and retry shortly
+                self._finish(row['job_id'], QUEUED)
+                self._stopping.wait(self.poll_interval)
+                continue
+            except PoolTimeoutError:
+                self._finish(row['job_id'], FAILED, error='Resume processing timed out')
+                continue
+            except Exception as e:
+                self._finish(row['job_id'], FAILED, error=str(e))
+                continue
+            self._finish(row['job_id'], DONE, result=result)
+
+    def close(self) -> None:
+        self.stop()
+        with self._lock:
+            self._conn.close()
+
+_shared_queue: Optional[AnalysisJobQueue] = None
+_shared_lock = threading.Lock()
+
+def get_analysis_queue() -> AnalysisJobQueue:
+    """Return the process-wide queue, stored at ANALYSIS_QUEUE_PATH."""
+    global _shared_queue
+    with _shared_lock:
+        if _shared_queue is None:
+            _shared_queue = AnalysisJobQueue.from_env()
+        return _shared_queue
@@ -0,0 +1,163 @@
+from typing import Any, Callable, Dict, List, Optional
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor, TimeoutError as FutureTimeoutError
+from concurrent.futures.process import BrokenProcessPool
+
+class PoolBusyError(Exception):
+    """Raised when the pool already has max_workers + max_queue tasks in flight."""
+
+class PoolTimeoutError(Exception):
+    """Raised when a task does not finish within the request timeout."""
+
+class AnalysisPool:
+    """Bounded process pool for CPU-bound resume parsing and analysis.
+
+    At most max_workers tasks run and max_queue more wait; further submissions
+    are rejected immediately so callers can answer 503 instead of piling up
+    requests. A timed-out task keeps its slot until its worker finishes, so the
+    queue depth always reflects the real load on the processes.
+    """
+
+    def __init__(self, max_workers: int = 2, max_queue: int = 8, timeout: float = 30.0):
+        self.max_workers = max_workers
+        self.max_queue = max_queue
+        self.timeout = timeout
+        self._slots = threading.BoundedSemaphore(max_workers + max_queue)
+        self._lock = threading.Lock()
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._in_flight = 0
+        self._stats = {'submitted': 0, 'completed': 0, 'failed': 0, 'rejected': 0, 'timed_out': 0}
+
+    @classmethod
+    def from_env(cls) -> 'AnalysisPool':
+        return cls(
+            max_workers=int(os.environ.get('ANALYSIS_POOL_WORKERS', min(os.cpu_count() or 2, 4))),
+            max_queue=int(os.environ.get('ANALYSIS_POOL_QUEUE', 8)),
+            timeout=float(os.environ.get('ANALYSIS_TIMEOUT', 30))
+        )
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                # Spawned workers don't inherit the web server's threads and locks
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.max_workers,
+                    mp_context=multiprocessing.get_context('spawn')
+                )
+            return self._executor
+
+    def _release(self, future) -> None:
+        with self._lock:
+            self._in_flight -= 1
+            if future.cancelled() or future.exception() is not None:
+                self._stats['failed'] += 1
+            else:
+                self._stats['completed'] += 1
+        self._slots.release()
+
+    def run(self, fn: Callable, *args, timeout: Optional[float] = None) -> Any:
+        """Run fn(*args) in a worker process and return its result.
+
+        Raises:
+            PoolBusyError: No queue slot is free
+            PoolTimeoutError: The task took longer than the timeout
+        """
+        if not self._slots.acquire(blocking=False):
+            with self._lock:
+                self._stats['rejected'] += 1
+            raise PoolBusyError("Analysis queue is full")
+
+        try:
+            future = self._get_executor().submit(fn, *args)
+        except BrokenProcessPool:
+            # A worker died; drop the executor so the next request gets a fresh one
+            with self._lock:
+                self._executor = None
+            self._slots.release()
+            raise
+        except Exception:
+            self._slots.release()
+            raise
+
+        with self._lock:
+            self._in_flight += 1
+            self._stats['submitted'] += 1
+        future.add_done_callback(self._release)
+
+        try:
+            return future.result(timeout=timeout or self.timeout)
+        except FutureTimeoutError:
+            future.cancel()
+            with self._lock:
+                self._stats['timed_out'] += 1
+            raise PoolTimeoutError("Analysis timed out")
+        except BrokenProcessPool:
+            with self._lock:
+                self._executor = None
+            raise
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            stats = dict(self._stats)
+            stats['in_flight'] = self._in_flight
+        stats['running'] = min(stats['in_flight'], self.max_workers)
+        stats['queue_depth'] = max(stats['in_flight'] - self.max_workers, 0)
+        stats['max_workers'] = self.max_workers
+        stats['max_queue'] = self.max_queue
+        return stats
+
+    def shutdown(self) -> None:
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+_shared_pool: Optional[AnalysisPool] = None
+_shared_lock = threading.Lock()
+
+def get_analysis_pool() -> AnalysisPool:
+    """Return the process-wide pool, configured from ANALYSIS_* environment variables."""
+    global _shared_pool
+    with _shared_lock:
+        if _shared_pool is None:
+            _shared_pool = AnalysisPool.from_env()
+        return _shared_pool
+
+# Task functions run inside the worker processes, each of which keeps one
+# ResumeTailor (and its ATSAnalyzer, matchers and caches) for its lifetime.
+
+_worker_tailor = None
+
+def _get_worker_tailor():
+    global _worker_tailor
+    if _worker_tailor is None:
+        from .resume_tailor import ResumeTailor
+        _worker_tailor = ResumeTailor()
+    return _worker_tailor
+
+def analyze_resume_task(file_content: bytes, file_type: str) -> Dict:
+    return _get_worker_tailor().ats_analyzer.analyze_resume(file_content, file_type)
+
+def tailor_analysis_task(resume_text: str, job_description: str) -> Dict:
+    return _get_worker_tailor().tailor_resume(resume_text, job_description)
+
+def tailor_text_task(resume_text: str, job_description: str) -> Dict:
+    optimized_resume, analysis = _get_worker_tailor().get_optimized_resume(resume_text, job_description)
+    return {'analysis': analysis, 'optimized_resume': optimized_resume}
+
+def tailor_resume_task(file_content: bytes, file_type: str, job_description: str) -> Dict:
+    resume_text = _get_worker_tailor().extract_resume_text(file_content, file_type)
+    return tailor_text_task(resume_text, job_description)
+
+def score_jobs_task(file_content: bytes, file_type: str, jobs: List[Dict], top_k: Optional[int]) -> Dict:
+    tailor = _get_worker_tailor()
+    resume_text = tailor.extract_resume_text(file_content, file_type)
+    return {
+        'ats_score': tailor.index_resume(resume_text).ats_score,
+        'jobs': tailor.rank_jobs(resume_text, jobs, top_k=top_k)
+    }
+
+def extraction_cache_stats_task() -> Dict:
+    return _get_worker_tailor().ats_analyzer.extraction_cache.stats()
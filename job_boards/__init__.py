@@ -8,6 +8,15 @@ from .wellfound import WellFoundBoard
 from .ziprecruiter import ZipRecruiterBoard
 from .welcome_to_the_jungle import WelcomeToTheJungleBoard
 from .direct_company import DirectCompanyBoard
+from .driver_pool import WebDriverPool
+from .orchestrator import SearchOrchestrator, BoardResult
+from .job_store import JobStore
+from .dedup import JobDeduplicator, dedupe_jobs
+from .search_cache import SearchCache
+from .apply_scheduler import ApplyScheduler, resume_match_scorer
+from .journal import RunJournal
+from .answer_bank import AnswerBank
+from .selector_cache import SelectorCache
 
 __all__ = [
     'IndeedBoard',
@@ -16,5 +25,17 @@ __all__ = [
     'WellFoundBoard',
     'ZipRecruiterBoard',
     'WelcomeToTheJungleBoard',
-    'DirectCompanyBoard'
+    'DirectCompanyBoard',
+    'WebDriverPool',
+    'SearchOrchestrator',
+    'BoardResult',
+    'JobStore',
+    'JobDeduplicator',
+    'dedupe_jobs',
+    'SearchCache',
+    'ApplyScheduler',
+    'resume_match_scorer',
+    'RunJournal',
+    'AnswerBank',
+    'SelectorCache'
 ] 
\ No newline at end of file
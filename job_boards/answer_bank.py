@@ -0,0 +1,273 @@
+"""
+Persistent screening-question answers with fuzzy question matching
+"""
+import json
+import logging
+import os
+import re
+import sqlite3
+import threading
+from datetime import datetime, timezone
+from difflib import SequenceMatcher
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS answers (
+    question_key TEXT PRIMARY KEY,
+    question TEXT NOT NULL,
+    answer TEXT NOT NULL,
+    source TEXT NOT NULL,
+    uses INTEGER NOT NULL DEFAULT 0,
+    updated_at TIMESTAMP NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS pending_questions (
+    question_key TEXT PRIMARY KEY,
+    question TEXT NOT NULL,
+    field_type TEXT NOT NULL,
+    options TEXT NOT NULL,
+    job_board TEXT NOT NULL,
+    seen_count INTEGER NOT NULL,
+    first_seen_at TIMESTAMP NOT NULL,
+    last_seen_at TIMESTAMP NOT NULL
+);
+"""
+
+# The backend and the scripts may run from different directories, so relative
+# paths are anchored at the repo root; ANSWER_BANK_PATH overrides the location
+REPO_ROOT = Path(__file__).resolve().parent.parent
+DEFAULT_PATH = REPO_ROOT / "data" / "answer_bank.db"
+
+# An answer is only replaced by one from an equal or more trusted source
+CONFIRMED = "confirmed"
+CONFIG = "config"
+LEARNED = "learned"
+SOURCE_RANK = {LEARNED: 0, CONFIG: 1, CONFIRMED: 2}
+
+_STOPWORDS = {
+    "a", "an", "the", "please", "your", "you", "do", "does", "are", "is", "of", "to", "in", "for", "this",
+    "with", "will", "be", "if", "any", "our",
+}
+# Words that change how a question is phrased but not what it asks; ignored when matching
+_FILLER = {"how", "many", "what", "have", "has", "would", "can", "we", "i", "my", "legally", "currently"}
+
+
+def normalize_question(text):
+    """Lowercase, drop punctuation, stopwords and required-field markers"""
+    text = re.sub(r"\(?\brequired\b\)?|\*", " ", (text or "").lower())
+    tokens = re.sub(r"[^a-z0-9+#]+", " ", text).split()
+    return " ".join(token for token in tokens if token not in _STOPWORDS)
+
+
+def resolve_path(path=None):
+    """The answer bank file: ANSWER_BANK_PATH, else path, else the default, relative to the repo root"""
+    path = Path(os.environ.get("ANSWER_BANK_PATH") or path or DEFAULT_PATH)
+    return path if path.is_absolute() or str(path) == ":memory:" else REPO_ROOT / path
+
+
+def _content_tokens(key):
+    return {token for token in key.split() if token not in _FILLER}
+
+
+def _same_token(a, b):
+    """Whether two tokens are the same word, allowing spelling and plural variants"""
+    if a == b:
+        return True
+    if min(len(a), len(b)) < 4 or a[0] != b[0]:
+        return False
+    return SequenceMatcher(None, a, b).ratio() >= 0.8
+
+
+def same_content(key, other_key):
+    """Whether two normalized questions use the same content words
+
+    "years experience python" and "years experience java" score high on
+    similarity but ask different things, so any unmatched word rules a
+    match out.
+    """
+    tokens, other_tokens = _content_tokens(key), _content_tokens(other_key)
+    return (
+        all(any(_same_token(a, b) for b in other_tokens) for a in tokens)
+        and all(any(_same_token(a, b) for b in tokens) for a in other_tokens)
+    )
+
+
+def _now():
+    return datetime.now(timezone.utc).isoformat(timespec="seconds")
+
+
+class AnswerBank:
+    """Answers to screening questions, shared by every board and run
+
+    Questions are keyed by their normalized text. A lookup that misses the
+    exact key falls back to a fuzzy match over an in-memory token index:
+    candidates sharing a word and using the same content words (see
+    ``same_content``) are scored by word overlap and character similarity,
+    and the best one at or above ``threshold`` wins.
+
+    Questions nobody has answered are kept as pending, with how often and
+    where they were seen, so they can be answered once and reused.
+
+    Usage:
+        bank = AnswerBank.from_config(config)
+        answer = bank.lookup("Are you authorized to work in the US?")
+        if answer is None:
+            bank.record_pending(question, "radio", ["Yes", "No"], "linkedin")
+        bank.learn(question, "Yes", source=CONFIRMED)
+    """
+
+    def __init__(self, path=DEFAULT_PATH, threshold=0.75):
+        self.path = Path(path)
+        if str(path) != ":memory:":
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.threshold = threshold
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(path), check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        with self._lock, self._conn:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.executescript(SCHEMA)
+        self._answers = {}
+        self._index = {}
+        for row in self._conn.execute("SELECT question_key, answer, source FROM answers"):
+            self._remember(row["question_key"], row["answer"], row["source"])
+
+    @classmethod
+    def from_config(cls, config):
+        """Build a bank from config["answer_bank"], or None if it is disabled
+
+        Answers listed under ``answers`` (question -> answer) are loaded as
+        configured answers, which learned answers never override.
+        """
+        bank_config = config.get("answer_bank", {})
+        if not bank_config.get("enabled", True):
+            return None
+        bank = cls(resolve_path(bank_config.get("path")), threshold=bank_config.get("threshold", 0.75))
+        for question, answer in bank_config.get("answers", {}).items():
+            bank.learn(question, answer, source=CONFIG)
+        return bank
+
+    def _remember(self, key, answer, source):
+        self._answers[key] = (answer, source)
+        for token in key.split():
+            self._index.setdefault(token, set()).add(key)
+
+    def _best_match(self, key):
+        tokens = set(key.split())
+        candidates = set().union(*(self._index.get(token, set()) for token in tokens)) if tokens else set()
+        best_key, best_score = None, 0.0
+        for candidate in candidates:
+            if not same_content(key, candidate):
+                continue
+            candidate_tokens = set(candidate.split())
+            # Word overlap, counting spelling variants as the same word
+            shared = min(
+                sum(1 for token in tokens if any(_same_token(token, other) for other in candidate_tokens)),
+                len(candidate_tokens),
+            )
+            overlap = shared / (len(tokens) + len(candidate_tokens) - shared)
+            score = (overlap + SequenceMatcher(None, key, candidate).ratio()) / 2
+            if score > best_score:
+                best_key, best_score = candidate, score
+        return best_key if best_score >= self.threshold else None
+
+    def lookup(self, question):
+        """Return the stored answer for a question, or None if it has none"""
+        key = normalize_question(question)
+        if not key:
+            return None
+        with self._lock:
+            match = key if key in self._answers else self._best_match(key)
+            if match is None:
+                return None
+            with self._conn:
+                self._conn.execute("UPDATE answers SET uses = uses + 1 WHERE question_key = ?", (match,))
+        if match != key:
+            logger.debug(f"Matched question {question!r} to {match!r}")
+        return self._answers[match][0]
+
+    def learn(self, question, answer, source=LEARNED):
+        """Store an answer, unless a more trusted one is already stored
+
+        Returns:
+            bool: Whether the answer was stored
+        """
+        key = normalize_question(question)
+        if not key or answer is None or str(answer).strip() == "":
+            return False
+        answer = str(answer).strip()
+        with self._lock:
+            existing = self._answers.get(key)
+            if existing and SOURCE_RANK[existing[1]] > SOURCE_RANK[source]:
+                return False
+            with self._conn:
+                self._conn.execute(
+                    """
+                    INSERT INTO answers (question_key, question, answer, source, updated_at)
+                    VALUES (?, ?, ?, ?, ?)
+                    ON CONFLICT(question_key) DO UPDATE SET
+                        question = excluded.question,
+                        answer = excluded.answer,
+                        source = excluded.source,
+                        updated_at = excluded.updated_at
+                    """,
+                    (key, question.strip(), answer, source, _now()),
+                )
+                self._conn.execute("DELETE FROM pending_questions WHERE question_key = ?", (key,))
+            self._remember(key, answer, source)
+        return True
+
+    def record_pending(self, question, field_type, options, job_board):
+        """Note a question without an answer, for the pending report"""
+        key = normalize_question(question)
+        if not key:
+            return
+        now = _now()
+        with self._lock, self._conn:
+            self._conn.execute(
+                """
+                INSERT INTO pending_questions
+                    (question_key, question, field_type, options, job_board, seen_count, first_seen_at, last_seen_at)
+                VALUES (?, ?, ?, ?, ?, 1, ?, ?)
+                ON CONFLICT(question_key) DO UPDATE SET
+                    seen_count = seen_count + 1,
+                    options = excluded.options,
+                    last_seen_at = excluded.last_seen_at
+                """,
+                (key, question.strip(), field_type, json.dumps(list(options or [])), job_board, now, now),
+            )
+
+    def pending(self, limit=None):
+        """Unanswered questions, most often seen first"""
+        query = "SELECT * FROM pending_questions ORDER BY seen_count DESC, last_seen_at DESC"
+        params = ()
+        if limit:
+            query += " LIMIT ?"
+            params = (limit,)
+        with self._lock:
+            rows = self._conn.execute(query, params).fetchall()
+        return [
+            {
+                "question": row["question"],
+                "field_type": row["field_type"],
+                "options": json.loads(row["options"]),
+                "job_board": row["job_board"],
+                "seen_count": row["seen_count"],
+                "last_seen_at": row["last_seen_at"],
+            }
+            for row in rows
+        ]
+
+    def answers(self):
+        """Every stored answer, most used first"""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT question, answer, source, uses, updated_at FROM answers ORDER BY uses DESC, question"
+            ).fetchall()
+        return [dict(row) for row in rows]
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
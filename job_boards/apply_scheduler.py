@@ -0,0 +1,371 @@
+"""
+Per-board apply scheduler with token-bucket rate limits
+"""
+import heapq
+import itertools
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from .answer_bank import AnswerBank
+from .driver_pool import WebDriverPool
+from .job_store import make_job_id
+from .journal import SCORED, APPLYING, APPLIED, FAILED, SKIPPED
+from .orchestrator import BOARD_CLASSES
+from .selector_cache import SelectorCache
+
+logger = logging.getLogger(__name__)
+
+
+class TokenBucket:
+    """Allows ``burst`` applies at once, refilled at ``rate_per_hour``"""
+
+    def __init__(self, rate_per_hour, burst=1):
+        self.rate = rate_per_hour / 3600.0
+        self.burst = burst
+        self.tokens = float(burst)
+        self._updated = time.monotonic()
+
+    def take(self):
+        """Take a token if one is available
+
+        Returns:
+            float: 0 if a token was taken, else seconds until the next one
+        """
+        now = time.monotonic()
+        self.tokens = min(self.burst, self.tokens + (now - self._updated) * self.rate)
+        self._updated = now
+        if self.tokens >= 1:
+            self.tokens -= 1
+            return 0.0
+        if self.rate <= 0:
+            return float("inf")
+        return (1 - self.tokens) / self.rate
+
+
+def resume_match_scorer(resume_text):
+    """Build a scorer that ranks jobs by ResumeTailor's overall match score
+
+    The resume is indexed once and every batch of jobs is scored with a
+    single ResumeTailor.score_jobs call. Jobs without a description are
+    scored on their title.
+
+    Args:
+        resume_text (str): Plain text of the resume
+
+    Returns:
+        callable: jobs -> list of scores
+    """
+    from backend.services.resume_tailor import ResumeTailor
+
+    tailor = ResumeTailor()
+    resume_index = tailor.index_resume(resume_text)
+
+    def score(jobs):
+        descriptions = [
+            " ".join(filter(None, [job.get("job_title") or job.get("title"), job.get("description")]))
+            for job in jobs
+        ]
+        return [float(value) for value in tailor.score_jobs(resume_index, descriptions)]
+
+    return score
+
+
+def board_for_job(job_data):
+    """Return the board class key that produced a job, e.g. 'lever' for 'lever_netflix'"""
+    job_board = job_data.get("job_board", "")
+    if job_board in BOARD_CLASSES:
+        return job_board
+    return next(
+        (name for name in sorted(BOARD_CLASSES, key=len, reverse=True) if job_board.startswith(f"{name}_")),
+        None,
+    )
+
+
+class BoardQueue:
+    """One board's pending applies, best match first, and its rate limits"""
+
+    def __init__(self, board_name, rate_per_hour, burst, max_per_day, applied_today=0):
+        self.board_name = board_name
+        self.bucket = TokenBucket(rate_per_hour, burst)
+        self.max_per_day = max_per_day
+        self.applied_today = applied_today
+        self.results = {"applied": 0, "failed": 0, "skipped": 0, "errors": 0}
+        self.stopped_reason = None
+        self._heap = []
+        self._order = itertools.count()
+
+    def push(self, job_data, score):
+        heapq.heappush(self._heap, (-score, next(self._order), job_data))
+
+    def pop(self):
+        return heapq.heappop(self._heap)[2] if self._heap else None
+
+    def __len__(self):
+        return len(self._heap)
+
+    def report(self):
+        report = dict(self.results)
+        report["remaining"] = len(self._heap)
+        report["stopped_reason"] = self.stopped_reason
+        return report
+
+
+class ApplyScheduler:
+    """Applies to queued jobs across boards within per-board and per-run limits
+
+    Jobs are queued per board and applied to in match-score order. Each
+    board runs on its own worker thread with its own leased browser, and
+    waits on a token bucket between applies so it never exceeds its hourly
+    rate or daily cap. The whole run stops after ``max_applies`` submitted
+    applications or ``max_minutes`` of wall time.
+
+    With a RunJournal every queued job and apply attempt is journaled, and
+    ``resume`` re-queues what an interrupted run left unfinished.
+
+    Configured from the ``apply_scheduler`` section of the config:
+        rate_per_hour, burst, max_per_day: Defaults for every board
+        boards: Per-board overrides of the same keys
+        max_applies, max_minutes: Run budget
+        min_score: Jobs scoring below this are not queued
+        max_workers: Boards applied to at the same time
+
+    Usage:
+        scheduler = ApplyScheduler(config, job_store=store, scorer=resume_match_scorer(resume_text))
+        scheduler.add(jobs)
+        report = scheduler.run()
+    """
+
+    def __init__(self, config, driver_pool=None, job_store=None, scorer=None, max_applies=None, max_minutes=None,
+                 journal=None):
+        self.config = config
+        self.job_store = job_store
+        self.scorer = scorer
+        self.journal = journal
+        # One bank for every board, so an answer learned on one is used by the others in the same run
+        self.answer_bank = AnswerBank.from_config(config)
+        self.selector_cache = SelectorCache.from_config(config)
+        scheduler_config = config.get("apply_scheduler", {})
+        self.settings = scheduler_config
+        self.max_applies = max_applies or scheduler_config.get("max_applies", 50)
+        self.max_seconds = (max_minutes or scheduler_config.get("max_minutes", 60)) * 60
+        self.min_score = scheduler_config.get("min_score", 0)
+        self.max_workers = scheduler_config.get("max_workers", 4)
+        self.queues = {}
+        self._queued_ids = set()
+        self.applied = 0
+        self._in_flight = 0
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._deadline = None
+
+        self._owns_pool = driver_pool is None
+        self.driver_pool = driver_pool or WebDriverPool.from_config(config, max_size=self.max_workers)
+
+    def _board_setting(self, board_name, key, default):
+        board_settings = self.settings.get("boards", {}).get(board_name, {})
+        return board_settings.get(key, self.settings.get(key, default))
+
+    def _queue_for(self, board_name):
+        if board_name not in self.queues:
+            applied_today = 0
+            if self.job_store:
+                midnight = datetime.now(timezone.utc).replace(hour=0, minute=0, second=0, microsecond=0)
+                applied_today = self.job_store.count_applications(board_name, since=midnight.isoformat())
+            self.queues[board_name] = BoardQueue(
+                board_name,
+                rate_per_hour=self._board_setting(board_name, "rate_per_hour", 20),
+                burst=self._board_setting(board_name, "burst", 3),
+                max_per_day=self._board_setting(board_name, "max_per_day", 50),
+                applied_today=applied_today,
+            )
+        return self.queues[board_name]
+
+    def add(self, jobs):
+        """Score jobs and queue them on their boards
+
+        Jobs that already carry a ``match_score`` keep it; the rest are
+        scored in one batch by the scheduler's scorer.
+
+        Args:
+            jobs (list): Scraped job dicts
+
+        Returns:
+            int: Number of jobs queued
+        """
+        unscored = [job for job in jobs if "match_score" not in job]
+        if unscored and self.scorer:
+            for job, score in zip(unscored, self.scorer(unscored)):
+                job["match_score"] = score
+
+        queued = 0
+        for job in jobs:
+            board_name = board_for_job(job)
+            if board_name is None:
+                logger.warning(f"No board can apply to {job.get('job_board')!r} jobs, skipping")
+                continue
+            score = job.get("match_score", 0)
+            job_id = job.get("job_id") or make_job_id(job)
+            if score < self.min_score or job_id in self._queued_ids:
+                continue
+            self._queued_ids.add(job_id)
+            self._queue_for(board_name).push(job, score)
+            if self.journal:
+                self.journal.record_job(job, SCORED)
+            queued += 1
+        return queued
+
+    def resume(self):
+        """Queue the jobs an interrupted run did not finish
+
+        Jobs cut off mid-apply are queued again; apply_if_new skips them if
+        the job store shows the application went through.
+
+        Returns:
+            int: Number of jobs queued
+        """
+        if not self.journal or not self.journal.interrupted:
+            return 0
+        return self.add(self.journal.pending_jobs())
+
+    def _claim_apply(self):
+        """Reserve one apply from the run budget, right before it is made"""
+        with self._lock:
+            if self.applied >= self.max_applies:
+                return False
+            self.applied += 1
+            self._in_flight += 1
+            return True
+
+    def _finish_apply(self, submitted):
+        """Settle a reserved apply; unsubmitted ones go back to the budget
+
+        Once the budget is spent and no apply is left that could hand its
+        slot back, every board is stopped instead of waiting for tokens.
+        """
+        with self._lock:
+            self._in_flight -= 1
+            if not submitted:
+                self.applied -= 1
+            if self.applied >= self.max_applies and not self._in_flight:
+                self._stop.set()
+
+    def _next_job(self, queue):
+        """Wait for the board's next token and return its best job, or None to stop"""
+        while not self._stop.is_set():
+            if not len(queue):
+                queue.stopped_reason = "queue empty"
+                return None
+            if queue.applied_today >= queue.max_per_day:
+                queue.stopped_reason = "daily cap"
+                return None
+            remaining = self._deadline - time.monotonic()
+            wait = queue.bucket.take()
+            if wait == 0:
+                return queue.pop()
+            if wait > remaining:
+                queue.stopped_reason = "time budget"
+                return None
+            self._stop.wait(wait)
+        queue.stopped_reason = queue.stopped_reason or ("apply budget" if self.applied >= self.max_applies else "stopped")
+        return None
+
+    def _run_board(self, queue):
+        """Worker: apply to one board's queue on its own leased browser"""
+        board = None
+        try:
+            board = BOARD_CLASSES[queue.board_name](
+                self.config, driver_pool=self.driver_pool, job_store=self.job_store, answer_bank=self.answer_bank,
+                selector_cache=self.selector_cache
+            )
+            if not board.ensure_logged_in():
+                logger.warning(f"Login to {queue.board_name} failed, not applying there")
+                queue.stopped_reason = "login failed"
+                return queue
+            while True:
+                job = self._next_job(queue)
+                if job is None:
+                    return queue
+                if not self._claim_apply():
+                    # Other boards' applies hold the rest of the budget; only this board stops
+                    queue.push(job, job.get("match_score", 0))
+                    queue.stopped_reason = "apply budget"
+                    return queue
+                if self.journal:
+                    self.journal.record_job(job, APPLYING)
+                error = None
+                try:
+                    result = board.apply_if_new(job)
+                except Exception as e:
+                    logger.error(f"Error applying to {job.get('url')} on {queue.board_name}: {e}")
+                    result = False
+                    error = str(e)
+                    queue.results["errors"] += 1
+                self._finish_apply(bool(result))
+                if self.journal:
+                    state = SKIPPED if result is None else (APPLIED if result else FAILED)
+                    self.journal.record_job(job, state, error=error)
+                if result is None:
+                    # Already applied earlier: costs neither a token nor budget
+                    queue.results["skipped"] += 1
+                    queue.bucket.tokens = min(queue.bucket.burst, queue.bucket.tokens + 1)
+                elif result:
+                    queue.results["applied"] += 1
+                    queue.applied_today += 1
+                else:
+                    queue.results["failed"] += 1
+        except Exception as e:
+            logger.error(f"Apply worker for {queue.board_name} failed: {e}")
+            queue.stopped_reason = f"error: {e}"
+            return queue
+        finally:
+            if board:
+                board.quit()
+
+    def run(self):
+        """Apply to every board's queue in parallel until the queues or the budget run out
+
+        Returns:
+            dict: Board name -> applied/failed/skipped/errors/remaining/stopped_reason
+        """
+        self._stop.clear()
+        self._deadline = time.monotonic() + self.max_seconds
+        queues = [queue for queue in self.queues.values() if len(queue)]
+        if not queues:
+            return {}
+
+        start = time.monotonic()
+        timer = threading.Timer(self.max_seconds, self._stop.set)
+        timer.daemon = True
+        timer.start()
+        try:
+            with ThreadPoolExecutor(max_workers=min(self.max_workers, len(queues)),
+                                    thread_name_prefix="apply") as executor:
+                list(executor.map(self._run_board, queues))
+        finally:
+            timer.cancel()
+
+        report = {queue.board_name: queue.report() for queue in self.queues.values()}
+        elapsed = time.monotonic() - start
+        logger.info(f"Apply run finished: {self.applied} applied in {elapsed:.0f}s ({report})")
+        return report
+
+    def stop(self):
+        """Ask every board to stop after its current apply"""
+        self._stop.set()
+
+    def close(self):
+        """Shut down the browser pool if the scheduler created it"""
+        if self._owns_pool:
+            self.driver_pool.close()
+        if self.answer_bank:
+            self.answer_bank.close()
+        if self.selector_cache:
+            self.selector_cache.save()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
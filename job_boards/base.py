@@ -1,26 +1,52 @@
-import os
 import logging
 from pathlib import Path
-import time
-import random
-from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import TimeoutException, NoSuchElementException
+from selenium.common.exceptions import TimeoutException
 from abc import ABC, abstractmethod
-from selenium import webdriver
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.chrome.service import Service
-from webdriver_manager.chrome import ChromeDriverManager
+import shutil
 import tempfile
+from urllib.parse import urlsplit
+from .driver_pool import create_chrome_driver
+from .answer_bank import AnswerBank
+from .extraction import extract_cards
+from .forms import DEFAULT_FORM_SELECTORS, discover_form, wait_for_form, group_questions, apply_answer
+from .http_fetch import FETCH_MODES, record_fetch
+from .job_store import make_job_id
+from .incremental import IncrementalScan
+from .pagination import Paginator
+from .search_cache import search_key
+from .selector_cache import SelectorCache
+from .sessions import SessionLoginMixin, SessionStore
+from .waits import WaitStats, PacingBudget, document_ready, card_count_stable, first_match, network_idle, wait_until
 
 logger = logging.getLogger(__name__)
 
-class JobBoardBase(ABC):
+DEFAULT_ANSWER_TEXT = "I am interested in this position and would be a great fit for the role."
+
+class JobBoardBase(SessionLoginMixin, ABC):
     """Base class for job board implementations"""
     
-    def __init__(self, config, driver=None):
+    # Boards that call wait_for_network_idle set this, so their browser records network events
+    NETWORK_IDLE_WAITS = False
+    # Containers an application form may render in, most specific first; see discover_form
+    FORM_SELECTORS = DEFAULT_FORM_SELECTORS
+    
+    def __init__(self, config, driver=None, driver_pool=None, job_store=None, session_store=None, answer_bank=None,
+                 selector_cache=None):
         self.config = config
-        self.driver = driver if driver else self._setup_webdriver()
+        self.driver_pool = driver_pool
+        self.job_store = job_store
+        self.session_store = session_store or SessionStore.from_config(config)
+        self.selector_cache = selector_cache or SelectorCache.from_config(config)
+        # Opened on the first form with questions, so searches never touch it
+        self._answer_bank = answer_bank
+        self._answer_bank_loaded = answer_bank is not None
+        self.logged_in = False
+        self._profile_dir = None
+        # The browser is started on first use, so searches served over HTTP never launch Chrome
+        self._driver = driver
+        self.wait_stats = WaitStats()
+        self.pacing = PacingBudget.from_config(config, self.wait_stats)
         self.credentials = self._get_credentials()
         self.personal_info = config.get('personal_info', {})
         
@@ -36,29 +62,30 @@ class JobBoardBase(ABC):
         if not self.resume_path.exists():
             logger.warning(f"Resume not found at {self.resume_path}")
     
+    @property
+    def driver(self):
+        """The board's WebDriver, leased or started on first access"""
+        if self._driver is None:
+            if self.driver_pool:
+                self._driver = self.driver_pool.acquire(network_log=self.NETWORK_IDLE_WAITS)
+            else:
+                self._driver = self._setup_webdriver()
+        return self._driver
+    
+    @driver.setter
+    def driver(self, value):
+        self._driver = value
+    
+    @property
+    def has_driver(self):
+        """Whether a browser has been started for this board"""
+        return self._driver is not None
+    
     def _setup_webdriver(self):
-        """Set up and configure Chrome WebDriver"""
-        chrome_options = Options()
-        
-        if self.config.get("headless", False):
-            chrome_options.add_argument("--headless")
-            
+        """Set up and configure a dedicated Chrome WebDriver"""
         # Create a unique temporary directory for Chrome user data
-        temp_dir = tempfile.mkdtemp()
-        chrome_options.add_argument(f"user-data-dir={temp_dir}")
-        chrome_options.add_argument("--profile-directory=Default")
-            
-        chrome_options.add_argument("--disable-gpu")
-        chrome_options.add_argument("--no-sandbox")
-        chrome_options.add_argument("--disable-dev-shm-usage")
-        chrome_options.add_argument("--window-size=1920,1080")
-        chrome_options.add_argument("--start-maximized")
-        chrome_options.add_argument("user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36")
-        
-        service = Service(ChromeDriverManager().install())
-        driver = webdriver.Chrome(service=service, options=chrome_options)
-        driver.implicitly_wait(10)
-        return driver
+        self._profile_dir = tempfile.mkdtemp(prefix="autojobapply-chrome-")
+        return create_chrome_driver(self.config, self._profile_dir, network_log=self.NETWORK_IDLE_WAITS)
     
     def _get_credentials(self):
         """Get credentials for the job board"""
@@ -100,10 +127,71 @@ class JobBoardBase(ABC):
         """Apply to a specific job"""
         pass
     
+    def incremental_scan(self, keywords, location, scope=None):
+        """Return an IncrementalScan for this query, or None when incremental mode is off
+        
+        Incremental mode needs a job store for its high-water marks and is on
+        by default; set ``incremental.enabled`` to false to scrape everything.
+        
+        Args:
+            keywords (str or list): Search keywords
+            location (str): Search location
+            scope (str): Extra key part for boards that search several sites, e.g. a company
+        """
+        incremental_config = self.config.get("incremental", {})
+        if not self.job_store or not incremental_config.get("enabled", True):
+            return None
+        query_key = "|".join(search_key(self.board_name, keywords, location, {"scope": scope} if scope else None))
+        return IncrementalScan(
+            self.job_store,
+            self.board_name,
+            query_key,
+            mark_size=incremental_config.get("mark_size", 10),
+            known_streak=incremental_config.get("known_streak", 5),
+            backlog_days=incremental_config.get("backlog_days", 30),
+        )
+    
+    def _get_unique_job_id(self, job_data):
+        """Return a stable id for a scraped job, used for dedup across runs"""
+        return make_job_id(job_data)
+    
+    def apply_if_new(self, job_data):
+        """Apply to a job unless the job store says it was already applied to
+        
+        The check runs before any navigation, so known jobs cost a single
+        indexed lookup instead of a page load.
+        
+        Returns:
+            bool or None: The apply_to_job result, or None if skipped
+        """
+        job_id = job_data.get("job_id") or self._get_unique_job_id(job_data)
+        if self.job_store and self.job_store.already_applied(job_id):
+            logger.info(f"Skipping {job_id}, already applied")
+            return None
+        
+        success = self.apply_to_job(job_data)
+        if self.job_store:
+            self.job_store.record_application(job_data, "applied" if success else "failed")
+        return success
+    
     def quit(self):
-        """Close the browser"""
-        if hasattr(self, 'driver'):
-            self.driver.quit()
+        """Close the browser, or hand it back to the pool it was leased from"""
+        if self._driver is None:
+            return
+        if self.logged_in:
+            # Keep cookies the site refreshed during this run
+            self.save_session()
+        if self.selector_cache:
+            self.selector_cache.save(self.board_name)
+        if self.driver_pool:
+            self.driver_pool.release(self._driver)
+        else:
+            self._driver.quit()
+        self._driver = None
+        self.logged_in = False
+        if self._profile_dir:
+            shutil.rmtree(self._profile_dir, ignore_errors=True)
+            self._profile_dir = None
     
     def _handle_captcha(self):
         """Stub for CAPTCHA handling. Returns False by default."""
@@ -130,6 +218,62 @@ class JobBoardBase(ABC):
             "password": platform_creds.get("password")
         }
     
+    def _get_config_value(self, path, default=None):
+        """Look up a dotted config path such as 'job_search.keywords'
+        
+        Args:
+            path (str): Dot separated keys into the config
+            default: Value returned when any key along the path is missing
+            
+        Returns:
+            The config value, or default
+        """
+        value = self.config
+        for key in path.split("."):
+            if not isinstance(value, dict) or key not in value:
+                return default
+            value = value[key]
+        return value
+    
+    @property
+    def fetch_mode(self):
+        """How searches are fetched: 'auto' (HTTP, then Selenium), 'http' or 'selenium'"""
+        mode = self._get_config_value(f"job_boards.{self.board_name}.fetch_mode", "auto")
+        if mode not in FETCH_MODES:
+            logger.warning(f"Unknown fetch_mode {mode!r} for {self.board_name}, using 'auto'")
+            return "auto"
+        return mode
+    
+    def _http_first(self, http_search, selenium_search):
+        """Serve a search over plain HTTP, falling back to the browser
+        
+        Args:
+            http_search (callable): Returns a job list, or None when the page
+                needs JavaScript to render its listings; None skips HTTP
+            selenium_search (callable): The browser-driven search
+            
+        Returns:
+            list: Jobs from whichever path served the search
+        """
+        mode = self.fetch_mode
+        if mode != "selenium" and http_search is not None:
+            try:
+                jobs = http_search()
+            except Exception as e:
+                logger.info(f"HTTP fetch failed for {self.board_name}: {e}")
+                jobs = None
+            if jobs is not None:
+                record_fetch(self.board_name, "http")
+                return jobs
+            if mode == "http":
+                record_fetch(self.board_name, "http_failed")
+                return []
+            logger.info(f"{self.board_name} needs a browser, falling back to Selenium")
+            record_fetch(self.board_name, "http_fallback")
+        
+        record_fetch(self.board_name, "selenium")
+        return selenium_search()
+    
     def random_delay(self, min_seconds=1, max_seconds=3):
         """Add a random delay to simulate human behavior
         
@@ -137,8 +281,22 @@ class JobBoardBase(ABC):
             min_seconds (float): Minimum delay in seconds
             max_seconds (float): Maximum delay in seconds
         """
-        delay = random.uniform(min_seconds, max_seconds)
-        time.sleep(delay)
+        self.human_pause(min_seconds, max_seconds)
+    
+    def human_pause(self, min_seconds, max_seconds):
+        """Deliberate throttling, drawn from the configurable pacing budget
+        
+        Unlike the wait_for_* helpers this never waits on the page; it only
+        exists to keep interaction timing human-like.
+        
+        Returns:
+            float: Seconds actually paused
+        """
+        return self.pacing.pause(min_seconds, max_seconds)
+    
+    def wait_report(self):
+        """Return how much of this board's run was DOM waiting versus throttling"""
+        return self.wait_stats.report()
     
     def wait_for_element(self, by, value, timeout=10, condition="presence"):
         """Wait for an element to be present/visible/clickable
@@ -157,14 +315,329 @@ class JobBoardBase(ABC):
         """
         if not self.driver:
             raise ValueError("WebDriver not initialized")
-            
-        wait = WebDriverWait(self.driver, timeout)
         
         if condition == "presence":
-            return wait.until(EC.presence_of_element_located((by, value)))
+            expected = EC.presence_of_element_located((by, value))
         elif condition == "visibility":
-            return wait.until(EC.visibility_of_element_located((by, value)))
+            expected = EC.visibility_of_element_located((by, value))
         elif condition == "clickable":
-            return wait.until(EC.element_to_be_clickable((by, value)))
+            expected = EC.element_to_be_clickable((by, value))
         else:
-            raise ValueError(f"Unknown condition: {condition}")
\ No newline at end of file
+            raise ValueError(f"Unknown condition: {condition}")
+        
+        with self.wait_stats.dom_wait():
+            return wait_until(self.driver, expected, timeout)
+    
+    def _wait_for_element(self, by, value, timeout=10):
+        """Like wait_for_element, but returns None instead of raising on timeout"""
+        try:
+            return self.wait_for_element(by, value, timeout=timeout)
+        except TimeoutException:
+            return None
+    
+    def _wait_for_clickable(self, by, value, timeout=10):
+        """Wait for a clickable element, returning None on timeout"""
+        try:
+            return self.wait_for_element(by, value, timeout=timeout, condition="clickable")
+        except TimeoutException:
+            return None
+    
+    def find_first(self, key, selectors, timeout=10):
+        """Wait for the first of several fallback selectors to match a visible, enabled element
+        
+        All candidates are polled together, so a missing one costs no
+        timeout. The candidate that matched last time on this domain is
+        tried first, and the selector cache learns from the outcome.
+        
+        Args:
+            key (str): Name of what is looked up, e.g. 'apply_button'
+            selectors (list): Candidate CSS selectors, most specific first
+            timeout (int): Maximum wait time in seconds
+            
+        Returns:
+            WebElement: The matched element, or None if no candidate matched
+        """
+        domain = urlsplit(self.driver.current_url).netloc
+        if self.selector_cache:
+            selectors = self.selector_cache.order(self.board_name, domain, key, selectors)
+        try:
+            with self.wait_stats.dom_wait():
+                index, element = wait_until(self.driver, first_match(selectors), timeout)
+        except TimeoutException:
+            index, element = None, None
+        if self.selector_cache:
+            self.selector_cache.record(self.board_name, domain, key, selectors[index] if element else None)
+        return element
+    
+    def wait_for_page_ready(self, timeout=15):
+        """Wait until document.readyState is 'complete'
+        
+        Returns:
+            bool: True if the page finished loading within timeout
+        """
+        try:
+            with self.wait_stats.dom_wait():
+                return wait_until(self.driver, document_ready, timeout)
+        except TimeoutException:
+            logger.warning(f"Page not ready after {timeout}s: {self.driver.current_url}")
+            return False
+    
+    def wait_for_network_idle(self, idle_time=0.5, timeout=10, since=None):
+        """Wait until no network requests have been in flight for idle_time seconds
+        
+        Needs NETWORK_IDLE_WAITS on the board; without the network log this
+        waits for document readiness instead.
+        
+        Args:
+            idle_time (float): Seconds without requests in flight
+            timeout (int): Maximum wait time in seconds
+            since (float): time.time() of the action being waited on; requests
+                started earlier are ignored. Defaults to now.
+        
+        Returns:
+            bool: True if the network went idle within timeout
+        """
+        try:
+            with self.wait_stats.dom_wait():
+                return wait_until(self.driver, network_idle(idle_time, since=since), timeout)
+        except TimeoutException:
+            return False
+    
+    def wait_for_cards(self, by, value, timeout=10, settle=0.5, min_count=1):
+        """Wait until job cards are rendered and their count has stopped growing
+        
+        Args:
+            by: Selenium By locator strategy
+            value: The card locator value
+            timeout (int): Maximum wait time in seconds
+            settle (float): Seconds the count must stay unchanged
+            min_count (int): Minimum number of cards required
+            
+        Returns:
+            list: The card elements, or whatever is present when the wait times out
+        """
+        try:
+            with self.wait_stats.dom_wait():
+                return wait_until(self.driver, card_count_stable((by, value), settle, min_count), timeout)
+        except TimeoutException:
+            return self.driver.find_elements(by, value)
+    
+    def wait_for_url_contains(self, fragments, timeout=10):
+        """Wait until the current URL contains any of the given fragments
+        
+        Returns:
+            str or None: The matching fragment, or None on timeout
+        """
+        if isinstance(fragments, str):
+            fragments = [fragments]
+        
+        def url_matches(driver):
+            url = driver.current_url
+            return next((fragment for fragment in fragments if fragment in url), False)
+        
+        try:
+            with self.wait_stats.dom_wait():
+                return wait_until(self.driver, url_matches, timeout)
+        except TimeoutException:
+            return None
+    
+    def extract_cards(self, card_selector, fields, limit=None, root=None):
+        """Read every job card's fields in a single execute_script round trip
+        
+        Args:
+            card_selector (str): CSS selector matching each job card
+            fields (dict): Output key -> selector or (selector, attribute[, required])
+            limit (int): Maximum number of cards to return
+            root (WebElement): Optional element to search within
+            
+        Returns:
+            list: One dict per complete card
+        """
+        return extract_cards(self.driver, card_selector, fields, limit=limit, root=root)
+    
+    def discover_form(self, root_selector=None, timeout=10):
+        """Wait for the application form to render, then read every field in one round trip
+        
+        The form is looked for under root_selector, or else under the board's
+        FORM_SELECTORS. If none of them shows a field within timeout, the
+        whole page is read.
+        
+        Args:
+            root_selector (str): CSS selector of the form container
+            timeout (int): Maximum wait for the form in seconds
+            
+        Returns:
+            dict: {"fields": [...], "submit": WebElement or None}, see forms.discover_form
+        """
+        root_selectors = [root_selector] if root_selector else self.FORM_SELECTORS
+        with self.wait_stats.dom_wait():
+            root = wait_for_form(self.driver, root_selectors, timeout)
+        if root is None:
+            logger.warning(f"No application form rendered under {root_selectors}, reading the whole page")
+        return discover_form(self.driver, root)
+    
+    def _applicant_values(self):
+        """Values for each standard field kind, from personal_info and the board credentials"""
+        personal_info = self.config.get("personal_info", {})
+        name = personal_info.get("name", "")
+        first_name, _, last_name = name.partition(" ")
+        return {
+            "name": name,
+            "first_name": personal_info.get("first_name", first_name),
+            "last_name": personal_info.get("last_name", last_name),
+            "email": personal_info.get("email") or self.credentials.get("email", ""),
+            "phone": personal_info.get("phone", ""),
+            "location": personal_info.get("location", ""),
+            "linkedin": personal_info.get("linkedin", ""),
+        }
+    
+    def fill_form(self, fields):
+        """Fill the standard applicant fields of a discovered form
+        
+        Text fields are matched to personal_info by their kind, the first
+        resume file input gets the resume, and a cover letter input (or a
+        second file input) gets the cover letter if use_cover_letter is set.
+        Fields that already hold the right value are left alone.
+        
+        Args:
+            fields (list): Field dicts from discover_form
+            
+        Returns:
+            list: Kinds of the fields that were filled, not counting the cover letter
+        """
+        values = self._applicant_values()
+        filled = []
+        file_fields = [field for field in fields if field["type"] == "file"]
+        resume_field = next((field for field in file_fields if field["kind"] == "resume"), None)
+        
+        for field in fields:
+            kind = field["kind"]
+            if field["type"] == "file" or not values.get(kind):
+                continue
+            if field["value"] != values[kind]:
+                field["element"].clear()
+                field["element"].send_keys(values[kind])
+            logger.info(f"Filled {kind} field")
+            filled.append(kind)
+        
+        if resume_field:
+            resume_field["element"].send_keys(str(self.resume_path.absolute()))
+            logger.info("Uploaded resume")
+            filled.append("resume")
+        
+        if self._get_config_value("use_cover_letter", True):
+            cover_field = next((field for field in file_fields if field["kind"] == "cover_letter"), None)
+            if cover_field is None and len(file_fields) > 1:
+                cover_field = next(field for field in file_fields if field is not resume_field)
+            if cover_field:
+                cover_field["element"].send_keys(str(self.cover_letter_path.absolute()))
+                logger.info("Uploaded cover letter")
+        return filled
+    
+    @property
+    def answer_bank(self):
+        """The shared screening-question AnswerBank, or None if it is disabled"""
+        if not self._answer_bank_loaded:
+            self._answer_bank = AnswerBank.from_config(self.config)
+            self._answer_bank_loaded = True
+        return self._answer_bank
+    
+    def answer_questions(self, fields):
+        """Answer a form's screening questions from the answer bank
+        
+        Known questions are answered straight from the bank. A question the
+        board already filled in, e.g. from an earlier application, teaches
+        the bank its answer. Anything else is recorded as pending; if it is
+        required and answer_bank.fallback is on (the default), it gets the
+        first option, a ticked box or answer_bank.default_text so the
+        application can still be sent.
+        
+        Args:
+            fields (list): Field dicts from discover_form
+            
+        Returns:
+            list: Texts of the questions that had no stored answer
+        """
+        bank = self.answer_bank
+        bank_config = self.config.get("answer_bank", {})
+        unanswered = []
+        for question in group_questions(fields):
+            text = question["text"]
+            try:
+                answer = bank.lookup(text) if bank else None
+                if answer is not None and apply_answer(question, answer):
+                    continue
+                if question["value"]:
+                    if bank:
+                        bank.learn(text, question["value"])
+                    continue
+                
+                unanswered.append(text)
+                if bank:
+                    bank.record_pending(text, question["type"], question["options"], self.board_name)
+                if not question["required"] or not bank_config.get("fallback", True):
+                    continue
+                if question["options"]:
+                    apply_answer(question, question["options"][0])
+                elif question["type"] == "checkbox":
+                    apply_answer(question, "Yes")
+                elif question["type"] == "textarea":
+                    apply_answer(question, bank_config.get("default_text", DEFAULT_ANSWER_TEXT))
+            except Exception as e:
+                logger.warning(f"Error answering question {text!r}: {e}")
+        
+        if unanswered:
+            logger.info(f"No stored answer for {len(unanswered)} questions: {unanswered}")
+        return unanswered
+    
+    def paginate(self, card_selector, fields, page_url=None, next_selector=None, scroll=False, scroll_root=None,
+                 max_results=None, scan=None):
+        """Yield job cards from the current result page and the pages after it
+        
+        Limits default to the ``pagination`` config section: max_results (100),
+        max_pages (5), max_scrolls (10) and prefetch (true).
+        
+        Args:
+            card_selector (str): CSS selector matching each job card
+            fields (dict): Output key -> selector or (selector, attribute[, required])
+            page_url (callable): page_index -> URL of that page, or None after the last
+            next_selector (str): CSS selector of the "next page" link or button
+            scroll (bool): Load more cards by scrolling instead of changing pages
+            scroll_root (str): CSS selector of the scrolling list, if not the window
+            max_results (int): Stop after this many cards
+            scan (IncrementalScan): Stop once the scan is done
+            
+        Returns:
+            Paginator: Iterable of card dicts; read stopped_reason afterwards
+        """
+        pagination_config = self.config.get("pagination", {})
+        return Paginator(
+            self,
+            card_selector,
+            fields,
+            page_url=page_url,
+            next_selector=next_selector,
+            scroll=scroll,
+            scroll_root=scroll_root,
+            max_results=max_results or pagination_config.get("max_results", 100),
+            max_pages=pagination_config.get("max_pages", 5),
+            max_scrolls=pagination_config.get("max_scrolls", 10),
+            prefetch=pagination_config.get("prefetch", True),
+            scan=scan,
+        )
+    
+    def wait_for_page_text(self, texts, timeout=10):
+        """Wait until the page source contains any of the given (lowercase) texts
+        
+        Returns:
+            str or None: The text that appeared, or None on timeout
+        """
+        def text_present(driver):
+            page_text = driver.page_source.lower()
+            return next((text for text in texts if text in page_text), False)
+        
+        try:
+            with self.wait_stats.dom_wait():
+                return wait_until(self.driver, text_present, timeout)
+        except TimeoutException:
+            return None
@@ -1,17 +1,24 @@
 """
 BuiltIn job board implementation
 """
-import time
 import logging
 from selenium.webdriver.common.by import By
-from selenium.common.exceptions import NoSuchElementException
 from .base import JobBoardBase
+from .http_fetch import fetch_html, extract_cards_from_html
 
 logger = logging.getLogger(__name__)
 
 class BuiltInBoard(JobBoardBase):
     """BuiltIn job board implementation"""
     
+    CARD_SELECTOR = "div.job-card"
+    CARD_FIELDS = {
+        "job_title": "h2.job-title",
+        "company": "div.company-name",
+        "location": "div.location",
+        "url": ("a.job-link", "href"),
+    }
+    
     @property
     def board_name(self):
         return "builtin"
@@ -46,41 +53,46 @@ class BuiltInBoard(JobBoardBase):
             # Build search URL
             search_url = f"https://builtin.com/jobs{location_str}/{keyword_str}"
             logger.info(f"Searching BuiltIn with URL: {search_url}")
-            self.driver.get(search_url)
-            
-            # Wait for job listings to load
-            time.sleep(3)
             
-            # Find all job cards
-            job_cards = self.driver.find_elements(By.CSS_SELECTOR, "div.job-card")
+            # BuiltIn listings are server-rendered, so a plain GET usually suffices
+            jobs = self._http_first(
+                lambda: self._search_http(search_url),
+                lambda: self._search_selenium(search_url),
+            )
             
-            for job in job_cards:
-                try:
-                    title_elem = job.find_element(By.CSS_SELECTOR, "h2.job-title")
-                    company_elem = job.find_element(By.CSS_SELECTOR, "div.company-name")
-                    location_elem = job.find_element(By.CSS_SELECTOR, "div.location")
-                    link_elem = job.find_element(By.CSS_SELECTOR, "a.job-link")
-                    
-                    job_data = {
-                        "job_title": title_elem.text.strip(),
-                        "company": company_elem.text.strip(),
-                        "location": location_elem.text.strip(),
-                        "url": link_elem.get_attribute("href"),
-                        "job_board": self.board_name
-                    }
-                    job_data["job_id"] = self._get_unique_job_id(job_data)
-                    jobs.append(job_data)
-                    
-                except NoSuchElementException:
-                    continue
-                except Exception as e:
-                    logger.error(f"Error parsing BuiltIn job: {e}")
+            scan = self.incremental_scan(keywords, location)
+            if scan:
+                jobs = list(scan.filter(jobs))
+                jobs.extend(scan.commit())
             
         except Exception as e:
             logger.error(f"Error searching BuiltIn jobs: {e}")
         
         return jobs
     
+    def _search_http(self, search_url):
+        """Parse the listings from the raw HTML, or None if they need JavaScript"""
+        html = fetch_html(search_url)
+        cards = extract_cards_from_html(html, self.CARD_SELECTOR, self.CARD_FIELDS, base_url=search_url)
+        if not cards:
+            return None
+        return [self._finish_job(job_data) for job_data in cards]
+    
+    def _search_selenium(self, search_url):
+        """Load the listings in the browser"""
+        self.driver.get(search_url)
+        
+        # Wait for job listings to load
+        self.wait_for_cards(By.CSS_SELECTOR, self.CARD_SELECTOR)
+        
+        # Read every card in one round trip
+        return [self._finish_job(job_data) for job_data in self.extract_cards(self.CARD_SELECTOR, self.CARD_FIELDS)]
+    
+    def _finish_job(self, job_data):
+        job_data["job_board"] = self.board_name
+        job_data["job_id"] = self._get_unique_job_id(job_data)
+        return job_data
+    
     def apply_to_job(self, job_data):
         """Apply to a job on BuiltIn"""
         try:
@@ -96,35 +108,21 @@ class BuiltInBoard(JobBoardBase):
             apply_button.click()
             
             # Wait for application form
-            time.sleep(2)
+            self.wait_for_page_ready()
             
-            # Fill out application form
-            try:
-                # Fill name if required
-                name_field = self._wait_for_element(By.CSS_SELECTOR, "input[name='name']")
-                if name_field:
-                    name_field.send_keys(self.config.get("personal_info", {}).get("name", ""))
-                
-                # Fill email if required
-                email_field = self._wait_for_element(By.CSS_SELECTOR, "input[name='email']")
-                if email_field:
-                    email_field.send_keys(self.credentials.get("email", ""))
-                
-                # Upload resume if required
-                resume_upload = self._wait_for_element(By.CSS_SELECTOR, "input[type='file']")
-                if resume_upload:
-                    resume_upload.send_keys(str(self.resume_path.absolute()))
-                
-                # Submit application
-                submit_button = self._wait_for_clickable(By.CSS_SELECTOR, "button[type='submit']")
-                if submit_button:
-                    submit_button.click()
-                    time.sleep(3)
-                    return True
-                
-            except NoSuchElementException:
-                logger.warning("Could not find expected form elements on BuiltIn")
-                return False
+            # Read the whole form in one round trip, then fill the fields it actually has
+            form = self.discover_form()
+            self.fill_form(form["fields"])
+            self.answer_questions(form["fields"])
+            
+            # Submit application
+            if form["submit"]:
+                form["submit"].click()
+                self.wait_for_page_ready()
+                return True
+            
+            logger.warning("Could not find submit button")
+            return False
                 
         except Exception as e:
             logger.error(f"Error during BuiltIn application: {e}")
@@ -144,4 +142,4 @@ class BuiltInBoard(JobBoardBase):
                 if i == max_retries - 1:
                     logger.error(f"Failed to click element after {max_retries} tries: {e}")
                     return False
-                time.sleep(1) 
\ No newline at end of file
+                self.human_pause(0.5, 1)
\ No newline at end of file
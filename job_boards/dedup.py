@@ -0,0 +1,217 @@
+"""
+Cross-board duplicate job detection with MinHash and LSH
+"""
+import hashlib
+import logging
+import random
+import re
+from collections import defaultdict
+from .job_store import job_fields, normalize_company, normalize_title
+
+logger = logging.getLogger(__name__)
+
+_MERSENNE_PRIME = (1 << 61) - 1
+_MAX_HASH = (1 << 32) - 1
+
+# Title words that boards abbreviate differently
+_TITLE_SYNONYMS = {
+    "sr": "senior",
+    "jr": "junior",
+    "eng": "engineer",
+    "engr": "engineer",
+    "dev": "developer",
+    "swe": "software engineer",
+    "mgr": "manager",
+    "ii": "2",
+    "iii": "3",
+    "iv": "4",
+}
+
+# Title words that make two otherwise equal titles different positions
+_LEVEL_WORDS = {"junior", "senior", "staff", "lead", "principal", "intern", "1", "2", "3", "4", "5"}
+
+# Location words that only say which country, so "Austin, TX" matches "Austin, TX, United States"
+_LOCATION_NOISE = re.compile(r"(united states( of america)?|usa|us|united kingdom|uk)")
+
+# Boards whose copy of a posting is preferred as the canonical one
+_SOURCE_PREFERENCE = ("direct_company", "lever")
+
+_TITLE_NOISE = re.compile(r"\b(remote|hybrid|onsite|on site|full time|part time|contract)\b")
+
+
+def canonical_title(title):
+    """Normalize a title and expand common abbreviations"""
+    words = normalize_title(_TITLE_NOISE.sub(" ", (title or "").lower())).split()
+    return " ".join(_TITLE_SYNONYMS.get(word, word) for word in words)
+
+
+def title_levels(title):
+    """The seniority and level words of a title, e.g. {'senior'} or {'2'}"""
+    return {word for word in canonical_title(title).split() if word in _LEVEL_WORDS}
+
+
+def normalize_location(location):
+    """Lowercase a location and drop punctuation and country names"""
+    text = _LOCATION_NOISE.sub(" ", (location or "").lower())
+    return " ".join(normalize_title(text).split())
+
+
+def same_location(left, right):
+    """Whether two normalized locations name the same place; one may be more detailed"""
+    if not left or not right:
+        return left == right
+    left_words, right_words = set(left.split()), set(right.split())
+    return left_words <= right_words or right_words <= left_words
+
+
+def shingles(job_data, size=3):
+    """Character shingles of the normalized company plus title word tokens"""
+    fields = job_fields(job_data)
+    company = normalize_company(fields["company"])
+    title = canonical_title(fields["position"])
+    grams = {f"c:{company}"} if company else set()
+    grams.update(f"w:{word}" for word in title.split())
+    padded = f" {title} "
+    grams.update(f"g:{padded[i:i + size]}" for i in range(max(len(padded) - size + 1, 1)))
+    return grams
+
+
+def _hash_shingle(shingle):
+    return int.from_bytes(hashlib.blake2b(shingle.encode("utf-8"), digest_size=4).digest(), "little")
+
+
+class MinHasher:
+    """Computes fixed-length MinHash signatures"""
+
+    def __init__(self, num_perm=64, seed=1):
+        rng = random.Random(seed)
+        self.num_perm = num_perm
+        self._perms = [
+            (rng.randrange(1, _MERSENNE_PRIME), rng.randrange(0, _MERSENNE_PRIME))
+            for _ in range(num_perm)
+        ]
+
+    def signature(self, shingle_set):
+        hashes = [_hash_shingle(shingle) for shingle in shingle_set] or [0]
+        return tuple(
+            min(((a * h + b) % _MERSENNE_PRIME) & _MAX_HASH for h in hashes)
+            for a, b in self._perms
+        )
+
+
+def estimated_similarity(sig_a, sig_b):
+    """Estimate Jaccard similarity from two MinHash signatures"""
+    return sum(1 for a, b in zip(sig_a, sig_b) if a == b) / len(sig_a)
+
+
+class JobDeduplicator:
+    """Collapses the same posting scraped from several boards into one job
+
+    Jobs are bucketed by banded LSH over their MinHash signatures, so only
+    jobs sharing a band are compared, and candidate pairs are confirmed by
+    their estimated similarity, an exact normalized company match, matching
+    locations and the same seniority words (Senior, Staff, II, ...). Two
+    jobs from the same board are never merged; repeats within a board are
+    the job store's concern.
+
+    The canonical job keeps its own fields plus a ``sources`` list with the
+    board, URL and job_id of every copy.
+    """
+
+    def __init__(self, threshold=0.7, num_perm=64, bands=16):
+        if num_perm % bands:
+            raise ValueError("num_perm must be divisible by bands")
+        self.threshold = threshold
+        self.bands = bands
+        self.rows = num_perm // bands
+        self.hasher = MinHasher(num_perm)
+
+    def _candidate_pairs(self, signatures):
+        buckets = defaultdict(list)
+        for index, signature in enumerate(signatures):
+            for band in range(self.bands):
+                start = band * self.rows
+                buckets[(band, signature[start:start + self.rows])].append(index)
+
+        pairs = set()
+        for members in buckets.values():
+            if len(members) < 2:
+                continue
+            for i, left in enumerate(members):
+                for right in members[i + 1:]:
+                    pairs.add((left, right))
+        return pairs
+
+    def _canonical(self, group):
+        def rank(job_data):
+            board = job_fields(job_data)["job_board"]
+            preferred = any(board.startswith(source) for source in _SOURCE_PREFERENCE)
+            filled = sum(1 for value in job_fields(job_data).values() if value)
+            return (preferred, filled)
+
+        canonical = dict(max(group, key=rank))
+        canonical["sources"] = [
+            {
+                "job_board": job_fields(job_data)["job_board"],
+                "url": job_fields(job_data)["url"],
+                "job_id": job_data.get("job_id"),
+            }
+            for job_data in group
+        ]
+        return canonical
+
+    def dedupe(self, jobs):
+        """Return one canonical job per distinct posting, in first-seen order
+
+        Args:
+            jobs (list): Scraped job dicts from any mix of boards
+
+        Returns:
+            list: Canonical jobs, each with a ``sources`` list
+        """
+        if not jobs:
+            return []
+
+        signatures = [self.hasher.signature(shingles(job_data)) for job_data in jobs]
+        fields = [job_fields(job_data) for job_data in jobs]
+        companies = [normalize_company(job["company"]) for job in fields]
+        locations = [normalize_location(job["location"]) for job in fields]
+        levels = [title_levels(job["position"]) for job in fields]
+
+        parent = list(range(len(jobs)))
+        # Boards already in each group, so no group ever holds two jobs from one board
+        boards = [{job["job_board"]} for job in fields]
+
+        def find(index):
+            while parent[index] != index:
+                parent[index] = parent[parent[index]]
+                index = parent[index]
+            return index
+
+        for left, right in self._candidate_pairs(signatures):
+            if companies[left] != companies[right] or levels[left] != levels[right]:
+                continue
+            if not same_location(locations[left], locations[right]):
+                continue
+            if estimated_similarity(signatures[left], signatures[right]) < self.threshold:
+                continue
+            root_left, root_right = find(left), find(right)
+            if root_left == root_right or boards[root_left] & boards[root_right]:
+                continue
+            root, child = min(root_left, root_right), max(root_left, root_right)
+            parent[child] = root
+            boards[root] |= boards[child]
+
+        groups = defaultdict(list)
+        for index, job_data in enumerate(jobs):
+            groups[find(index)].append(job_data)
+
+        deduped = [self._canonical(groups[root]) for root in sorted(groups)]
+        if len(deduped) < len(jobs):
+            logger.info(f"Collapsed {len(jobs) - len(deduped)} duplicate jobs across boards")
+        return deduped
+
+
+def dedupe_jobs(jobs, threshold=0.7):
+    """Convenience wrapper around JobDeduplicator"""
+    return JobDeduplicator(threshold=threshold).dedupe(jobs)
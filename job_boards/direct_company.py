@@ -1,17 +1,23 @@
 """
 Direct company job board implementation
 """
-import time
 import logging
 from selenium.webdriver.common.by import By
-from selenium.common.exceptions import NoSuchElementException
 from .base import JobBoardBase
+from .http_fetch import fetch_html, extract_cards_from_html
 
 logger = logging.getLogger(__name__)
 
 class DirectCompanyBoard(JobBoardBase):
     """Direct company job board implementation"""
     
+    # Apply button candidates, tried together; the generic submit button comes last
+    APPLY_SELECTORS = [
+        "button.apply-button",
+        "a.apply-button",
+        "button[type='submit']",
+    ]
+    
     @property
     def board_name(self):
         return "direct_company"
@@ -57,7 +63,8 @@ class DirectCompanyBoard(JobBoardBase):
                 "title_selector": "h3.job-title",
                 "location_selector": "span.job-location",
                 "link_selector": "a.job-link",
-                "company_name": "Stripe"
+                "company_name": "Stripe",
+                "server_rendered": True
             },
             "gitlab": {
                 "url": "https://about.gitlab.com/jobs/all-jobs/",
@@ -65,45 +72,66 @@ class DirectCompanyBoard(JobBoardBase):
                 "title_selector": "h3.job-title",
                 "location_selector": "span.job-location",
                 "link_selector": "a.job-link",
-                "company_name": "GitLab"
+                "company_name": "GitLab",
+                "server_rendered": True
             }
         }
         
         for company_key, company_data in companies.items():
             try:
                 logger.info(f"Searching jobs at {company_key}")
-                self.driver.get(company_data["url"])
-                
-                # Check for CAPTCHA
-                if self._handle_captcha():
-                    continue
+                fields = {
+                    "job_title": company_data["title_selector"],
+                    "location": company_data["location_selector"],
+                    "url": (company_data["link_selector"], "href"),
+                }
                 
-                time.sleep(5)  # Wait for page to load
+                # Server-rendered career sites are tried over plain HTTP first
+                http_search = None
+                if company_data.get("server_rendered"):
+                    http_search = lambda: self._search_http(company_data, fields)
+                cards = self._http_first(http_search, lambda: self._search_selenium(company_data, fields))
                 
-                job_elements = self.driver.find_elements(By.CSS_SELECTOR, company_data["job_selector"])
+                scan = self.incremental_scan(keywords, location, scope=company_key)
+                for job_data in cards:
+                    job_data["company"] = company_data["company_name"]
+                    job_data["job_board"] = f"{self.board_name}_{company_key}"
+                    job_data["job_id"] = self._get_unique_job_id(job_data)
+                    if scan and not scan.accept(job_data):
+                        if scan.done:
+                            break
+                        continue
+                    jobs.append(job_data)
                 
-                for job_element in job_elements[:5]:  # Limit to 5 jobs per company to avoid overloading
-                    try:
-                        title_elem = job_element.find_element(By.CSS_SELECTOR, company_data["title_selector"])
-                        location_elem = job_element.find_element(By.CSS_SELECTOR, company_data["location_selector"])
-                        link_elem = job_element.find_element(By.CSS_SELECTOR, company_data["link_selector"])
-                        
-                        job_data = {
-                            "job_title": title_elem.text.strip(),
-                            "company": company_data["company_name"],
-                            "location": location_elem.text.strip(),
-                            "url": link_elem.get_attribute("href"),
-                            "job_board": f"{self.board_name}_{company_key}"
-                        }
-                        job_data["job_id"] = self._get_unique_job_id(job_data)
-                        jobs.append(job_data)
-                    except Exception as e:
-                        logger.error(f"Error parsing {company_key} job: {e}")
+                if scan:
+                    jobs.extend(scan.commit())
             except Exception as e:
                 logger.error(f"Error searching {company_key} jobs: {e}")
         
         return jobs
     
+    def _search_http(self, company_data, fields):
+        """Parse a career page's static HTML, or None if it needs JavaScript"""
+        html = fetch_html(company_data["url"])
+        cards = extract_cards_from_html(
+            html, company_data["job_selector"], fields, limit=5, base_url=company_data["url"]
+        )
+        return cards or None
+    
+    def _search_selenium(self, company_data, fields):
+        """Load a career page in the browser"""
+        self.driver.get(company_data["url"])
+        
+        # Check for CAPTCHA
+        if self._handle_captcha():
+            return []
+        
+        # Wait for job listings to load
+        self.wait_for_cards(By.CSS_SELECTOR, company_data["job_selector"])
+        
+        # Read every card in one round trip, limited to 5 jobs per company to avoid overloading
+        return self.extract_cards(company_data["job_selector"], fields, limit=5)
+    
     def apply_to_job(self, job_data):
         """Apply to a job on a direct company site"""
         try:
@@ -113,53 +141,28 @@ class DirectCompanyBoard(JobBoardBase):
             if self._handle_captcha():
                 return False
             
-            # Wait for and click Apply button
-            apply_button = self._wait_for_clickable(
-                By.CSS_SELECTOR, 
-                "button[type='submit'], button.apply-button, a.apply-button"
-            )
+            # Wait for and click Apply button; each company's domain learns its own selector
+            apply_button = self.find_first("apply_button", self.APPLY_SELECTORS)
             if not apply_button:
                 return False
             apply_button.click()
             
             # Wait for application form
-            time.sleep(2)
+            self.wait_for_page_ready()
             
-            # Fill out application form
-            try:
-                # Fill name if required
-                name_field = self._wait_for_element(By.CSS_SELECTOR, "input[name='name'], input[name='fullName']")
-                if name_field:
-                    name_field.send_keys(self._get_config_value("personal_info.name", ""))
-                
-                # Fill email if required
-                email_field = self._wait_for_element(By.CSS_SELECTOR, "input[name='email'], input[type='email']")
-                if email_field:
-                    email_field.send_keys(self._get_config_value("personal_info.email", ""))
-                
-                # Fill phone if required
-                phone_field = self._wait_for_element(By.CSS_SELECTOR, "input[name='phone'], input[name='telephone']")
-                if phone_field:
-                    phone_field.send_keys(self._get_config_value("personal_info.phone", ""))
-                
-                # Upload resume if required
-                resume_upload = self._wait_for_element(By.CSS_SELECTOR, "input[type='file']")
-                if resume_upload:
-                    resume_upload.send_keys(str(self.resume_path.absolute()))
-                
-                # Submit application
-                submit_button = self._wait_for_clickable(
-                    By.CSS_SELECTOR,
-                    "button[type='submit'], button.submit-button, input[type='submit']"
-                )
-                if submit_button:
-                    submit_button.click()
-                    time.sleep(3)
-                    return True
-                
-            except NoSuchElementException:
-                logger.warning("Could not find expected form elements")
-                return False
+            # Read the whole form in one round trip, then fill the fields it actually has
+            form = self.discover_form()
+            self.fill_form(form["fields"])
+            self.answer_questions(form["fields"])
+            
+            # Submit application
+            if form["submit"]:
+                form["submit"].click()
+                self.wait_for_page_ready()
+                return True
+            
+            logger.warning("Could not find submit button")
+            return False
                 
         except Exception as e:
             logger.error(f"Error during direct company application: {e}")
@@ -0,0 +1,357 @@
+"""
+Shared WebDriver pool for job board implementations
+"""
+import atexit
+import logging
+import shutil
+import tempfile
+import threading
+import time
+import weakref
+from contextlib import contextmanager
+from functools import lru_cache
+from selenium import webdriver
+from selenium.webdriver.chrome.options import Options
+from selenium.webdriver.chrome.service import Service
+from selenium.webdriver.support.events import EventFiringWebDriver, AbstractEventListener
+from webdriver_manager.chrome import ChromeDriverManager
+
+logger = logging.getLogger(__name__)
+
+# Pools still open at interpreter exit; held weakly so closed pools can be collected
+_open_pools = weakref.WeakSet()
+
+
+@atexit.register
+def _close_open_pools():
+    for pool in list(_open_pools):
+        pool.close()
+
+
+@lru_cache(maxsize=1)
+def _chromedriver_path():
+    """Resolve the chromedriver binary once per process"""
+    return ChromeDriverManager().install()
+
+
+def build_chrome_options(config, profile_dir, network_log=False):
+    """Build the Chrome options shared by every job board browser
+
+    Args:
+        config (dict): Application config
+        profile_dir (str): Chrome user data directory for this browser
+        network_log (bool): Record network events for network-idle waits
+
+    Returns:
+        Options: Configured Chrome options
+    """
+    chrome_options = Options()
+
+    if config.get("headless", False):
+        chrome_options.add_argument("--headless")
+
+    chrome_options.add_argument(f"user-data-dir={profile_dir}")
+    chrome_options.add_argument("--profile-directory=Default")
+
+    chrome_options.add_argument("--disable-gpu")
+    chrome_options.add_argument("--no-sandbox")
+    chrome_options.add_argument("--disable-dev-shm-usage")
+    chrome_options.add_argument("--window-size=1920,1080")
+    chrome_options.add_argument("--start-maximized")
+    chrome_options.add_argument("user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36")
+
+    # Network events in the performance log drive the network-idle waits. Only boards that
+    # use those waits ask for it: nothing else reads the log, so it would only grow
+    if network_log and config.get("network_idle_waits", True):
+        chrome_options.set_capability("goog:loggingPrefs", {"performance": "ALL"})
+    return chrome_options
+
+
+def create_chrome_driver(config, profile_dir, network_log=False):
+    """Start a Chrome WebDriver using the given profile directory"""
+    service = Service(_chromedriver_path())
+    driver = webdriver.Chrome(service=service, options=build_chrome_options(config, profile_dir, network_log))
+    # Explicit, condition-driven waits are used instead of a blanket implicit wait,
+    # which would otherwise make every missing optional element cost the full timeout
+    driver.implicitly_wait(0)
+    return driver
+
+
+class _PageLoadCounter(AbstractEventListener):
+    """Counts navigations made through a pooled driver"""
+
+    def __init__(self):
+        self.count = 0
+
+    def after_navigate_to(self, url, driver):
+        self.count += 1
+
+
+class PooledSession:
+    """A browser owned by a WebDriverPool"""
+
+    def __init__(self, driver, profile_dir, counter, network_log=False):
+        self.driver = driver
+        self.profile_dir = profile_dir
+        self.counter = counter
+        self.network_log = network_log
+        self.created_at = time.monotonic()
+        self.leases = 0
+        self.discarded = False
+
+    @property
+    def page_loads(self):
+        return self.counter.count
+
+    def page_heap_mb(self):
+        """Return the JS heap size of the current page in megabytes
+
+        This is what ``performance.memory`` reports for the page's own heap,
+        not the memory used by the browser process.
+        """
+        try:
+            used = self.driver.execute_script(
+                "return window.performance.memory ? window.performance.memory.usedJSHeapSize : 0"
+            )
+            return (used or 0) / (1024 * 1024)
+        except Exception:
+            return 0
+
+    def destroy(self):
+        """Quit the browser and remove its temporary profile"""
+        if not self.discarded:
+            try:
+                self.driver.quit()
+            except Exception as e:
+                logger.warning(f"Error quitting pooled browser: {e}")
+        shutil.rmtree(self.profile_dir, ignore_errors=True)
+
+
+class WebDriverPool:
+    """Hands out warm, reset Chrome sessions to job boards
+
+    Browsers are started lazily up to ``max_size`` and returned to the pool
+    after use instead of being quit. A session is recycled once it has served
+    ``max_page_loads`` navigations or the JS heap of its current page grows
+    past ``max_page_heap_mb``. That limit is a page-heap limit, checked on
+    release; it does not measure the browser process's memory.
+
+    Usage:
+        pool = WebDriverPool.from_config(config)
+        with pool.lease() as driver:
+            board = IndeedBoard(config, driver=driver)
+            jobs = board.search_jobs(keywords, location)
+    """
+
+    def __init__(self, config, max_size=2, max_page_loads=200, max_page_heap_mb=1024):
+        self.config = config
+        self.max_size = max_size
+        self.max_page_loads = max_page_loads
+        self.max_page_heap_mb = max_page_heap_mb
+
+        self._slots = threading.BoundedSemaphore(max_size)
+        self._lock = threading.Lock()
+        self._idle = []
+        self._leased = {}
+        self._closed = False
+        self.stats = {"created": 0, "recycled": 0, "leases": 0, "reused": 0}
+
+        _open_pools.add(self)
+
+    @classmethod
+    def from_config(cls, config, max_size=None):
+        """Create a pool from the ``driver_pool`` section of the config
+
+        ``max_page_heap_mb`` falls back to the older ``max_memory_mb`` key.
+
+        Args:
+            config (dict): Application config
+            max_size (int): Overrides ``driver_pool.max_size``, e.g. to match a worker count
+        """
+        pool_config = config.get("driver_pool", {})
+        return cls(
+            config,
+            max_size=max_size or pool_config.get("max_size", 2),
+            max_page_loads=pool_config.get("max_page_loads", 200),
+            max_page_heap_mb=pool_config.get("max_page_heap_mb", pool_config.get("max_memory_mb", 1024)),
+        )
+
+    def _create_session(self, network_log=False):
+        profile_dir = tempfile.mkdtemp(prefix="autojobapply-chrome-")
+        try:
+            raw_driver = create_chrome_driver(self.config, profile_dir, network_log)
+        except Exception:
+            shutil.rmtree(profile_dir, ignore_errors=True)
+            raise
+        counter = _PageLoadCounter()
+        driver = EventFiringWebDriver(raw_driver, counter)
+        with self._lock:
+            self.stats["created"] += 1
+        logger.info(f"Started pooled browser with profile {profile_dir}")
+        return PooledSession(driver, profile_dir, counter, network_log)
+
+    def _is_worn_out(self, session):
+        if self.max_page_loads and session.page_loads >= self.max_page_loads:
+            return True
+        if self.max_page_heap_mb and session.page_heap_mb() >= self.max_page_heap_mb:
+            return True
+        return False
+
+    def _reset(self, session):
+        """Clear per-site state so the next lease starts clean"""
+        driver = session.driver
+        raw_driver = driver.wrapped_driver
+
+        # Close any extra tabs opened during the lease
+        handles = raw_driver.window_handles
+        for handle in handles[1:]:
+            raw_driver.switch_to.window(handle)
+            raw_driver.close()
+        raw_driver.switch_to.window(handles[0])
+
+        try:
+            raw_driver.execute_script("window.localStorage.clear(); window.sessionStorage.clear();")
+        except Exception:
+            pass
+        raw_driver.execute_cdp_cmd("Network.clearBrowserCookies", {})
+        # Navigate through the raw driver so the reset is not counted as a page load
+        raw_driver.get("about:blank")
+        if session.network_log:
+            # Reading the log empties it, so the next lease's waits start from a clean buffer
+            try:
+                raw_driver.get_log("performance")
+            except Exception:
+                pass
+
+    def prewarm(self, count=None):
+        """Start browsers ahead of time so the first leases are warm
+
+        Args:
+            count (int): Number of browsers to start, defaults to ``max_size``
+        """
+        count = min(count or self.max_size, self.max_size)
+        with self._lock:
+            missing = count - len(self._idle) - len(self._leased)
+        for _ in range(max(missing, 0)):
+            session = self._create_session()
+            with self._lock:
+                self._idle.append(session)
+
+    def acquire(self, timeout=None, network_log=False):
+        """Lease a browser from the pool
+
+        Args:
+            timeout (float): Seconds to wait for a free slot, None waits forever
+            network_log (bool): Lease a browser that records network events
+                for network-idle waits
+
+        Returns:
+            WebDriver: A reset browser session
+
+        Raises:
+            TimeoutError: If no slot became free within timeout
+            RuntimeError: If the pool has been closed
+        """
+        if self._closed:
+            raise RuntimeError("WebDriver pool is closed")
+        if not self._slots.acquire(timeout=timeout):
+            raise TimeoutError(f"No browser available within {timeout} seconds")
+
+        try:
+            with self._lock:
+                session = next(
+                    (session for session in reversed(self._idle) if session.network_log == network_log), None
+                )
+                if session is not None:
+                    self._idle.remove(session)
+                    self.stats["reused"] += 1
+                elif self._idle and len(self._idle) + len(self._leased) >= self.max_size:
+                    # Only browsers of the other kind are idle: replace one, keeping within max_size
+                    spare = self._idle.pop(0)
+                    self.stats["recycled"] += 1
+                else:
+                    spare = None
+            if session is None:
+                if spare:
+                    spare.destroy()
+                session = self._create_session(network_log)
+        except Exception:
+            self._slots.release()
+            raise
+
+        with self._lock:
+            session.leases += 1
+            self.stats["leases"] += 1
+            self._leased[id(session.driver)] = session
+        return session.driver
+
+    def release(self, driver):
+        """Return a leased browser to the pool"""
+        with self._lock:
+            session = self._leased.pop(id(driver), None)
+        if session is None:
+            logger.warning("Attempted to release a browser that is not leased from this pool")
+            return
+
+        try:
+            if self._closed or session.discarded or self._is_worn_out(session):
+                if not self._closed and not session.discarded:
+                    logger.info(f"Recycling browser after {session.page_loads} page loads")
+                    with self._lock:
+                        self.stats["recycled"] += 1
+                session.destroy()
+                return
+            try:
+                self._reset(session)
+            except Exception as e:
+                logger.warning(f"Could not reset pooled browser, recycling it: {e}")
+                with self._lock:
+                    self.stats["recycled"] += 1
+                session.destroy()
+                return
+            with self._lock:
+                self._idle.append(session)
+        finally:
+            self._slots.release()
+
+    def discard(self, driver):
+        """Quit a leased browser now, e.g. to abort a hung board
+
+        The session stays leased until its holder releases it, and is then
+        destroyed instead of being reset and reused.
+        """
+        with self._lock:
+            session = self._leased.get(id(driver))
+            if session is None:
+                logger.warning("Attempted to discard a browser that is not leased from this pool")
+                return
+            session.discarded = True
+            self.stats["recycled"] += 1
+        try:
+            session.driver.quit()
+        except Exception as e:
+            logger.warning(f"Error quitting discarded browser: {e}")
+
+    @contextmanager
+    def lease(self, timeout=None):
+        """Context manager that leases a browser and always returns it"""
+        driver = self.acquire(timeout=timeout)
+        try:
+            yield driver
+        finally:
+            self.release(driver)
+
+    def close(self):
+        """Quit every idle browser; leased browsers are quit when released"""
+        with self._lock:
+            self._closed = True
+            idle, self._idle = self._idle, []
+        _open_pools.discard(self)
+        for session in idle:
+            session.destroy()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
@@ -0,0 +1,101 @@
+"""
+Batched job card extraction in a single WebDriver round trip
+"""
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Runs in the page: finds every card and reads every field in one call.
+# A field spec is [name, selector, attribute, required]; an empty selector
+# reads from the card element itself, and the "text" attribute reads innerText.
+CARD_EXTRACTION_SCRIPT = """
+const cardSelector = arguments[0];
+const fields = arguments[1];
+const limit = arguments[2];
+const root = arguments[3] || document;
+
+const readField = (card, selector, attribute) => {
+    const el = selector ? card.querySelector(selector) : card;
+    if (!el) {
+        return null;
+    }
+    if (attribute === "text") {
+        return (el.innerText || el.textContent || "").trim();
+    }
+    if (attribute in el && el[attribute] !== null && el[attribute] !== undefined) {
+        return String(el[attribute]);
+    }
+    return el.getAttribute(attribute);
+};
+
+const results = [];
+const cards = root.querySelectorAll(cardSelector);
+for (const card of cards) {
+    if (limit && results.length >= limit) {
+        break;
+    }
+    const record = {};
+    let complete = true;
+    for (const [name, selector, attribute, required] of fields) {
+        const value = readField(card, selector, attribute);
+        if (value === null && required) {
+            complete = false;
+            break;
+        }
+        record[name] = value;
+    }
+    if (complete) {
+        results.push(record);
+    }
+}
+return {total: cards.length, cards: results};
+"""
+
+
+def normalize_field_spec(fields):
+    """Turn a board's field spec into the list form the script expects
+
+    Each value in ``fields`` is either a CSS selector (text is read) or a
+    tuple of (selector, attribute) or (selector, attribute, required).
+    Fields are required unless marked otherwise; a card missing a required
+    field is skipped, like the NoSuchElementException handling it replaces.
+
+    Args:
+        fields (dict): Mapping of output key to field spec
+
+    Returns:
+        list: [name, selector, attribute, required] entries
+    """
+    normalized = []
+    for name, spec in fields.items():
+        if isinstance(spec, str):
+            selector, attribute, required = spec, "text", True
+        elif len(spec) == 2:
+            (selector, attribute), required = spec, True
+        else:
+            selector, attribute, required = spec
+        normalized.append([name, selector or "", attribute, required])
+    return normalized
+
+
+def extract_cards(driver, card_selector, fields, limit=None, root=None):
+    """Extract every card's fields with one execute_script call
+
+    Args:
+        driver: Selenium WebDriver
+        card_selector (str): CSS selector matching each job card
+        fields (dict): Field spec, see normalize_field_spec
+        limit (int): Maximum number of complete cards to return
+        root (WebElement): Optional element to search within
+
+    Returns:
+        list: One dict per complete card
+    """
+    result = driver.execute_script(
+        CARD_EXTRACTION_SCRIPT, card_selector, normalize_field_spec(fields), limit or 0, root
+    ) or {}
+    cards = result.get("cards", [])
+    skipped = result.get("total", 0) - len(cards)
+    if skipped > 0 and not limit:
+        logger.debug(f"Skipped {skipped} incomplete cards matching {card_selector}")
+    return cards
@@ -0,0 +1,306 @@
+"""
+One-shot discovery of application form fields in a single WebDriver round trip
+"""
+import logging
+import re
+from selenium.common.exceptions import TimeoutException, WebDriverException
+from selenium.webdriver.support.ui import Select
+from .waits import wait_until
+
+logger = logging.getLogger(__name__)
+
+# Runs in the page: reads every visible input, select and textarea under the
+# root along with its label, plus the form's submit button. Elements come back
+# as WebElements, so filling a field needs no further lookups.
+FORM_DISCOVERY_SCRIPT = """
+const root = (typeof arguments[0] === "string" ? document.querySelector(arguments[0]) : arguments[0]) || document;
+const clean = (text) => (text || "").replace(/\\s+/g, " ").trim();
+
+const labelFor = (el) => {
+    if (el.labels && el.labels.length) {
+        return clean(el.labels[0].innerText);
+    }
+    const labelledBy = el.getAttribute("aria-labelledby");
+    if (labelledBy) {
+        const text = labelledBy.split(/\\s+/)
+            .map((id) => document.getElementById(id))
+            .filter(Boolean)
+            .map((node) => node.innerText)
+            .join(" ");
+        if (clean(text)) {
+            return clean(text);
+        }
+    }
+    return clean(el.getAttribute("aria-label") || el.getAttribute("placeholder") || "");
+};
+
+const questionFor = (el) => {
+    const fieldset = el.closest("fieldset");
+    const legend = fieldset && fieldset.querySelector("legend");
+    if (legend) {
+        return clean(legend.innerText);
+    }
+    const group = el.closest("[role='group'], [role='radiogroup']");
+    return group ? labelFor(group) : "";
+};
+
+const visible = (el) => el.type === "file" || !!(el.offsetWidth || el.offsetHeight || el.getClientRects().length);
+
+const fields = [];
+for (const el of root.querySelectorAll("input, select, textarea")) {
+    const type = el.tagName === "INPUT" ? (el.type || "text").toLowerCase() : el.tagName.toLowerCase();
+    if (["hidden", "submit", "button", "reset", "image"].includes(type) || el.disabled || !visible(el)) {
+        continue;
+    }
+    const field = {
+        element: el,
+        tag: el.tagName.toLowerCase(),
+        type: type,
+        name: el.name || "",
+        id: el.id || "",
+        label: labelFor(el),
+        question: ["radio", "checkbox"].includes(type) ? questionFor(el) : "",
+        autocomplete: el.getAttribute("autocomplete") || "",
+        accept: el.getAttribute("accept") || "",
+        required: el.required || el.getAttribute("aria-required") === "true",
+        value: type === "file" ? "" : (el.value || ""),
+        checked: !!el.checked,
+        options: [],
+    };
+    if (field.tag === "select") {
+        field.options = Array.from(el.options).map((option) => ({value: option.value, label: clean(option.text)}));
+    }
+    fields.push(field);
+}
+
+const submitCandidates = root.querySelectorAll("button, input[type='submit']");
+let submit = null;
+for (const button of submitCandidates) {
+    const text = clean(button.innerText || button.value || button.getAttribute("aria-label")).toLowerCase();
+    if (button.disabled) {
+        continue;
+    }
+    if (button.type === "submit" || /submit|send application|apply/.test(text)) {
+        submit = button;
+        if (button.type === "submit") {
+            break;
+        }
+    }
+}
+return {fields: fields, submit: submit};
+"""
+
+# Runs in the page: returns the first root, in selector order, that holds a
+# visible field, so a form rendered into a modal or SPA view is waited for
+FORM_ROOT_SCRIPT = """
+const visible = (el) => !!(el.offsetWidth || el.offsetHeight || el.getClientRects().length);
+for (const selector of arguments[0]) {
+    let roots;
+    try {
+        roots = document.querySelectorAll(selector);
+    } catch (e) {
+        continue;
+    }
+    for (const root of roots) {
+        for (const field of root.querySelectorAll("input, select, textarea")) {
+            if (field.type !== "hidden" && visible(field)) {
+                return root;
+            }
+        }
+    }
+}
+return null;
+"""
+
+# Where application forms render when a board does not say: a modal, or a form with a resume upload
+DEFAULT_FORM_SELECTORS = ["[role='dialog'] form", "form:has(input[type='file'])", "[role='dialog']"]
+
+# Field kind -> patterns matched against a field's name, id, label and autocomplete
+FIELD_PATTERNS = {
+    "first_name": r"first.?name|given.?name|fname",
+    "last_name": r"last.?name|family.?name|surname|lname",
+    "email": r"e.?mail",
+    "phone": r"phone|mobile|\btel\b",
+    "location": r"location|city|address",
+    "linkedin": r"linkedin",
+    "cover_letter": r"cover.?letter",
+    "resume": r"resume|cv\b|curriculum",
+    "name": r"name",
+}
+
+
+class form_ready:
+    """Condition: one of the candidate form roots holds a visible field; returns that root"""
+
+    def __init__(self, root_selectors):
+        self.root_selectors = list(root_selectors)
+
+    def __call__(self, driver):
+        try:
+            return driver.execute_script(FORM_ROOT_SCRIPT, self.root_selectors) or False
+        except WebDriverException:
+            # The page is still navigating to the form
+            return False
+
+
+def wait_for_form(driver, root_selectors, timeout=10):
+    """Wait until a form has rendered under one of the candidate roots
+
+    Apply forms often open as a modal or SPA view without a navigation, so
+    document readiness says nothing about them.
+
+    Args:
+        driver: Selenium WebDriver
+        root_selectors (list): CSS selectors of possible form containers, most specific first
+        timeout (int): Maximum wait time in seconds
+
+    Returns:
+        WebElement: The form's root element, or None if no candidate rendered a field in time
+    """
+    try:
+        return wait_until(driver, form_ready(root_selectors), timeout)
+    except TimeoutException:
+        return None
+
+
+def discover_form(driver, root_selector=None):
+    """Snapshot every fillable field of a form with one execute_script call
+
+    Args:
+        driver: Selenium WebDriver
+        root_selector (str or WebElement): The form container, or None for the whole page
+
+    Returns:
+        dict: {"fields": [field dicts], "submit": WebElement or None}. Each field has
+            element, tag, type, name, id, label, question, autocomplete, accept,
+            required, value, checked and options.
+    """
+    result = driver.execute_script(FORM_DISCOVERY_SCRIPT, root_selector) or {}
+    fields = result.get("fields", [])
+    for field in fields:
+        field["kind"] = classify_field(field)
+    logger.debug(f"Discovered {len(fields)} form fields")
+    return {"fields": fields, "submit": result.get("submit")}
+
+
+def classify_field(field):
+    """Name the standard applicant detail a field asks for, or None for other questions"""
+    if field["type"] == "file":
+        text = " ".join([field["name"], field["id"], field["label"]]).lower()
+        return "cover_letter" if re.search(FIELD_PATTERNS["cover_letter"], text) else "resume"
+    if field["type"] == "email":
+        return "email"
+    if field["type"] == "tel":
+        return "phone"
+    if field["type"] not in ("text", "search", "url", ""):
+        return None
+
+    text = " ".join([field["name"], field["id"], field["label"], field["autocomplete"]]).lower()
+    for kind, pattern in FIELD_PATTERNS.items():
+        if kind in ("resume", "cover_letter"):
+            continue
+        if re.search(pattern, text):
+            # "Company name", "Hiring manager's name" and the like are questions, not the applicant's name
+            if kind == "name" and re.search(r"company|employer|manager|reference|school", text):
+                return None
+            return kind
+    return None
+
+
+_TRUE_ANSWERS = {"yes", "y", "true", "1", "checked", "agree", "i agree"}
+
+
+def group_questions(fields):
+    """Turn the fields that are not applicant details into questions
+
+    Radio buttons sharing a name become one question whose options are
+    their labels; every other field is a question of its own.
+
+    Returns:
+        list: Dicts with text, type, fields, options, value (the current answer) and required
+    """
+    questions = []
+    radio_groups = {}
+    for field in fields:
+        if field["kind"] or field["type"] == "file":
+            continue
+        if field["type"] == "radio":
+            group = radio_groups.get(field["name"])
+            if group is None:
+                group = {
+                    "text": field["question"] or field["label"], "type": "radio", "fields": [],
+                    "options": [], "value": "", "required": False,
+                }
+                radio_groups[field["name"]] = group
+                questions.append(group)
+            group["fields"].append(field)
+            group["options"].append(field["label"])
+            group["required"] = group["required"] or field["required"]
+            if field["checked"]:
+                group["value"] = field["label"]
+            continue
+
+        if field["type"] == "checkbox":
+            value = "Yes" if field["checked"] else ""
+            text = field["label"] or field["question"]
+        elif field["tag"] == "select":
+            selected = next((option for option in field["options"] if option["value"] == field["value"]), None)
+            value = selected["label"] if selected and field["value"] else ""
+            text = field["label"]
+        else:
+            value = field["value"]
+            text = field["label"] or field["name"]
+        questions.append({
+            "text": text,
+            "type": field["tag"] if field["tag"] in ("select", "textarea") else field["type"],
+            "fields": [field],
+            "options": [option["label"] for option in field["options"] if option["value"]],
+            "value": value,
+            "required": field["required"],
+        })
+    return questions
+
+
+def match_option(answer, options):
+    """Index of the option an answer refers to, or None"""
+    wanted = " ".join(str(answer).lower().split())
+    if not wanted:
+        return None
+    labels = [" ".join(option.lower().split()) for option in options]
+    if wanted in labels:
+        return labels.index(wanted)
+    # Empty labels (placeholder options, unlabelled radios) would prefix-match every answer
+    for index, label in enumerate(labels):
+        if label and (label.startswith(wanted) or wanted.startswith(label)):
+            return index
+    return next((index for index, label in enumerate(labels) if label and wanted in label), None)
+
+
+def apply_answer(question, answer):
+    """Put an answer into a question's field(s)
+
+    Returns:
+        bool: False if the answer matches none of the question's options
+    """
+    field = question["fields"][0]
+    element = field["element"]
+    if question["type"] == "radio":
+        index = match_option(answer, question["options"])
+        if index is None:
+            return False
+        choice = question["fields"][index]
+        if not choice["checked"]:
+            choice["element"].click()
+    elif question["type"] == "select":
+        index = match_option(answer, question["options"])
+        if index is None:
+            return False
+        values = [option["value"] for option in field["options"] if option["value"]]
+        Select(element).select_by_value(values[index])
+    elif question["type"] == "checkbox":
+        if (str(answer).strip().lower() in _TRUE_ANSWERS) != field["checked"]:
+            element.click()
+    elif field["value"] != answer:
+        element.clear()
+        element.send_keys(answer)
+    return True
@@ -0,0 +1,107 @@
+"""
+HTTP-first fetching for server-rendered and JSON job listings
+"""
+import logging
+import threading
+from collections import Counter, defaultdict
+from urllib.parse import urljoin
+import requests
+from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from .extraction import normalize_field_spec
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_HEADERS = {
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36",
+    "Accept-Language": "en-US,en;q=0.9",
+}
+
+FETCH_MODES = ("auto", "http", "selenium")
+
+_session = None
+_session_lock = threading.Lock()
+
+_counters = defaultdict(Counter)
+_counters_lock = threading.Lock()
+
+
+def get_http_session():
+    """Return the process-wide keep-alive HTTP session"""
+    global _session
+    with _session_lock:
+        if _session is None:
+            retry = Retry(total=2, backoff_factor=0.5, status_forcelist=(429, 500, 502, 503, 504))
+            adapter = HTTPAdapter(pool_connections=16, pool_maxsize=16, max_retries=retry)
+            session = requests.Session()
+            session.headers.update(DEFAULT_HEADERS)
+            session.mount("http://", adapter)
+            session.mount("https://", adapter)
+            _session = session
+        return _session
+
+
+def record_fetch(board_name, path):
+    """Count which path ('http', 'selenium' or 'http_fallback') served a search"""
+    with _counters_lock:
+        _counters[board_name][path] += 1
+
+
+def fetch_stats():
+    """Return a copy of the per-board fetch path counters"""
+    with _counters_lock:
+        return {board: dict(counts) for board, counts in _counters.items()}
+
+
+def fetch_html(url, timeout=10):
+    """GET a page over the shared session and return its text"""
+    response = get_http_session().get(url, timeout=timeout)
+    response.raise_for_status()
+    return response.text
+
+
+def fetch_json(url, timeout=10, params=None):
+    """GET a JSON document over the shared session"""
+    response = get_http_session().get(url, timeout=timeout, params=params)
+    response.raise_for_status()
+    return response.json()
+
+
+def extract_cards_from_html(html, card_selector, fields, limit=None, base_url=None):
+    """Parse cards out of static HTML using the same spec as extract_cards
+
+    Args:
+        html (str): Page source
+        card_selector (str): CSS selector matching each job card
+        fields (dict): Field spec, see extraction.normalize_field_spec
+        limit (int): Maximum number of complete cards to return
+        base_url (str): Used to make relative links absolute
+
+    Returns:
+        list: One dict per complete card
+    """
+    soup = BeautifulSoup(html, "lxml")
+    spec = normalize_field_spec(fields)
+    results = []
+    for card in soup.select(card_selector):
+        if limit and len(results) >= limit:
+            break
+        record = {}
+        for name, selector, attribute, required in spec:
+            element = card.select_one(selector) if selector else card
+            value = None
+            if element is not None:
+                if attribute == "text":
+                    value = element.get_text(" ", strip=True)
+                else:
+                    value = element.get(attribute)
+                    if attribute in ("href", "src") and value and base_url:
+                        value = urljoin(base_url, value)
+            if value is None and required:
+                record = None
+                break
+            record[name] = value
+        if record is not None:
+            results.append(record)
+    return results
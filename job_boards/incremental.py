@@ -0,0 +1,107 @@
+"""
+Incremental scraping against a per-query high-water mark
+"""
+import logging
+from .job_store import make_job_id
+
+logger = logging.getLogger(__name__)
+
+
+class IncrementalScan:
+    """Tracks one query's scrape against the jobs seen at the top of its last run
+
+    Boards read cards newest first and pass each one to ``accept``. Known jobs
+    are skipped, and the scan is ``done`` as soon as it reaches a job from the
+    previous run's head (the high-water mark) or ``known_streak`` known jobs in
+    a row, after which nothing further down the list can be new. ``commit``
+    puts this run's head in front of the previous mark, capped at
+    ``mark_size``, so a scan that stopped early does not shrink the mark.
+
+    Skipping a known job only saves scraping it again: ``commit`` also returns
+    the query's open backlog, the jobs it found in earlier runs that were
+    neither applied to nor dismissed (seen in the last ``backlog_days`` days),
+    so jobs filtered out or left over by an interrupted run come back.
+
+    Usage:
+        scan = self.incremental_scan(keywords, location)
+        for job_data in cards:
+            if scan and scan.done:
+                break
+            if scan and not scan.accept(job_data):
+                continue
+            jobs.append(job_data)
+        if scan:
+            jobs.extend(scan.commit())
+    """
+
+    def __init__(self, job_store, board_name, query_key, mark_size=10, known_streak=5, backlog_days=30):
+        self.job_store = job_store
+        self.board_name = board_name
+        self.query_key = query_key
+        self.mark_size = mark_size
+        self.known_streak = known_streak
+        self.backlog_days = backlog_days
+        self.previous_mark = list(job_store.get_search_mark(board_name, query_key))
+        self.mark = set(self.previous_mark)
+        self.head = []
+        self.accepted = []
+        self.seen = []
+        self.done = False
+        self.new_count = 0
+        self.skipped = 0
+        self._streak = 0
+
+    def accept(self, job_data):
+        """Whether the job is new; marks the scan done once the rest of the list is known"""
+        if self.done:
+            return False
+        job_id = job_data.get("job_id") or make_job_id(job_data)
+        if len(self.head) < self.mark_size:
+            self.head.append(job_id)
+        self.seen.append(job_id)
+
+        if job_id in self.mark:
+            logger.info(f"{self.board_name}: reached last run's newest jobs after {self.new_count} new")
+            self.done = True
+            return False
+
+        if self.job_store.is_known(job_data):
+            self.skipped += 1
+            self._streak += 1
+            if self._streak >= self.known_streak:
+                logger.info(f"{self.board_name}: {self._streak} known jobs in a row, stopping")
+                self.done = True
+            return False
+
+        self._streak = 0
+        self.new_count += 1
+        self.accepted.append(job_id)
+        return True
+
+    def filter(self, jobs):
+        """Yield the new jobs from a newest-first list, stopping once the scan is done"""
+        for job_data in jobs:
+            if self.done:
+                break
+            if self.accept(job_data):
+                yield job_data
+
+    def commit(self):
+        """Merge the newest job ids from this run into the mark for the next one
+
+        Returns:
+            list: The query's open backlog, see the class docstring
+        """
+        if self.head:
+            mark = self.head + [job_id for job_id in self.previous_mark if job_id not in self.head]
+            self.job_store.set_search_mark(self.board_name, self.query_key, mark[:self.mark_size])
+        if self.seen:
+            self.job_store.record_search_results(self.board_name, self.query_key, self.seen)
+        backlog = self.job_store.open_search_jobs(
+            self.board_name, self.query_key, exclude=self.accepted, max_age_days=self.backlog_days
+        )
+        logger.info(
+            f"{self.board_name}: {self.new_count} new jobs, {self.skipped} known skipped, "
+            f"{len(backlog)} open from earlier runs"
+        )
+        return backlog
@@ -1,17 +1,27 @@
 """
 Indeed job board implementation
 """
-import time
 import logging
 from selenium.webdriver.common.by import By
-from selenium.common.exceptions import NoSuchElementException
 from .base import JobBoardBase
+from .forms import DEFAULT_FORM_SELECTORS
 
 logger = logging.getLogger(__name__)
 
 class IndeedBoard(JobBoardBase):
     """Indeed job board implementation"""
     
+    LOGIN_URL = "https://www.indeed.com/account/login"
+    CARD_SELECTOR = "div.job_seen_beacon"
+    CARD_FIELDS = {
+        "job_title": "h2.jobTitle",
+        "company": "span.companyName",
+        "location": "div.companyLocation",
+        "url": ("a.jcs-JobTitle", "href"),
+    }
+    # Indeed Apply renders its steps inside #ia-container
+    FORM_SELECTORS = ["#ia-container form", "#ia-container"] + DEFAULT_FORM_SELECTORS
+    
     @property
     def board_name(self):
         return "indeed"
@@ -19,8 +29,8 @@ class IndeedBoard(JobBoardBase):
     def login(self):
         """Login to Indeed"""
         try:
-            self.driver.get("https://www.indeed.com/account/login")
-            time.sleep(2)
+            self.driver.get(self.LOGIN_URL)
+            self.wait_for_page_ready()
             
             # Check for CAPTCHA
             if self._handle_captcha():
@@ -33,7 +43,7 @@ class IndeedBoard(JobBoardBase):
             )
             if google_button:
                 google_button.click()
-                time.sleep(2)
+                self.wait_for_page_ready()
                 
                 # Handle Google login
                 email_field = self._wait_for_element(
@@ -48,7 +58,7 @@ class IndeedBoard(JobBoardBase):
                     )
                     if next_button:
                         next_button.click()
-                        time.sleep(2)
+                        self.human_pause(1, 2)
                         
                         # Wait for password field
                         password_field = self._wait_for_element(
@@ -63,7 +73,7 @@ class IndeedBoard(JobBoardBase):
                             )
                             if submit_button:
                                 submit_button.click()
-                                time.sleep(3)
+                                self.wait_for_page_ready()
                                 return True
             
             return False
@@ -75,6 +85,7 @@ class IndeedBoard(JobBoardBase):
     def search_jobs(self, keywords, location):
         """Search for jobs on Indeed"""
         jobs = []
+        scan = self.incremental_scan(keywords, location)
         try:
             # Format keywords for URL
             if isinstance(keywords, list):
@@ -95,32 +106,22 @@ class IndeedBoard(JobBoardBase):
                 return jobs
             
             # Wait for job listings to load
-            time.sleep(3)
-            
-            # Find all job cards
-            job_cards = self.driver.find_elements(By.CSS_SELECTOR, "div.job_seen_beacon")
-            
-            for job in job_cards:
-                try:
-                    title_elem = job.find_element(By.CSS_SELECTOR, "h2.jobTitle")
-                    company_elem = job.find_element(By.CSS_SELECTOR, "span.companyName")
-                    location_elem = job.find_element(By.CSS_SELECTOR, "div.companyLocation")
-                    link_elem = job.find_element(By.CSS_SELECTOR, "a.jcs-JobTitle")
-                    
-                    job_data = {
-                        "job_title": title_elem.text.strip(),
-                        "company": company_elem.text.strip(),
-                        "location": location_elem.text.strip(),
-                        "url": link_elem.get_attribute("href"),
-                        "job_board": self.board_name
-                    }
-                    job_data["job_id"] = self._get_unique_job_id(job_data)
-                    jobs.append(job_data)
-                    
-                except NoSuchElementException:
+            self.wait_for_cards(By.CSS_SELECTOR, self.CARD_SELECTOR)
+            
+            # Read each results page in one round trip, following the start= offset
+            for job_data in self.paginate(
+                self.CARD_SELECTOR, self.CARD_FIELDS, page_url=lambda page: f"{search_url}&start={page * 10}", scan=scan
+            ):
+                job_data["job_board"] = self.board_name
+                job_data["job_id"] = self._get_unique_job_id(job_data)
+                if scan and not scan.accept(job_data):
+                    if scan.done:
+                        break
                     continue
-                except Exception as e:
-                    logger.error(f"Error parsing Indeed job: {e}")
+                jobs.append(job_data)
+            
+            if scan:
+                jobs.extend(scan.commit())
             
         except Exception as e:
             logger.error(f"Error searching Indeed jobs: {e}")
@@ -146,35 +147,21 @@ class IndeedBoard(JobBoardBase):
             apply_button.click()
             
             # Wait for application form
-            time.sleep(2)
-            
-            # Fill out application form
-            try:
-                # Fill name if required
-                name_field = self._wait_for_element(By.CSS_SELECTOR, "input[name='name']")
-                if name_field:
-                    name_field.send_keys(self._get_config_value("personal_info.name", ""))
-                
-                # Fill email if required
-                email_field = self._wait_for_element(By.CSS_SELECTOR, "input[name='email']")
-                if email_field:
-                    email_field.send_keys(self.credentials.get("email", ""))
-                
-                # Upload resume if required
-                resume_upload = self._wait_for_element(By.CSS_SELECTOR, "input[type='file']")
-                if resume_upload:
-                    resume_upload.send_keys(str(self.resume_path.absolute()))
-                
-                # Submit application
-                submit_button = self._wait_for_clickable(By.CSS_SELECTOR, "button[type='submit']")
-                if submit_button:
-                    submit_button.click()
-                    time.sleep(3)
-                    return True
-                
-            except NoSuchElementException:
-                logger.warning("Could not find expected form elements on Indeed")
-                return False
+            self.wait_for_page_ready()
+            
+            # Read the whole form in one round trip, then fill the fields it actually has
+            form = self.discover_form()
+            self.fill_form(form["fields"])
+            self.answer_questions(form["fields"])
+            
+            # Submit application
+            if form["submit"]:
+                form["submit"].click()
+                self.wait_for_page_ready()
+                return True
+            
+            logger.warning("Could not find submit button")
+            return False
                 
         except Exception as e:
             logger.error(f"Error during Indeed application: {e}")
@@ -0,0 +1,347 @@
+"""
+SQLite-backed job store with a dedup index
+"""
+import hashlib
+import json
+import logging
+import re
+import sqlite3
+import threading
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+logger = logging.getLogger(__name__)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    job_id TEXT PRIMARY KEY,
+    job_board TEXT NOT NULL,
+    company TEXT NOT NULL,
+    position TEXT NOT NULL,
+    location TEXT NOT NULL,
+    url TEXT NOT NULL,
+    norm_company TEXT NOT NULL,
+    norm_title TEXT NOT NULL,
+    first_seen_at TIMESTAMP NOT NULL,
+    last_seen_at TIMESTAMP NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_jobs_url ON jobs (url);
+CREATE INDEX IF NOT EXISTS idx_jobs_company_title ON jobs (norm_company, norm_title);
+
+CREATE TABLE IF NOT EXISTS applications (
+    id INTEGER PRIMARY KEY,
+    job_id TEXT NOT NULL,
+    job_board TEXT NOT NULL,
+    status TEXT NOT NULL,
+    applied_at TIMESTAMP NOT NULL,
+    company TEXT NOT NULL,
+    position TEXT NOT NULL,
+    location TEXT NOT NULL,
+    url TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_applications_job_id ON applications (job_id, status);
+
+CREATE TABLE IF NOT EXISTS search_marks (
+    board TEXT NOT NULL,
+    query_key TEXT NOT NULL,
+    job_ids TEXT NOT NULL,
+    updated_at TIMESTAMP NOT NULL,
+    PRIMARY KEY (board, query_key)
+);
+
+CREATE TABLE IF NOT EXISTS search_results (
+    board TEXT NOT NULL,
+    query_key TEXT NOT NULL,
+    job_id TEXT NOT NULL,
+    PRIMARY KEY (board, query_key, job_id)
+);
+"""
+
+# Application statuses that settle a job; any other job a query found is still open
+HANDLED_STATUSES = ("applied", "dismissed")
+
+# Query parameters that identify the posting itself (Indeed's jk/vjk, ZipRecruiter's jid,
+# Greenhouse's gh_jid, LinkedIn's currentJobId); every other parameter is tracking
+ID_PARAMS = {"jk", "vjk", "jid", "gh_jid", "currentjobid"}
+
+_COMPANY_SUFFIXES = re.compile(r"\b(inc|llc|ltd|corp|corporation|co|gmbh|plc|sa)\b\.?")
+_NON_WORD = re.compile(r"[^a-z0-9+#]+")
+
+
+def normalize_company(company):
+    """Lowercase a company name and drop punctuation and legal suffixes"""
+    text = _COMPANY_SUFFIXES.sub(" ", (company or "").lower())
+    return " ".join(_NON_WORD.sub(" ", text).split())
+
+
+def normalize_title(title):
+    """Lowercase a job title and collapse punctuation and whitespace"""
+    return " ".join(_NON_WORD.sub(" ", (title or "").lower()).split())
+
+
+def normalize_url(url):
+    """Drop tracking parameters, the fragment and trailing slash so they don't split a job
+
+    Parameters in ID_PARAMS are kept (sorted), since on some boards they are
+    the only part of the URL that tells two postings apart.
+    """
+    if not url:
+        return ""
+    parts = urlsplit(url)
+    query = urlencode(sorted(
+        (key.lower(), value) for key, value in parse_qsl(parts.query) if key.lower() in ID_PARAMS
+    ))
+    return urlunsplit((parts.scheme.lower(), parts.netloc.lower(), parts.path.rstrip("/"), query, ""))
+
+
+def job_fields(job_data):
+    """Read the common fields from a scraped job, whichever key style the board uses"""
+    return {
+        "job_board": job_data.get("job_board", ""),
+        "company": job_data.get("company", "") or "",
+        "position": job_data.get("job_title") or job_data.get("title") or "",
+        "location": job_data.get("location", "") or "",
+        "url": job_data.get("url") or job_data.get("link") or "",
+    }
+
+
+def make_job_id(job_data):
+    """Build a stable job id from the posting URL, or board/company/title without one"""
+    fields = job_fields(job_data)
+    url = normalize_url(fields["url"])
+    if url:
+        key = url
+    else:
+        key = "|".join([
+            fields["job_board"], normalize_company(fields["company"]), normalize_title(fields["position"])
+        ])
+    return hashlib.sha1(key.encode("utf-8")).hexdigest()[:16]
+
+
+def _now():
+    return datetime.now(timezone.utc).isoformat(timespec="seconds")
+
+
+class JobStore:
+    """Persists scraped jobs and applications so runs can skip known postings
+
+    Usage:
+        store = JobStore.from_config(config)
+        new_jobs = store.upsert_jobs(jobs)
+        if not store.already_applied(job["job_id"]):
+            ...
+    """
+
+    def __init__(self, path="data/jobs.db"):
+        self.path = Path(path)
+        if str(path) != ":memory:":
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(path), check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        with self._lock, self._conn:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.executescript(SCHEMA)
+
+    @classmethod
+    def from_config(cls, config):
+        return cls(config.get("job_store", {}).get("path", "data/jobs.db"))
+
+    def upsert_jobs(self, jobs):
+        """Insert new jobs and refresh last_seen_at on known ones
+
+        Args:
+            jobs (list): Scraped job dicts; job_id is filled in if missing
+
+        Returns:
+            list: The jobs that were not in the store before this call
+        """
+        if not jobs:
+            return []
+        now = _now()
+        for job_data in jobs:
+            job_data.setdefault("job_id", make_job_id(job_data))
+
+        with self._lock, self._conn:
+            placeholders = ",".join("?" * len(jobs))
+            known = {
+                row["job_id"] for row in self._conn.execute(
+                    f"SELECT job_id FROM jobs WHERE job_id IN ({placeholders})",
+                    [job_data["job_id"] for job_data in jobs],
+                )
+            }
+            rows = []
+            for job_data in jobs:
+                fields = job_fields(job_data)
+                rows.append((
+                    job_data["job_id"], fields["job_board"], fields["company"], fields["position"],
+                    fields["location"], fields["url"], normalize_company(fields["company"]),
+                    normalize_title(fields["position"]), now, now,
+                ))
+            self._conn.executemany(
+                """
+                INSERT INTO jobs (job_id, job_board, company, position, location, url,
+                                  norm_company, norm_title, first_seen_at, last_seen_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT(job_id) DO UPDATE SET
+                    last_seen_at = excluded.last_seen_at,
+                    location = excluded.location
+                """,
+                rows,
+            )
+        new_jobs = []
+        for job_data in jobs:
+            if job_data["job_id"] not in known:
+                known.add(job_data["job_id"])
+                new_jobs.append(job_data)
+        return new_jobs
+
+    def is_known(self, job_data):
+        """Whether a job was stored before, by id, URL or (company, title)
+
+        Empty URLs, companies and titles never match, so jobs missing them
+        are only known by id.
+        """
+        fields = job_fields(job_data)
+        job_id = job_data.get("job_id") or make_job_id(job_data)
+        company = normalize_company(fields["company"])
+        title = normalize_title(fields["position"])
+        with self._lock:
+            row = self._conn.execute(
+                """
+                SELECT 1 FROM jobs
+                WHERE job_id = ?
+                   OR (? != '' AND url = ?)
+                   OR (? != '' AND ? != '' AND norm_company = ? AND norm_title = ?)
+                LIMIT 1
+                """,
+                (job_id, fields["url"], fields["url"], company, title, company, title),
+            ).fetchone()
+        return row is not None
+
+    def already_applied(self, job_id):
+        """Whether an application to this job has already been submitted"""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT 1 FROM applications WHERE job_id = ? AND status = 'applied' LIMIT 1",
+                (job_id,),
+            ).fetchone()
+        return row is not None
+
+    def record_application(self, job_data, status):
+        """Record the outcome of an application attempt ('applied' or 'failed'), or 'dismissed'"""
+        fields = job_fields(job_data)
+        job_id = job_data.get("job_id") or make_job_id(job_data)
+        with self._lock, self._conn:
+            self._conn.execute(
+                """
+                INSERT INTO applications (job_id, job_board, status, applied_at, company, position, location, url)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                """,
+                (job_id, fields["job_board"], status, _now(), fields["company"],
+                 fields["position"], fields["location"], fields["url"]),
+            )
+
+    def dismiss_job(self, job_data):
+        """Mark a job as not worth applying to, so searches stop returning it"""
+        self.record_application(job_data, "dismissed")
+
+    def count_applications(self, job_board, since):
+        """Count submitted applications on a board (including its per-company boards) since a timestamp"""
+        with self._lock:
+            row = self._conn.execute(
+                """
+                SELECT COUNT(*) FROM applications
+                WHERE status = 'applied' AND applied_at >= ?
+                  AND (job_board = ? OR job_board LIKE ? ESCAPE '\\')
+                """,
+                (since, job_board, job_board.replace("_", "\\_") + "\\_%"),
+            ).fetchone()
+        return row[0]
+
+    def applied_job_ids(self):
+        """Return the ids of every job with a submitted application"""
+        with self._lock:
+            rows = self._conn.execute("SELECT DISTINCT job_id FROM applications WHERE status = 'applied'")
+            return {row["job_id"] for row in rows}
+
+    def get_search_mark(self, board, query_key):
+        """Return the newest job ids seen by recent runs of this query"""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT job_ids FROM search_marks WHERE board = ? AND query_key = ?",
+                (board, query_key),
+            ).fetchone()
+        return json.loads(row["job_ids"]) if row else []
+
+    def set_search_mark(self, board, query_key, job_ids):
+        """Store the newest job ids of this run as the query's high-water mark"""
+        with self._lock, self._conn:
+            self._conn.execute(
+                """
+                INSERT INTO search_marks (board, query_key, job_ids, updated_at)
+                VALUES (?, ?, ?, ?)
+                ON CONFLICT(board, query_key) DO UPDATE SET
+                    job_ids = excluded.job_ids,
+                    updated_at = excluded.updated_at
+                """,
+                (board, query_key, json.dumps(list(job_ids)), _now()),
+            )
+
+    def record_search_results(self, board, query_key, job_ids):
+        """Remember which jobs a query found, for its open-jobs backlog"""
+        with self._lock, self._conn:
+            self._conn.executemany(
+                "INSERT OR IGNORE INTO search_results (board, query_key, job_id) VALUES (?, ?, ?)",
+                [(board, query_key, job_id) for job_id in job_ids],
+            )
+
+    def open_search_jobs(self, board, query_key, exclude=(), max_age_days=None):
+        """Stored jobs a query found earlier that were neither applied to nor dismissed
+
+        Args:
+            board (str): Board name
+            query_key (str): Query key, as used for search marks
+            exclude (iterable): Job ids to leave out, e.g. the ones this run returns anyway
+            max_age_days (int): Leave out jobs not seen for this many days
+
+        Returns:
+            list: Job dicts with job_id, job_title, company, location, url and job_board
+        """
+        query = f"""
+            SELECT jobs.* FROM search_results
+            JOIN jobs ON jobs.job_id = search_results.job_id
+            WHERE search_results.board = ? AND search_results.query_key = ?
+              AND NOT EXISTS (
+                  SELECT 1 FROM applications
+                  WHERE applications.job_id = jobs.job_id
+                    AND applications.status IN ({",".join("?" * len(HANDLED_STATUSES))})
+              )
+        """
+        params = [board, query_key, *HANDLED_STATUSES]
+        if max_age_days:
+            cutoff = datetime.now(timezone.utc) - timedelta(days=max_age_days)
+            query += " AND jobs.last_seen_at >= ?"
+            params.append(cutoff.isoformat(timespec="seconds"))
+        query += " ORDER BY jobs.last_seen_at DESC"
+        with self._lock:
+            rows = self._conn.execute(query, params).fetchall()
+        exclude = set(exclude)
+        return [
+            {
+                "job_id": row["job_id"],
+                "job_title": row["position"],
+                "company": row["company"],
+                "location": row["location"],
+                "url": row["url"],
+                "job_board": row["job_board"],
+            }
+            for row in rows
+            if row["job_id"] not in exclude
+        ]
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
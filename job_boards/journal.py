@@ -0,0 +1,196 @@
+"""
+Append-only progress journal so interrupted search and apply runs can resume
+"""
+import json
+import logging
+import os
+import threading
+import time
+from pathlib import Path
+from .job_store import make_job_id
+
+logger = logging.getLogger(__name__)
+
+SCRAPED = "scraped"
+SCORED = "scored"
+APPLYING = "applying"
+APPLIED = "applied"
+FAILED = "failed"
+SKIPPED = "skipped"
+
+# Writing these forces an fsync: losing them could repeat or hide a submitted application
+DURABLE_STATES = {APPLYING, APPLIED, FAILED}
+FINISHED_STATES = {APPLIED, SKIPPED}
+
+
+class RunJournal:
+    """Write-ahead log of each job's progress through a run
+
+    Every state change is appended as one JSON line. Lines are written
+    straight away but fsynced in batches of ``fsync_batch`` lines or every
+    ``fsync_interval`` seconds, except for apply states, which are synced
+    immediately. A crash can therefore only lose the newest scraped or
+    scored entries, which are cheap to redo.
+
+    Replaying the file gives each job's last state. A journal that exists
+    when a run starts belongs to a run that never called ``complete``, and
+    ``board_jobs`` and ``pending_jobs`` tell the new run what is left.
+
+    Usage:
+        journal = RunJournal.from_config(config)
+        orchestrator = SearchOrchestrator(config, job_store=store, journal=journal)
+        scheduler = ApplyScheduler(config, job_store=store, journal=journal)
+        scheduler.resume()
+        scheduler.add(orchestrator.search(keywords, location))
+        scheduler.run()
+        journal.complete()
+    """
+
+    def __init__(self, path="data/journal/apply_run.jsonl", fsync_batch=50, fsync_interval=1.0):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.fsync_batch = fsync_batch
+        self.fsync_interval = fsync_interval
+        self._lock = threading.Lock()
+        self._jobs = {}
+        self._boards = {}
+        self.interrupted = self.path.exists() and self._replay() > 0
+        self._file = open(self.path, "a", encoding="utf-8")
+        self._unsynced = 0
+        self._synced_at = time.monotonic()
+        if self.interrupted:
+            pending = sum(1 for entry in self._jobs.values() if entry["state"] not in FINISHED_STATES)
+            logger.info(f"Resuming interrupted run from {self.path}: {pending} jobs left to finish")
+
+    @classmethod
+    def from_config(cls, config, name="apply_run"):
+        """Build a journal from config["journal"], or None if it is disabled"""
+        journal_config = config.get("journal", {})
+        if not journal_config.get("enabled", True):
+            return None
+        directory = Path(journal_config.get("path", "data/journal"))
+        return cls(
+            directory / f"{name}.jsonl",
+            fsync_batch=journal_config.get("fsync_batch", 50),
+            fsync_interval=journal_config.get("fsync_interval", 1.0),
+        )
+
+    def _replay(self):
+        """Rebuild job and board states from the file; returns the number of entries read"""
+        count = 0
+        with open(self.path, encoding="utf-8") as journal_file:
+            for line in journal_file:
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    # A torn final line from the crash; everything before it is intact
+                    logger.warning(f"Ignoring incomplete journal line in {self.path}")
+                    continue
+                self._apply(entry)
+                count += 1
+        return count
+
+    def _apply(self, entry):
+        if entry.get("type") == "board":
+            self._boards[entry["id"]] = entry
+            return
+        previous = self._jobs.get(entry["id"], {})
+        # Later entries only carry what changed, so keep the job payload and score
+        merged = dict(previous)
+        merged.pop("error", None)
+        merged.update(entry)
+        self._jobs[entry["id"]] = merged
+
+    def _append(self, entry, durable=False):
+        line = json.dumps(entry, separators=(",", ":"))
+        with self._lock:
+            self._apply(entry)
+            self._file.write(line + "\n")
+            self._file.flush()
+            self._unsynced += 1
+            if (durable or self._unsynced >= self.fsync_batch
+                    or time.monotonic() - self._synced_at >= self.fsync_interval):
+                self._sync()
+
+    def _sync(self):
+        os.fsync(self._file.fileno())
+        self._unsynced = 0
+        self._synced_at = time.monotonic()
+
+    def record_job(self, job_data, state, error=None):
+        """Append a job's new state
+
+        Args:
+            job_data (dict): The job; its full data is stored the first time it is seen
+            state (str): One of scraped, scored, applying, applied, failed, skipped
+            error (str): Why an apply failed
+        """
+        job_id = job_data.get("job_id") or make_job_id(job_data)
+        entry = {"type": "job", "id": job_id, "state": state, "at": time.time()}
+        if job_id not in self._jobs:
+            entry["job"] = job_data
+        if "match_score" in job_data:
+            entry["score"] = job_data["match_score"]
+        if error:
+            entry["error"] = error
+        self._append(entry, durable=state in DURABLE_STATES)
+
+    def record_board(self, board_key, jobs):
+        """Mark a board's search finished, so a resumed run does not search it again"""
+        for job_data in jobs:
+            self.record_job(job_data, SCRAPED)
+        job_ids = [job_data.get("job_id") or make_job_id(job_data) for job_data in jobs]
+        self._append({"type": "board", "id": board_key, "job_ids": job_ids, "at": time.time()}, durable=True)
+
+    def board_jobs(self, board_key):
+        """Jobs found by a board search finished in this run, or None if it has not finished"""
+        entry = self._boards.get(board_key)
+        if entry is None:
+            return None
+        return [self._job_data(job_id) for job_id in entry["job_ids"] if job_id in self._jobs]
+
+    def _job_data(self, job_id):
+        entry = self._jobs[job_id]
+        job_data = dict(entry.get("job") or {})
+        job_data["job_id"] = job_id
+        if "score" in entry:
+            job_data["match_score"] = entry["score"]
+        return job_data
+
+    def state(self, job_id):
+        entry = self._jobs.get(job_id)
+        return entry["state"] if entry else None
+
+    def pending_jobs(self):
+        """Jobs that still need work: not yet applied, failed, or cut off mid-apply"""
+        return [
+            self._job_data(job_id) for job_id, entry in self._jobs.items()
+            if entry["state"] not in FINISHED_STATES and entry.get("job")
+        ]
+
+    def summary(self):
+        counts = {}
+        for entry in self._jobs.values():
+            counts[entry["state"]] = counts.get(entry["state"], 0) + 1
+        counts["boards"] = len(self._boards)
+        return counts
+
+    def sync(self):
+        """Force buffered entries to disk"""
+        with self._lock:
+            if self._unsynced:
+                self._sync()
+
+    def close(self):
+        with self._lock:
+            if not self._file.closed:
+                self._sync()
+                self._file.close()
+
+    def complete(self):
+        """End the run: the journal is removed so the next run starts fresh"""
+        self.close()
+        self.path.unlink(missing_ok=True)
+        self._jobs.clear()
+        self._boards.clear()
+        self.interrupted = False
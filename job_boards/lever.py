@@ -1,17 +1,34 @@
 """
 Lever job board implementation
 """
-import time
 import logging
+import time
 from selenium.webdriver.common.by import By
-from selenium.common.exceptions import NoSuchElementException
 from .base import JobBoardBase
+from .forms import DEFAULT_FORM_SELECTORS
+from .http_fetch import fetch_json
 
 logger = logging.getLogger(__name__)
 
 class LeverBoard(JobBoardBase):
     """Lever job board implementation"""
     
+    CARD_SELECTOR = "div.posting"
+    CARD_FIELDS = {
+        "job_title": "h5",
+        "location": "span.sort-by-location",
+        "url": ("a.posting-title", "href"),
+    }
+    # Apply button candidates, tried together; see find_first
+    APPLY_SELECTORS = [
+        "a.postings-btn",
+        "button.postings-btn",
+        "a.apply-button",
+        "button.apply-button",
+    ]
+    NETWORK_IDLE_WAITS = True
+    FORM_SELECTORS = ["#application-form", "form.application-form"] + DEFAULT_FORM_SELECTORS
+    
     @property
     def board_name(self):
         return "lever"
@@ -41,66 +58,88 @@ class LeverBoard(JobBoardBase):
         for company in lever_companies:
             try:
                 logger.info(f"Searching {company['name']} jobs on Lever")
-                self.driver.get(company["url"])
-                
-                # Check for CAPTCHA
-                if self._handle_captcha():
-                    continue
-                
-                # Wait for page to load
-                time.sleep(3)
                 
-                # Try to use search box if available
-                search_box = self._wait_for_element(By.CSS_SELECTOR, "input[type='text']")
-                if search_box:
-                    search_terms = " ".join(search_keywords)
-                    search_box.clear()
-                    search_box.send_keys(search_terms)
-                    search_button = self._wait_for_clickable(By.CSS_SELECTOR, "button[type='submit']")
-                    if search_button:
-                        search_button.click()
-                        time.sleep(3)
+                # The public postings API answers in one GET; the browser is only a fallback
+                postings = self._http_first(
+                    lambda: self._search_api(company),
+                    lambda: self._search_selenium(company, search_keywords),
+                )
                 
-                # Find all job postings
-                job_cards = self.driver.find_elements(By.CSS_SELECTOR, "div.posting")
-                
-                for job in job_cards[:10]:  # Limit to 10 jobs per company
-                    try:
-                        title_elem = job.find_element(By.CSS_SELECTOR, "h5")
-                        location_elem = job.find_element(By.CSS_SELECTOR, "span.sort-by-location")
-                        link_elem = job.find_element(By.CSS_SELECTOR, "a.posting-title")
-                        
-                        job_title = title_elem.text.strip()
-                        
-                        # Skip senior/lead positions
-                        if any(keyword.lower() in job_title.lower() for keyword in exclude_keywords):
-                            logger.info(f"Skipping senior/lead position: {job_title}")
-                            continue
-                        
-                        # Skip jobs that don't match our keywords
-                        if not any(keyword.lower() in job_title.lower() for keyword in search_keywords):
-                            continue
-                        
-                        job_data = {
-                            "job_title": job_title,
-                            "company": company["name"],
-                            "location": location_elem.text.strip(),
-                            "url": link_elem.get_attribute("href"),
-                            "job_board": f"{self.board_name}_{company['name'].lower()}"
-                        }
-                        job_data["job_id"] = self._get_unique_job_id(job_data)
-                        jobs.append(job_data)
-                        
-                    except NoSuchElementException:
+                scan = self.incremental_scan(keywords, location, scope=company["name"])
+                company_jobs = 0
+                for job_data in postings:
+                    if company_jobs >= 10:  # Limit to 10 jobs per company
+                        break
+                    job_title = job_data["job_title"]
+                    
+                    # Skip senior/lead positions
+                    if any(keyword.lower() in job_title.lower() for keyword in exclude_keywords):
+                        logger.info(f"Skipping senior/lead position: {job_title}")
                         continue
-                    except Exception as e:
-                        logger.error(f"Error parsing {company['name']} job: {e}")
+                    
+                    # Skip jobs that don't match our keywords
+                    if not any(keyword.lower() in job_title.lower() for keyword in search_keywords):
+                        continue
+                    
+                    job_data["company"] = company["name"]
+                    job_data["job_board"] = f"{self.board_name}_{company['name'].lower()}"
+                    job_data["job_id"] = self._get_unique_job_id(job_data)
+                    if scan and not scan.accept(job_data):
+                        if scan.done:
+                            break
+                        continue
+                    jobs.append(job_data)
+                    company_jobs += 1
+                
+                if scan:
+                    jobs.extend(scan.commit())
             
             except Exception as e:
                 logger.error(f"Error searching {company['name']} jobs: {e}")
         
         return jobs
     
+    def _search_api(self, company):
+        """Fetch a company's postings from the Lever postings API"""
+        api_url = self._get_config_value("job_boards.lever.api_url", "https://api.lever.co/v0/postings")
+        slug = company["url"].rstrip("/").rsplit("/", 1)[-1]
+        postings = fetch_json(f"{api_url}/{slug}", params={"mode": "json"})
+        return [
+            {
+                "job_title": posting.get("text", "").strip(),
+                "location": (posting.get("categories") or {}).get("location", ""),
+                "url": posting.get("hostedUrl", ""),
+            }
+            for posting in postings
+        ]
+    
+    def _search_selenium(self, company, search_keywords):
+        """Load a company's postings page in the browser"""
+        self.driver.get(company["url"])
+        
+        # Check for CAPTCHA
+        if self._handle_captcha():
+            return []
+        
+        # Wait for page to load
+        self.wait_for_page_ready()
+        
+        # Try to use search box if available
+        search_box = self._wait_for_element(By.CSS_SELECTOR, "input[type='text']", timeout=3)
+        if search_box:
+            search_terms = " ".join(search_keywords)
+            search_box.clear()
+            search_box.send_keys(search_terms)
+            search_button = self._wait_for_clickable(By.CSS_SELECTOR, "button[type='submit']")
+            if search_button:
+                clicked_at = time.time()
+                search_button.click()
+                self.wait_for_network_idle(since=clicked_at)
+        
+        # Read every posting in one round trip
+        self.wait_for_cards(By.CSS_SELECTOR, self.CARD_SELECTOR)
+        return self.extract_cards(self.CARD_SELECTOR, self.CARD_FIELDS)
+    
     def apply_to_job(self, job_data):
         """Apply to a job on Lever"""
         try:
@@ -111,20 +150,8 @@ class LeverBoard(JobBoardBase):
             if self._handle_captcha():
                 return False
             
-            # Try different apply button selectors
-            apply_selectors = [
-                "a.postings-btn", 
-                "button.postings-btn",
-                "a.apply-button",
-                "button.apply-button"
-            ]
-            
-            apply_button = None
-            for selector in apply_selectors:
-                apply_button = self._wait_for_clickable(By.CSS_SELECTOR, selector, timeout=3)
-                if apply_button:
-                    break
-                    
+            # The selector that matched on the last Lever posting is tried first
+            apply_button = self.find_first("apply_button", self.APPLY_SELECTORS)
             if not apply_button:
                 logger.warning("Could not find apply button")
                 return False
@@ -132,7 +159,7 @@ class LeverBoard(JobBoardBase):
             apply_button.click()
             
             # Wait for application form
-            time.sleep(2)
+            self.wait_for_page_ready()
             
             # Check for redirects to external application systems
             current_url = self.driver.current_url
@@ -140,83 +167,26 @@ class LeverBoard(JobBoardBase):
                 logger.info(f"Redirected to external system: {current_url}")
                 return False
             
-            # Get personal info from config
-            name = self._get_config_value("personal_info.name", "")
-            email = self._get_config_value("personal_info.email", "")
-            phone = self._get_config_value("personal_info.phone", "")
-            
-            # Fill out application form
-            form_filled = False
-            
-            # Try to fill name fields
-            for name_selector in ["input[name='name']", "input[name='full_name']", "input[id*='name']"]:
-                name_field = self._wait_for_element(By.CSS_SELECTOR, name_selector, timeout=2)
-                if name_field:
-                    name_field.clear()
-                    name_field.send_keys(name)
-                    form_filled = True
-                    break
-            
-            # Try to fill email fields
-            for email_selector in ["input[name='email']", "input[type='email']", "input[id*='email']"]:
-                email_field = self._wait_for_element(By.CSS_SELECTOR, email_selector, timeout=2)
-                if email_field:
-                    email_field.clear()
-                    email_field.send_keys(email)
-                    form_filled = True
-                    break
-            
-            # Try to fill phone fields
-            for phone_selector in ["input[name='phone']", "input[type='tel']", "input[id*='phone']"]:
-                phone_field = self._wait_for_element(By.CSS_SELECTOR, phone_selector, timeout=2)
-                if phone_field:
-                    phone_field.clear()
-                    phone_field.send_keys(phone)
-                    form_filled = True
-                    break
-            
-            # Upload resume
-            for resume_selector in ["input[type='file']", "input[name='resume']", "input[accept='.pdf']"]:
-                resume_upload = self._wait_for_element(By.CSS_SELECTOR, resume_selector, timeout=2)
-                if resume_upload:
-                    resume_upload.send_keys(str(self.resume_path.absolute()))
-                    form_filled = True
-                    logger.info("Uploaded resume")
-                    break
-            
-            # Upload cover letter if configured
-            if self._get_config_value("use_cover_letter", True):
-                for cl_selector in ["input[name='cover_letter']", "input[name='coverLetter']", 
-                                  "input[type='file']:not([name='resume'])"]:
-                    cl_upload = self._wait_for_element(By.CSS_SELECTOR, cl_selector, timeout=2)
-                    if cl_upload:
-                        cl_upload.send_keys(str(self.cover_letter_path.absolute()))
-                        logger.info("Uploaded cover letter")
-                        break
-            
-            if not form_filled:
+            # Read the whole form in one round trip, then fill the fields it actually has
+            form = self.discover_form()
+            if not self.fill_form(form["fields"]):
                 logger.warning("Could not fill out any form fields")
                 return False
+            self.answer_questions(form["fields"])
             
-            # Try to submit the form
-            for submit_selector in ["button[type='submit']", "input[type='submit']", 
-                                  "button.submit-app-btn", "button:contains('Submit')"]:
-                submit_button = self._wait_for_clickable(By.CSS_SELECTOR, submit_selector, timeout=2)
-                if submit_button:
-                    submit_button.click()
-                    time.sleep(5)
-                    
-                    # Check for confirmation
-                    confirmation_texts = ["thank you", "application received", "application submitted"]
-                    page_text = self.driver.page_source.lower()
-                    
-                    for text in confirmation_texts:
-                        if text in page_text:
-                            logger.info(f"Application confirmed: '{text}' found on page")
-                            return True
-                    
-                    logger.info("Form submitted, no explicit confirmation found")
+            submit_button = form["submit"]
+            if submit_button:
+                submit_button.click()
+                
+                # Check for confirmation
+                confirmation_texts = ["thank you", "application received", "application submitted"]
+                confirmed = self.wait_for_page_text(confirmation_texts, timeout=5)
+                if confirmed:
+                    logger.info(f"Application confirmed: '{confirmed}' found on page")
                     return True
+                
+                logger.info("Form submitted, no explicit confirmation found")
+                return True
             
             logger.warning("Could not find submit button")
             return False
@@ -1,13 +1,9 @@
 """
 LinkedIn job board implementation
 """
-import time
 import logging
-import random
 from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import TimeoutException, NoSuchElementException
+from selenium.common.exceptions import TimeoutException
 from .base import JobBoardBase
 
 logger = logging.getLogger(__name__)
@@ -15,6 +11,16 @@ logger = logging.getLogger(__name__)
 class LinkedInBoard(JobBoardBase):
     """LinkedIn job board implementation"""
     
+    LOGIN_URL = "https://www.linkedin.com/login"
+    AUTH_COOKIES = ("li_at",)
+    CARD_SELECTOR = ".job-card-container"
+    CARD_FIELDS = {
+        'job_title': ".job-card-list__title",
+        'company': ".job-card-container__company-name",
+        'location': ".job-card-container__metadata-item",
+        'url': (".job-card-list__title", "href"),
+    }
+    
     @property
     def board_name(self):
         return "linkedin"
@@ -31,28 +37,25 @@ class LinkedInBoard(JobBoardBase):
                 return False
             
             # Go to LinkedIn login page
-            self.driver.get("https://www.linkedin.com/login")
-            time.sleep(random.uniform(2, 4))  # Random delay
+            self.driver.get(self.LOGIN_URL)
             
             # Enter email
-            email_field = self.driver.find_element(By.ID, "username")
+            email_field = self.wait_for_element(By.ID, "username")
+            self.human_pause(1, 2)
             email_field.send_keys(email)
-            time.sleep(random.uniform(1, 2))
+            self.human_pause(1, 2)
             
             # Enter password
             password_field = self.driver.find_element(By.ID, "password")
             password_field.send_keys(password)
-            time.sleep(random.uniform(1, 2))
+            self.human_pause(1, 2)
             
             # Click login button
             login_button = self.driver.find_element(By.CSS_SELECTOR, "button[type='submit']")
             login_button.click()
             
             # Wait for login to complete
-            time.sleep(5)
-            
-            # Check if login was successful
-            if "feed" in self.driver.current_url:
+            if self.wait_for_url_contains("feed"):
                 logger.info("Successfully logged into LinkedIn")
                 return True
             else:
@@ -69,31 +72,28 @@ class LinkedInBoard(JobBoardBase):
             # Construct search URL
             search_url = f"https://www.linkedin.com/jobs/search/?keywords={keywords}&location={location}"
             self.driver.get(search_url)
-            time.sleep(random.uniform(3, 5))
             
             # Wait for job listings to load
-            WebDriverWait(self.driver, 10).until(
-                EC.presence_of_element_located((By.CLASS_NAME, "jobs-search-results__list"))
-            )
-            
-            # Scroll to load more jobs
-            self._scroll_to_load_more_jobs()
+            self.wait_for_element(By.CLASS_NAME, "jobs-search-results__list")
+            self.human_pause(1, 2)
             
             # Get all job cards
-            job_cards = self.driver.find_elements(By.CLASS_NAME, "job-card-container")
-            jobs = []
+            self.wait_for_cards(By.CSS_SELECTOR, self.CARD_SELECTOR)
             
-            for card in job_cards:
-                try:
-                    job = {
-                        'title': card.find_element(By.CLASS_NAME, "job-card-list__title").text,
-                        'company': card.find_element(By.CLASS_NAME, "job-card-container__company-name").text,
-                        'location': card.find_element(By.CLASS_NAME, "job-card-container__metadata-item").text,
-                        'link': card.find_element(By.CLASS_NAME, "job-card-list__title").get_attribute("href")
-                    }
-                    jobs.append(job)
-                except NoSuchElementException:
+            # Scroll the list until it stops growing, or until last run's newest jobs come into view
+            jobs = []
+            scan = self.incremental_scan(keywords, location)
+            for job in self.paginate(
+                self.CARD_SELECTOR, self.CARD_FIELDS, scroll=True, scroll_root=".jobs-search-results__list", scan=scan
+            ):
+                job['job_board'] = self.board_name
+                job['job_id'] = self._get_unique_job_id(job)
+                if scan and not scan.accept(job):
                     continue
+                jobs.append(job)
+            
+            if scan:
+                jobs.extend(scan.commit())
             
             logger.info(f"Found {len(jobs)} jobs on LinkedIn")
             return jobs
@@ -106,111 +106,56 @@ class LinkedInBoard(JobBoardBase):
         """Apply to a specific job on LinkedIn"""
         try:
             # Navigate to job page
-            self.driver.get(job['link'])
-            time.sleep(random.uniform(2, 4))
+            self.driver.get(job['url'])
+            self.wait_for_page_ready()
+            self.human_pause(1, 2)
             
             # Click Easy Apply button if available
             try:
-                easy_apply_button = WebDriverWait(self.driver, 5).until(
-                    EC.element_to_be_clickable((By.CLASS_NAME, "jobs-apply-button"))
+                easy_apply_button = self.wait_for_element(
+                    By.CLASS_NAME, "jobs-apply-button", timeout=5, condition="clickable"
                 )
                 easy_apply_button.click()
-                time.sleep(random.uniform(2, 3))
+                self.human_pause(1, 2)
                 
                 # Handle the application form
                 if self._handle_application_form():
-                    logger.info(f"Successfully applied to {job['company']} - {job['title']}")
+                    logger.info(f"Successfully applied to {job['company']} - {job['job_title']}")
                     return True
                 else:
-                    logger.warning(f"Failed to complete application for {job['company']} - {job['title']}")
+                    logger.warning(f"Failed to complete application for {job['company']} - {job['job_title']}")
                     return False
                     
             except TimeoutException:
-                logger.info(f"No Easy Apply button found for {job['company']} - {job['title']}")
+                logger.info(f"No Easy Apply button found for {job['company']} - {job['job_title']}")
                 return False
                 
         except Exception as e:
             logger.error(f"Error applying to job: {str(e)}")
             return False
     
-    def _scroll_to_load_more_jobs(self):
-        """Scroll down to load more job listings"""
-        try:
-            # Get the job list container
-            job_list = self.driver.find_element(By.CLASS_NAME, "jobs-search-results__list")
-            
-            # Scroll a few times to load more jobs
-            for _ in range(3):
-                self.driver.execute_script("arguments[0].scrollTop = arguments[0].scrollHeight", job_list)
-                time.sleep(random.uniform(2, 3))
-                
-        except Exception as e:
-            logger.error(f"Error scrolling job list: {str(e)}")
-    
     def _handle_application_form(self):
         """Handle the LinkedIn Easy Apply form"""
         try:
             # Wait for the form to load
-            WebDriverWait(self.driver, 10).until(
-                EC.presence_of_element_located((By.CLASS_NAME, "jobs-easy-apply-content"))
-            )
-            
-            # Get personal info from config
-            personal_info = self.config.get("personal_info", {})
-            
-            # Fill out the form fields
-            form_fields = {
-                "name": ["input[name='name']", "input[name='full_name']", "input[id*='name']"],
-                "email": ["input[name='email']", "input[type='email']", "input[id*='email']"],
-                "phone": ["input[name='phone']", "input[type='tel']", "input[id*='phone']"],
-                "location": ["input[name='location']", "input[id*='location']"],
-                "resume": ["input[type='file']", "input[name='resume']", "input[accept='.pdf']"],
-                "cover_letter": ["input[name='cover_letter']", "input[name='coverLetter']"]
-            }
+            self.wait_for_element(By.CLASS_NAME, "jobs-easy-apply-content", timeout=10)
             
-            # Fill each field type
-            for field_type, selectors in form_fields.items():
-                for selector in selectors:
-                    try:
-                        field = WebDriverWait(self.driver, 3).until(
-                            EC.presence_of_element_located((By.CSS_SELECTOR, selector))
-                        )
-                        
-                        if field_type == "resume":
-                            field.send_keys(str(self.resume_path.absolute()))
-                            logger.info("Uploaded resume")
-                            break
-                        elif field_type == "cover_letter" and self.config.get("use_cover_letter", True):
-                            field.send_keys(str(self.cover_letter_path.absolute()))
-                            logger.info("Uploaded cover letter")
-                            break
-                        else:
-                            value = personal_info.get(field_type, "")
-                            if value:
-                                field.clear()
-                                field.send_keys(value)
-                                logger.info(f"Filled {field_type} field")
-                                break
-                    except TimeoutException:
-                        continue
+            # Read every field in one round trip and fill the ones asking for applicant details
+            form = self.discover_form(".jobs-easy-apply-content")
+            self.fill_form(form["fields"])
             
             # Handle any additional questions
-            self._handle_additional_questions()
+            self._handle_additional_questions(form["fields"])
             
             # Click Submit button
-            submit_button = WebDriverWait(self.driver, 10).until(
-                EC.element_to_be_clickable((By.CSS_SELECTOR, "button[aria-label='Submit application']"))
+            submit_button = self.wait_for_element(
+                By.CSS_SELECTOR, "button[aria-label='Submit application']", timeout=10, condition="clickable"
             )
             submit_button.click()
             
-            # Wait for confirmation
-            time.sleep(random.uniform(2, 3))
-            
             # Check for success message
             try:
-                success_message = WebDriverWait(self.driver, 5).until(
-                    EC.presence_of_element_located((By.CSS_SELECTOR, ".jobs-easy-apply-success"))
-                )
+                success_message = self.wait_for_element(By.CSS_SELECTOR, ".jobs-easy-apply-success", timeout=5)
                 logger.info("Application submitted successfully")
                 return True
             except TimeoutException:
@@ -221,42 +166,11 @@ class LinkedInBoard(JobBoardBase):
             logger.error(f"Error handling application form: {str(e)}")
             return False
     
-    def _handle_additional_questions(self):
-        """Handle additional questions in the application form"""
-        try:
-            # Look for common question types
-            question_selectors = [
-                "input[type='radio']",  # Radio buttons
-                "input[type='checkbox']",  # Checkboxes
-                "select",  # Dropdowns
-                "textarea"  # Text areas
-            ]
-            
-            for selector in question_selectors:
-                elements = self.driver.find_elements(By.CSS_SELECTOR, selector)
-                for element in elements:
-                    try:
-                        # Get the question text (usually in a nearby label or parent element)
-                        question_text = element.get_attribute("aria-label") or element.get_attribute("name")
-                        
-                        if element.tag_name == "select":
-                            # For dropdowns, select the first option
-                            element.click()
-                            time.sleep(0.5)
-                            first_option = element.find_element(By.CSS_SELECTOR, "option:not([value=''])")
-                            first_option.click()
-                        elif element.get_attribute("type") in ["radio", "checkbox"]:
-                            # For radio buttons and checkboxes, click if not selected
-                            if not element.is_selected():
-                                element.click()
-                        elif element.tag_name == "textarea":
-                            # For text areas, enter a generic response
-                            element.send_keys("I am interested in this position and would be a great fit for the role.")
-                        
-                        time.sleep(random.uniform(0.5, 1))
-                    except Exception as e:
-                        logger.warning(f"Error handling question element: {str(e)}")
-                        continue
-                        
-        except Exception as e:
-            logger.error(f"Error handling additional questions: {str(e)}") 
\ No newline at end of file
+    def _handle_additional_questions(self, fields):
+        """Answer the form's screening questions from the answer bank
+        
+        Args:
+            fields (list): Field dicts from discover_form
+        """
+        self.answer_questions(fields)
+        self.human_pause(0.5, 1) 
\ No newline at end of file
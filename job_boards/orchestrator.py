@@ -0,0 +1,291 @@
+"""
+Concurrent multi-board search orchestrator
+"""
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from .indeed import IndeedBoard
+from .linkedin import LinkedInBoard
+from .builtin import BuiltInBoard
+from .wellfound import WellFoundBoard
+from .ziprecruiter import ZipRecruiterBoard
+from .welcome_to_the_jungle import WelcomeToTheJungleBoard
+from .direct_company import DirectCompanyBoard
+from .lever import LeverBoard
+from .driver_pool import WebDriverPool
+from .dedup import JobDeduplicator
+from .http_fetch import fetch_stats
+from .search_cache import SearchCache, search_key, HIT, STALE, MISS
+
+logger = logging.getLogger(__name__)
+
+BOARD_CLASSES = {
+    "indeed": IndeedBoard,
+    "linkedin": LinkedInBoard,
+    "builtin": BuiltInBoard,
+    "wellfound": WellFoundBoard,
+    "ziprecruiter": ZipRecruiterBoard,
+    "welcome_to_the_jungle": WelcomeToTheJungleBoard,
+    "direct_company": DirectCompanyBoard,
+    "lever": LeverBoard,
+}
+
+DEFAULT_BOARDS = [
+    "indeed",
+    "linkedin",
+    "builtin",
+    "wellfound",
+    "ziprecruiter",
+    "welcome_to_the_jungle",
+    "direct_company",
+]
+
+
+class BoardResult:
+    """Outcome of one board's search"""
+
+    def __init__(self, board_name, jobs=None, error=None, elapsed=0.0, timed_out=False, wait_report=None,
+                 cache_status=None):
+        self.board_name = board_name
+        self.jobs = jobs or []
+        self.new_jobs = list(self.jobs)
+        self.error = error
+        self.elapsed = elapsed
+        self.timed_out = timed_out
+        self.wait_report = wait_report or {}
+        self.cache_status = cache_status
+
+    @property
+    def ok(self):
+        return self.error is None and not self.timed_out
+
+    def __repr__(self):
+        status = "timeout" if self.timed_out else ("error" if self.error else "ok")
+        if self.cache_status:
+            status += f", cache {self.cache_status}"
+        return f"BoardResult({self.board_name!r}, jobs={len(self.jobs)}, {status}, {self.elapsed:.1f}s)"
+
+
+class SearchOrchestrator:
+    """Fans one (keywords, location) query out to every configured board
+
+    Each worker thread leases its own browser from a WebDriverPool sized to
+    the worker count, so boards never share a driver. Results are yielded as
+    each board finishes, and a board that exceeds ``board_timeout`` seconds
+    is abandoned and its browser quit.
+
+    Results are cached per (board, keywords, location) in a SearchCache, so
+    a repeated search is answered without starting a browser or logging in.
+    Stale entries are returned immediately and refreshed in the background.
+    
+    With a RunJournal, each finished board's jobs are journaled, and a run
+    resumed from an interrupted journal does not search those boards again.
+
+    Usage:
+        orchestrator = SearchOrchestrator(config)
+        for result in orchestrator.iter_search("python developer", "Remote"):
+            print(result.board_name, len(result.jobs))
+    """
+
+    def __init__(self, config, boards=None, max_workers=None, board_timeout=None, driver_pool=None, job_store=None,
+                 search_cache=None, journal=None):
+        self.config = config
+        self.job_store = job_store
+        self.journal = journal
+        self.search_cache = search_cache if search_cache is not None else SearchCache.from_config(config)
+        self._refresh_executor = None
+        self._refresh_active = {}
+        orchestrator_config = config.get("orchestrator", {})
+
+        self.board_names = boards or self._configured_boards()
+        self.max_workers = max_workers or orchestrator_config.get("max_workers", 4)
+        self.board_timeout = board_timeout or orchestrator_config.get("board_timeout", 300)
+
+        self._owns_pool = driver_pool is None
+        self.driver_pool = driver_pool or WebDriverPool.from_config(config, max_size=self.max_workers)
+
+    def _configured_boards(self):
+        """Return the boards enabled in the config, or the defaults"""
+        board_config = self.config.get("job_boards", {})
+        names = [
+            name for name, settings in board_config.items()
+            if name in BOARD_CLASSES and settings.get("enabled", True)
+        ]
+        return names or list(DEFAULT_BOARDS)
+
+    def _schedule_refresh(self, board_name, keywords, location, key):
+        """Re-run a stale search in the background, at most once per key at a time
+
+        The refresh gets the same ``board_timeout`` as a foreground search and
+        its jobs are stored the same way.
+        """
+        if not self.search_cache.begin_refresh(key):
+            return
+        if self._refresh_executor is None:
+            self._refresh_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="search-refresh")
+
+        def refresh():
+            watchdog = threading.Timer(self.board_timeout, self._abort, (board_name, self._refresh_active))
+            watchdog.daemon = True
+            watchdog.start()
+            try:
+                result = self._run_board(board_name, keywords, location, self._refresh_active, use_cache=False)
+                self._store_jobs(result)
+                logger.info(f"Background refresh of {board_name}: {result}")
+            except Exception as e:
+                logger.error(f"Background refresh of {board_name} failed: {e}")
+            finally:
+                watchdog.cancel()
+                self._refresh_active.pop(board_name, None)
+                self.search_cache.end_refresh(key)
+
+        self._refresh_executor.submit(refresh)
+
+    def _run_board(self, board_name, keywords, location, active, use_cache=True):
+        """Worker: search one board on its own leased browser"""
+        board = None
+        start = time.monotonic()
+        key = search_key(board_name, keywords, location)
+        if self.search_cache and use_cache:
+            cached, status, age = self.search_cache.get(key)
+            if status in (HIT, STALE):
+                logger.info(f"{board_name} served from cache ({status}, {age:.0f}s old)")
+                if status == STALE:
+                    self._schedule_refresh(board_name, keywords, location, key)
+                return BoardResult(board_name, cached, elapsed=time.monotonic() - start, cache_status=status)
+        active[board_name] = {"started": start, "board": None}
+        try:
+            board = BOARD_CLASSES[board_name](
+                self.config, driver_pool=self.driver_pool, job_store=self.job_store
+            )
+            active[board_name]["board"] = board
+            if not board.ensure_logged_in():
+                logger.warning(f"Login to {board_name} failed, searching anonymously")
+            jobs = board.search_jobs(keywords, location) or []
+            # Boards return [] when scraping fails, so only real results are cached
+            if self.search_cache and jobs:
+                self.search_cache.put(key, jobs)
+            return BoardResult(
+                board_name, jobs, elapsed=time.monotonic() - start, wait_report=board.wait_report(),
+                cache_status=MISS if self.search_cache else None
+            )
+        except Exception as e:
+            logger.error(f"Error searching {board_name}: {e}")
+            return BoardResult(board_name, error=str(e), elapsed=time.monotonic() - start)
+        finally:
+            if board:
+                board.quit()
+
+    def _abort(self, board_name, active):
+        """Quit the browser of a board that ran past its timeout"""
+        board = active.get(board_name, {}).get("board")
+        if board is None or not board.has_driver:
+            return
+        logger.warning(f"Aborting {board_name}")
+        try:
+            # Quitting the underlying driver makes the worker's blocked Selenium call raise.
+            # A pooled session is discarded so the pool destroys it on release instead of reusing it
+            if board.driver_pool:
+                board.driver_pool.discard(board.driver)
+            else:
+                board.driver.quit()
+        except Exception as e:
+            logger.warning(f"Error aborting {board_name}: {e}")
+
+    def _store_jobs(self, result):
+        """Upsert a board's jobs on scrape so later runs and applies can skip known jobs"""
+        if self.job_store and result.jobs:
+            result.new_jobs = self.job_store.upsert_jobs(result.jobs)
+
+    def iter_search(self, keywords, location):
+        """Search every board concurrently, yielding BoardResult as each completes
+
+        Args:
+            keywords (str or list): Search keywords
+            location (str): Search location
+
+        Yields:
+            BoardResult: One result per board, in completion order
+        """
+        active = {}
+        board_names = list(self.board_names)
+        if self.journal:
+            for name in list(board_names):
+                journaled = self.journal.board_jobs("|".join(search_key(name, keywords, location)))
+                if journaled is not None:
+                    logger.info(f"{name} already searched in the interrupted run, reusing {len(journaled)} jobs")
+                    board_names.remove(name)
+                    yield BoardResult(name, journaled)
+        executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="board")
+        futures = {
+            executor.submit(self._run_board, name, keywords, location, active): name
+            for name in board_names
+        }
+        pending = set(futures)
+        try:
+            while pending:
+                done, pending = wait(pending, timeout=1.0, return_when=FIRST_COMPLETED)
+                for future in done:
+                    result = future.result()
+                    self._store_jobs(result)
+                    if self.journal and result.ok:
+                        self.journal.record_board("|".join(search_key(result.board_name, keywords, location)),
+                                                  result.jobs)
+                    logger.info(
+                        f"{result.board_name} finished with {len(result.jobs)} jobs in {result.elapsed:.1f}s "
+                        f"(waits: {result.wait_report}, fetch paths so far: "
+                        f"{fetch_stats().get(result.board_name, {})})"
+                    )
+                    yield result
+
+                now = time.monotonic()
+                for future in list(pending):
+                    board_name = futures[future]
+                    started = active.get(board_name, {}).get("started")
+                    if started is None or now - started < self.board_timeout:
+                        continue
+                    logger.warning(f"{board_name} exceeded {self.board_timeout}s, abandoning it")
+                    pending.discard(future)
+                    future.cancel()
+                    self._abort(board_name, active)
+                    yield BoardResult(board_name, elapsed=now - started, timed_out=True)
+        finally:
+            for future in pending:
+                future.cancel()
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def search(self, keywords, location, dedupe=True):
+        """Search every board and return the merged job list
+        
+        Args:
+            keywords (str or list): Search keywords
+            location (str): Search location
+            dedupe (bool): Collapse the same posting found on several boards
+                into one canonical job that lists every source
+        """
+        jobs = []
+        for result in self.iter_search(keywords, location):
+            jobs.extend(result.jobs)
+        if dedupe:
+            threshold = self.config.get("orchestrator", {}).get("dedupe_threshold", 0.7)
+            jobs = JobDeduplicator(threshold=threshold).dedupe(jobs)
+        return jobs
+
+    def close(self):
+        """Shut down the browser pool if the orchestrator created it"""
+        if self._refresh_executor:
+            # Abandon a running refresh rather than wait out its timeout, then let it
+            # release its browser before the pool goes away
+            for board_name in list(self._refresh_active):
+                self._abort(board_name, self._refresh_active)
+            self._refresh_executor.shutdown(wait=True, cancel_futures=True)
+            self._refresh_executor = None
+        if self._owns_pool:
+            self.driver_pool.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
@@ -0,0 +1,218 @@
+"""
+Result page pagination: next links, URL offsets and infinite scroll
+"""
+import logging
+from selenium.common.exceptions import TimeoutException, WebDriverException
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support import expected_conditions as EC
+from .waits import wait_until
+
+logger = logging.getLogger(__name__)
+
+
+class TabPrefetcher:
+    """Loads the next result page in a background tab while the current one is parsed
+
+    ``prefetch`` opens the URL with window.open, which returns at once and
+    lets the browser load the page in parallel. ``open`` then switches to
+    that tab and closes the old one, or falls back to a normal navigation
+    if nothing was prefetched for the URL.
+    """
+
+    def __init__(self, driver, enabled=True):
+        self.driver = driver
+        self.enabled = enabled
+        self.hits = 0
+        self.misses = 0
+        self._url = None
+        self._handle = None
+
+    def prefetch(self, url):
+        if not self.enabled or not url or url == self._url:
+            return
+        self.discard()
+        try:
+            before = set(self.driver.window_handles)
+            self.driver.execute_script("window.open(arguments[0], '_blank');", url)
+            opened = [handle for handle in self.driver.window_handles if handle not in before]
+        except WebDriverException as e:
+            logger.debug(f"Could not prefetch {url}: {e}")
+            return
+        if opened:
+            self._url, self._handle = url, opened[0]
+
+    def open(self, url):
+        """Show url in the board's window, using the prefetched tab if there is one"""
+        if self._handle and url == self._url:
+            handle = self._handle
+            self._url = self._handle = None
+            try:
+                self.driver.close()
+                self.driver.switch_to.window(handle)
+                self.hits += 1
+                return
+            except WebDriverException as e:
+                logger.debug(f"Prefetched tab unusable, loading {url} directly: {e}")
+                self._recover()
+        else:
+            self.discard()
+        self.misses += 1
+        self.driver.get(url)
+
+    def discard(self):
+        """Close a prefetched tab that will not be used"""
+        if not self._handle:
+            return
+        current = self.driver.current_window_handle
+        try:
+            self.driver.switch_to.window(self._handle)
+            self.driver.close()
+        except WebDriverException:
+            pass
+        finally:
+            self._url = self._handle = None
+            self.driver.switch_to.window(current)
+
+    def _recover(self):
+        handles = self.driver.window_handles
+        if handles:
+            self.driver.switch_to.window(handles[0])
+
+
+class Paginator:
+    """Yields job cards from every result page until a stop condition is hit
+
+    One of three strategies moves between pages:
+        page_url: callable(page_index) -> URL, e.g. Indeed's ``start=`` offsets
+        next_selector: CSS selector of the "next page" link or button
+        scroll: scroll the list (or ``scroll_root``) to load more cards
+
+    Reading stops when a page adds no unseen cards, after ``max_results``
+    cards or ``max_pages`` pages, or once the optional IncrementalScan is
+    done. Linked pages are prefetched in a second tab while the consumer
+    handles the current page's cards.
+    """
+
+    def __init__(self, board, card_selector, fields, page_url=None, next_selector=None, scroll=False,
+                 scroll_root=None, max_results=100, max_pages=5, max_scrolls=10, prefetch=True, scan=None):
+        self.board = board
+        self.card_selector = card_selector
+        self.fields = fields
+        self.page_url = page_url
+        self.next_selector = next_selector
+        self.scroll = scroll
+        self.scroll_root = scroll_root
+        self.max_results = max_results
+        self.max_pages = max_scrolls if scroll else max_pages
+        self.prefetcher = TabPrefetcher(board.driver, enabled=prefetch and not scroll)
+        self.scan = scan
+        self.pages = 0
+        self.results = 0
+        self.stopped_reason = None
+        self._seen = set()
+
+    def _card_key(self, job_data):
+        return job_data.get("url") or tuple(sorted(job_data.items()))
+
+    def _next_url(self):
+        """URL of the following page: None if there is none, '' if it is reached by clicking"""
+        if self.page_url:
+            return self.page_url(self.pages)
+        if self.next_selector:
+            return self.board.driver.execute_script(
+                "var link = document.querySelector(arguments[0]);"
+                "return link && !link.disabled && link.getAttribute('aria-disabled') !== 'true' ? "
+                "(link.href || '') : null;",
+                self.next_selector,
+            )
+        return None
+
+    def _card_count(self):
+        return self.board.driver.execute_script(
+            "return document.querySelectorAll(arguments[0]).length;", self.card_selector
+        )
+
+    def _scroll_for_more(self, timeout=5):
+        """Scroll to the bottom and wait for the card count to grow"""
+        before = self._card_count()
+        self.board.driver.execute_script(
+            "var root = arguments[0] ? document.querySelector(arguments[0]) : null;"
+            "if (root) { root.scrollTop = root.scrollHeight; }"
+            "else { window.scrollTo(0, document.body.scrollHeight); }",
+            self.scroll_root,
+        )
+        try:
+            with self.board.wait_stats.dom_wait():
+                wait_until(self.board.driver, lambda driver: self._card_count() > before, timeout)
+        except TimeoutException:
+            return False
+        return True
+
+    def _turn_page(self, next_url):
+        """Move to the next page; False if there is none"""
+        if self.scroll:
+            return self._scroll_for_more()
+        if next_url:
+            self.prefetcher.open(next_url)
+        elif self.next_selector and next_url is not None:
+            # A next button without an href, e.g. a client-side pager
+            button = self.board._wait_for_clickable(By.CSS_SELECTOR, self.next_selector, timeout=3)
+            if not button:
+                return False
+            first_card = self.board.driver.find_elements(By.CSS_SELECTOR, self.card_selector)[:1]
+            button.click()
+            if first_card:
+                try:
+                    with self.board.wait_stats.dom_wait():
+                        wait_until(self.board.driver, EC.staleness_of(first_card[0]), 10)
+                except TimeoutException:
+                    return False
+        else:
+            return False
+        if self.board._handle_captcha():
+            return False
+        self.board.wait_for_cards(By.CSS_SELECTOR, self.card_selector)
+        return True
+
+    def _stop(self, reason):
+        self.stopped_reason = reason
+        logger.info(
+            f"{self.board.board_name}: pagination stopped ({reason}) after {self.pages} pages, "
+            f"{self.results} cards, {self.prefetcher.hits} prefetched"
+        )
+
+    def __iter__(self):
+        try:
+            while True:
+                cards = self.board.extract_cards(self.card_selector, self.fields)
+                new_cards = [job_data for job_data in cards if self._card_key(job_data) not in self._seen]
+                self.pages += 1
+                if not new_cards:
+                    self._stop("no new cards")
+                    return
+
+                next_url = None
+                if self.pages < self.max_pages and not self.scroll:
+                    next_url = self._next_url()
+                    self.prefetcher.prefetch(next_url)
+
+                for job_data in new_cards:
+                    self._seen.add(self._card_key(job_data))
+                    yield job_data
+                    self.results += 1
+                    if self.max_results and self.results >= self.max_results:
+                        self._stop("max results")
+                        return
+                    if self.scan and self.scan.done:
+                        self._stop("reached known jobs")
+                        return
+
+                if self.pages >= self.max_pages:
+                    self._stop("max pages")
+                    return
+                self.board.human_pause(0.5, 1.5)
+                if not self._turn_page(next_url):
+                    self._stop("no next page")
+                    return
+        finally:
+            self.prefetcher.discard()
@@ -0,0 +1,106 @@
+"""
+TTL + LRU cache of search results keyed by normalized query
+"""
+import logging
+import threading
+import time
+from collections import OrderedDict
+
+logger = logging.getLogger(__name__)
+
+HIT = "HIT"
+STALE = "STALE"
+MISS = "MISS"
+
+
+def _normalize(value):
+    if isinstance(value, (list, tuple, set)):
+        return ",".join(sorted(_normalize(item) for item in value))
+    return " ".join(str(value or "").lower().split())
+
+
+def search_key(board_name, keywords, location, filters=None):
+    """Normalized cache key, so case, spacing and keyword order don't split entries"""
+    filter_part = "&".join(f"{name}={_normalize(value)}" for name, value in sorted((filters or {}).items()))
+    return (board_name, _normalize(keywords), _normalize(location), filter_part)
+
+
+class SearchCache:
+    """Caches each board's results for ``ttl`` seconds
+
+    After the TTL an entry is served as STALE for up to ``stale_ttl`` more
+    seconds while one background refresh replaces it. Entries beyond
+    ``max_entries`` are evicted least recently used first.
+    """
+
+    def __init__(self, ttl=3600, stale_ttl=3600, max_entries=256):
+        self.ttl = ttl
+        self.stale_ttl = stale_ttl
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self._refreshing = set()
+        self._lock = threading.Lock()
+        self._stats = {HIT: 0, STALE: 0, MISS: 0, "evictions": 0}
+
+    @classmethod
+    def from_config(cls, config):
+        """Build a cache from config["search_cache"], or None if it is disabled"""
+        cache_config = config.get("search_cache", {})
+        if not cache_config.get("enabled", True):
+            return None
+        return cls(
+            ttl=cache_config.get("ttl", 3600),
+            stale_ttl=cache_config.get("stale_ttl", 3600),
+            max_entries=cache_config.get("max_entries", 256),
+        )
+
+    def get(self, key):
+        """Return (jobs, status, age_seconds); jobs is None on a MISS"""
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or now - entry[0] > self.ttl + self.stale_ttl:
+                if entry is not None:
+                    del self._entries[key]
+                self._stats[MISS] += 1
+                return None, MISS, None
+            self._entries.move_to_end(key)
+            stored_at, jobs = entry
+            status = HIT if now - stored_at <= self.ttl else STALE
+            self._stats[status] += 1
+        # Callers get their own copies, since upserts add job_id to the dicts
+        return [dict(job) for job in jobs], status, now - stored_at
+
+    def put(self, key, jobs):
+        with self._lock:
+            self._entries[key] = (time.monotonic(), [dict(job) for job in jobs])
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self._stats["evictions"] += 1
+
+    def begin_refresh(self, key):
+        """Claim the background refresh of a stale entry; False if one is already running"""
+        with self._lock:
+            if key in self._refreshing:
+                return False
+            self._refreshing.add(key)
+            return True
+
+    def end_refresh(self, key):
+        with self._lock:
+            self._refreshing.discard(key)
+
+    def invalidate(self, board_name=None):
+        """Drop every entry, or only one board's"""
+        with self._lock:
+            for key in list(self._entries):
+                if board_name is None or key[0] == board_name:
+                    del self._entries[key]
+
+    def stats(self):
+        with self._lock:
+            stats = dict(self._stats)
+            stats["entries"] = len(self._entries)
+            stats["refreshing"] = len(self._refreshing)
+        return stats
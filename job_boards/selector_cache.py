@@ -0,0 +1,153 @@
+"""
+Learned winners of fallback selector lists, persisted per board and domain
+"""
+import json
+import logging
+import os
+import threading
+import time
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+
+class SelectorCache:
+    """Remembers which candidate of a fallback selector list matched
+
+    Entries are keyed by board, page domain and a lookup name such as
+    ``apply_button``. The remembered winner is tried first on the next
+    lookup. When a different candidate matches instead, the entry is
+    invalidated and the new winner learned; when nothing matches
+    ``max_failures`` times in a row, the entry is dropped.
+
+    Each entry counts hits (the remembered winner matched), misses and
+    invalidations, so a falling hit rate shows where a site's layout
+    drifted. Each board's entries are saved to ``<directory>/<board>.json``.
+
+    Usage:
+        cache = SelectorCache.from_config(config)
+        selectors = cache.order("lever", "jobs.lever.co", "apply_button", selectors)
+        cache.record("lever", "jobs.lever.co", "apply_button", winner)
+        cache.save("lever")
+    """
+
+    def __init__(self, directory="data/selectors", max_failures=3):
+        self.directory = Path(directory)
+        self.max_failures = max_failures
+        self._lock = threading.Lock()
+        self._boards = {}
+        self._dirty = set()
+
+    @classmethod
+    def from_config(cls, config):
+        """Build a cache from config["selector_cache"], or None if it is disabled"""
+        cache_config = config.get("selector_cache", {})
+        if not cache_config.get("enabled", True):
+            return None
+        return cls(cache_config.get("path", "data/selectors"), max_failures=cache_config.get("max_failures", 3))
+
+    def _path(self, board_name):
+        return self.directory / f"{board_name}.json"
+
+    def _entries(self, board_name):
+        """A board's entries as domain -> key -> entry, loaded on first use"""
+        if board_name not in self._boards:
+            try:
+                self._boards[board_name] = json.loads(self._path(board_name).read_text())
+            except (OSError, ValueError):
+                self._boards[board_name] = {}
+        return self._boards[board_name]
+
+    def _entry(self, board_name, domain, key):
+        return self._entries(board_name).setdefault(domain, {}).setdefault(
+            key, {"selector": None, "hits": 0, "misses": 0, "invalidations": 0, "failures": 0, "updated_at": None}
+        )
+
+    def order(self, board_name, domain, key, selectors):
+        """Return the candidates with the remembered winner first"""
+        with self._lock:
+            entry = self._entries(board_name).get(domain, {}).get(key)
+            winner = entry and entry["selector"]
+        if winner not in selectors:
+            return list(selectors)
+        return [winner] + [selector for selector in selectors if selector != winner]
+
+    def record(self, board_name, domain, key, selector):
+        """Record the outcome of a lookup
+
+        Args:
+            board_name (str): Board that did the lookup
+            domain (str): Domain of the page it was done on
+            key (str): Lookup name
+            selector (str): Candidate that matched, or None if none did
+        """
+        with self._lock:
+            entry = self._entry(board_name, domain, key)
+            cached = entry["selector"]
+            if selector is not None and selector == cached:
+                entry["hits"] += 1
+                entry["failures"] = 0
+                # Hits only move counters; they are written with the next save
+                self._dirty.add(board_name)
+                return
+
+            entry["misses"] += 1
+            if selector is not None:
+                if cached is not None:
+                    entry["invalidations"] += 1
+                    logger.info(f"{board_name} {key} on {domain}: {cached!r} stopped matching, now {selector!r}")
+                entry["selector"] = selector
+                entry["failures"] = 0
+            elif cached is not None:
+                entry["failures"] += 1
+                if entry["failures"] >= self.max_failures:
+                    entry["invalidations"] += 1
+                    entry["selector"] = None
+                    entry["failures"] = 0
+                    logger.info(f"{board_name} {key} on {domain}: {cached!r} stopped matching, forgetting it")
+            entry["updated_at"] = time.time()
+            self._dirty.add(board_name)
+
+    def save(self, board_name=None):
+        """Write changed boards' entries atomically, or only one board's"""
+        with self._lock:
+            names = [board_name] if board_name else list(self._dirty)
+            for name in names:
+                if name not in self._dirty:
+                    continue
+                self.directory.mkdir(parents=True, exist_ok=True)
+                path = self._path(name)
+                tmp_path = path.with_suffix(".tmp")
+                with open(tmp_path, "w") as f:
+                    json.dump(self._boards[name], f, indent=2)
+                os.replace(tmp_path, path)
+                self._dirty.discard(name)
+
+    def stats(self, board_name=None):
+        """Per-entry hit rates, lowest first, for every saved or used board
+
+        Returns:
+            list: Dicts with board, domain, key, selector, hits, misses, invalidations and hit_rate
+        """
+        with self._lock:
+            if board_name:
+                names = [board_name]
+            else:
+                saved = {path.stem for path in self.directory.glob("*.json")} if self.directory.exists() else set()
+                names = sorted(saved | set(self._boards))
+            rows = []
+            for name in names:
+                for domain, keys in self._entries(name).items():
+                    for key, entry in keys.items():
+                        lookups = entry["hits"] + entry["misses"]
+                        rows.append({
+                            "board": name,
+                            "domain": domain,
+                            "key": key,
+                            "selector": entry["selector"],
+                            "hits": entry["hits"],
+                            "misses": entry["misses"],
+                            "invalidations": entry["invalidations"],
+                            "hit_rate": entry["hits"] / lookups if lookups else 0.0,
+                        })
+        return sorted(rows, key=lambda row: (row["hit_rate"], row["board"], row["domain"], row["key"]))
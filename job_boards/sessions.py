@@ -0,0 +1,182 @@
+"""
+Cookie persistence so logged-in board sessions survive a restart
+"""
+import json
+import logging
+import os
+import time
+from pathlib import Path
+from urllib.parse import urlsplit
+from selenium.common.exceptions import TimeoutException
+from .waits import document_ready, wait_until
+
+logger = logging.getLogger(__name__)
+
+# Keys WebDriver.add_cookie accepts
+_COOKIE_KEYS = ("name", "value", "path", "domain", "secure", "httpOnly", "expiry", "sameSite")
+
+
+class SessionStore:
+    """Saves each board's cookies to a JSON file readable only by the owner
+
+    Usage:
+        store = SessionStore.from_config(config)
+        store.save("linkedin", driver.get_cookies())
+        cookies = store.load("linkedin")
+    """
+
+    def __init__(self, directory="data/sessions"):
+        self.directory = Path(directory)
+
+    @classmethod
+    def from_config(cls, config):
+        """Build a store from config["sessions"], or None if persistence is disabled"""
+        session_config = config.get("sessions", {})
+        if not session_config.get("enabled", True):
+            return None
+        return cls(session_config.get("path", "data/sessions"))
+
+    def _path(self, board_name):
+        return self.directory / f"{board_name}.json"
+
+    def save(self, board_name, cookies):
+        """Write the cookies atomically, replacing any earlier session"""
+        self.directory.mkdir(parents=True, exist_ok=True)
+        path = self._path(board_name)
+        tmp_path = path.with_suffix(".tmp")
+        fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, "w") as f:
+            json.dump({"saved_at": time.time(), "cookies": cookies}, f)
+        os.replace(tmp_path, path)
+        logger.info(f"Saved {len(cookies)} cookies for {board_name}")
+
+    def load(self, board_name):
+        """Return the saved cookies that have not expired, or an empty list"""
+        try:
+            data = json.loads(self._path(board_name).read_text())
+        except (OSError, ValueError):
+            return []
+        now = time.time()
+        return [
+            {key: cookie[key] for key in _COOKIE_KEYS if key in cookie}
+            for cookie in data.get("cookies", [])
+            if not cookie.get("expiry") or cookie["expiry"] > now
+        ]
+
+    def clear(self, board_name):
+        """Forget a board's session, e.g. after the site rejected it"""
+        try:
+            self._path(board_name).unlink()
+        except FileNotFoundError:
+            pass
+
+
+class SessionLoginMixin:
+    """Login handling shared by the job board base classes
+
+    Reuses the live session, then cookies saved in ``session_store``, and
+    only then calls the board's ``login``. Expects ``driver``,
+    ``session_store``, ``board_name`` and ``logged_in`` on the board.
+
+    Boards that log in set LOGIN_URL; AUTH_COOKIES are cookie names only a
+    logged-in session has.
+    """
+
+    LOGIN_URL = None
+    AUTH_COOKIES = ()
+    LOGIN_URL_MARKERS = ("login", "signin", "sign-in", "auth")
+
+    @property
+    def has_driver(self):
+        """Whether a browser has been started for this board"""
+        return getattr(self, "driver", None) is not None
+
+    def wait_for_page_ready(self, timeout=15):
+        """Wait until document.readyState is 'complete'"""
+        try:
+            return wait_until(self.driver, document_ready, timeout)
+        except TimeoutException:
+            return False
+
+    def is_logged_in(self, verify=False):
+        """Cheap check that the browser still holds a logged-in session
+
+        While the browser is on the board's site and the board names its
+        AUTH_COOKIES, this only reads cookies. Otherwise, or with verify=True,
+        it loads LOGIN_URL: a logged-in session is redirected away from it.
+        """
+        if not self.LOGIN_URL:
+            return True
+        if not self.has_driver:
+            return False
+        try:
+            login_host = urlsplit(self.LOGIN_URL).netloc
+            if self.AUTH_COOKIES and not verify and urlsplit(self.driver.current_url).netloc == login_host:
+                names = {cookie["name"] for cookie in self.driver.get_cookies()}
+                return all(name in names for name in self.AUTH_COOKIES)
+
+            self.driver.get(self.LOGIN_URL)
+            self.wait_for_page_ready()
+            current_url = self.driver.current_url.lower()
+            return (
+                urlsplit(current_url).netloc.endswith(".".join(login_host.split(".")[-2:]))
+                and not any(marker in current_url for marker in self.LOGIN_URL_MARKERS)
+            )
+        except Exception as e:
+            logger.warning(f"Session probe for {self.board_name} failed: {e}")
+            return False
+
+    def save_session(self):
+        """Persist the browser's cookies so a later run can skip logging in"""
+        if self.session_store and self.LOGIN_URL and self.has_driver:
+            try:
+                self.session_store.save(self.board_name, self.driver.get_cookies())
+            except Exception as e:
+                logger.warning(f"Could not save {self.board_name} session: {e}")
+
+    def restore_session(self):
+        """Load saved cookies into the browser and verify they are still accepted
+
+        Returns:
+            bool: True if the restored session is logged in
+        """
+        if not self.session_store or not self.LOGIN_URL:
+            return False
+        cookies = self.session_store.load(self.board_name)
+        if not cookies:
+            return False
+
+        # Cookies can only be added for the domain the browser is on
+        parts = urlsplit(self.LOGIN_URL)
+        self.driver.get(f"{parts.scheme}://{parts.netloc}/")
+        self.wait_for_page_ready()
+        for cookie in cookies:
+            try:
+                self.driver.add_cookie(cookie)
+            except Exception as e:
+                logger.debug(f"Skipping cookie {cookie.get('name')}: {e}")
+
+        if self.is_logged_in(verify=True):
+            logger.info(f"Restored saved {self.board_name} session")
+            return True
+        logger.info(f"Saved {self.board_name} session expired")
+        self.session_store.clear(self.board_name)
+        return False
+
+    def ensure_logged_in(self, *credentials):
+        """Log in only when needed: reuse the live session, then saved cookies, then the login form
+
+        Args:
+            credentials: Passed on to the board's ``login``
+        """
+        if not self.LOGIN_URL:
+            return self.login(*credentials)
+        if self.logged_in and self.is_logged_in():
+            return True
+        if self.restore_session():
+            self.logged_in = True
+            return True
+        self.logged_in = bool(self.login(*credentials))
+        if self.logged_in:
+            self.save_session()
+        return self.logged_in
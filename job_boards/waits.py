@@ -0,0 +1,230 @@
+"""
+Condition-driven waits and human pacing for job board implementations
+"""
+import json
+import logging
+import random
+import time
+from contextlib import contextmanager
+from selenium.common.exceptions import TimeoutException, WebDriverException
+from selenium.webdriver.support.ui import WebDriverWait
+
+logger = logging.getLogger(__name__)
+
+
+class WaitStats:
+    """Tracks time spent waiting on the DOM versus deliberate throttling"""
+
+    def __init__(self):
+        self.dom_wait_seconds = 0.0
+        self.throttle_seconds = 0.0
+        self.dom_waits = 0
+        self.dom_timeouts = 0
+        self.pauses = 0
+        self.skipped_pauses = 0
+
+    @contextmanager
+    def dom_wait(self):
+        """Time a block that waits for a DOM or network condition"""
+        start = time.monotonic()
+        try:
+            yield
+        except TimeoutException:
+            self.dom_timeouts += 1
+            raise
+        finally:
+            self.dom_wait_seconds += time.monotonic() - start
+            self.dom_waits += 1
+
+    def report(self):
+        """Return a summary of where the waiting time went"""
+        total = self.dom_wait_seconds + self.throttle_seconds
+        return {
+            "dom_wait_seconds": round(self.dom_wait_seconds, 2),
+            "throttle_seconds": round(self.throttle_seconds, 2),
+            "dom_waits": self.dom_waits,
+            "dom_timeouts": self.dom_timeouts,
+            "pauses": self.pauses,
+            "skipped_pauses": self.skipped_pauses,
+            "throttle_share": round(self.throttle_seconds / total, 2) if total else 0.0,
+        }
+
+
+class PacingBudget:
+    """Deliberate human-like throttling, kept separate from DOM waits
+
+    Configured from the ``pacing`` section of the config:
+        enabled (bool): Turn pacing off entirely, e.g. for local fixtures
+        scale (float): Multiplier applied to every pause
+        max_total_seconds (float): Cap on total pause time per board run
+    """
+
+    def __init__(self, stats, enabled=True, scale=1.0, max_total_seconds=None):
+        self.stats = stats
+        self.enabled = enabled
+        self.scale = scale
+        self.max_total_seconds = max_total_seconds
+
+    @classmethod
+    def from_config(cls, config, stats):
+        pacing = config.get("pacing", {})
+        return cls(
+            stats,
+            enabled=pacing.get("enabled", True),
+            scale=pacing.get("scale", 1.0),
+            max_total_seconds=pacing.get("max_total_seconds"),
+        )
+
+    def pause(self, min_seconds, max_seconds):
+        """Sleep for a random interval, within the remaining budget
+
+        Returns:
+            float: Seconds actually slept
+        """
+        if not self.enabled:
+            self.stats.skipped_pauses += 1
+            return 0.0
+
+        delay = random.uniform(min_seconds, max_seconds) * self.scale
+        if self.max_total_seconds is not None:
+            delay = min(delay, max(self.max_total_seconds - self.stats.throttle_seconds, 0.0))
+        if delay <= 0:
+            self.stats.skipped_pauses += 1
+            return 0.0
+
+        time.sleep(delay)
+        self.stats.throttle_seconds += delay
+        self.stats.pauses += 1
+        return delay
+
+
+def document_ready(driver):
+    """Condition: the current document has finished loading"""
+    try:
+        return driver.execute_script("return document.readyState") == "complete"
+    except WebDriverException:
+        return False
+
+
+class card_count_stable:
+    """Condition: at least ``min_count`` cards exist and the count stopped changing
+
+    The count must stay the same for ``settle`` seconds before the condition
+    passes, so lazily rendered lists are not cut short.
+    """
+
+    def __init__(self, locator, settle=0.5, min_count=1):
+        self.locator = locator
+        self.settle = settle
+        self.min_count = min_count
+        self._last_count = None
+        self._since = None
+
+    def __call__(self, driver):
+        elements = driver.find_elements(*self.locator)
+        count = len(elements)
+        now = time.monotonic()
+        if count != self._last_count:
+            self._last_count = count
+            self._since = now
+            return False
+        if count >= self.min_count and now - self._since >= self.settle:
+            return elements
+        return False
+
+
+class network_idle:
+    """Condition: no requests in flight for ``idle_time`` seconds
+
+    Reads Network.* events from Chrome's performance log, which is enabled
+    through the ``goog:loggingPrefs`` capability. Requests started before
+    ``since`` (a time.time() value, default: when the condition is created)
+    are ignored, so a long-poll or stream left open by the page never keeps
+    the wait from passing. If the log is unavailable the condition falls
+    back to document readiness.
+    """
+
+    def __init__(self, idle_time=0.5, since=None):
+        self.idle_time = idle_time
+        # Log entry timestamps are wall-clock milliseconds
+        self._since_ms = (since if since is not None else time.time()) * 1000
+        self._in_flight = set()
+        self._idle_since = None
+        self._log_available = True
+
+    def _drain(self, driver):
+        for entry in driver.get_log("performance"):
+            try:
+                message = json.loads(entry.get("message", ""))["message"]
+            except (ValueError, KeyError, TypeError):
+                continue
+            # Compared exactly: Network.requestWillBeSentExtraInfo can arrive after the
+            # request finished and must not count as a new one
+            method = message.get("method")
+            request_id = (message.get("params") or {}).get("requestId")
+            if method == "Network.requestWillBeSent":
+                if entry.get("timestamp", self._since_ms) >= self._since_ms:
+                    self._in_flight.add(request_id)
+            elif method in ("Network.loadingFinished", "Network.loadingFailed"):
+                self._in_flight.discard(request_id)
+
+    def __call__(self, driver):
+        if self._log_available:
+            try:
+                self._drain(driver)
+            except WebDriverException:
+                self._log_available = False
+        if not self._log_available:
+            return document_ready(driver)
+
+        self._in_flight.discard(None)
+        now = time.monotonic()
+        if self._in_flight:
+            self._idle_since = None
+            return False
+        if self._idle_since is None:
+            self._idle_since = now
+        return now - self._idle_since >= self.idle_time
+
+
+class first_match:
+    """Condition: some candidate selector matches a visible, enabled element
+
+    Every candidate is checked in one script call, so each poll costs a
+    single round trip however many candidates there are. Returns
+    (candidate index, element) for the first candidate, in list order,
+    that matches.
+    """
+
+    SCRIPT = """
+    const selectors = arguments[0];
+    for (let i = 0; i < selectors.length; i++) {
+        let elements;
+        try {
+            elements = document.querySelectorAll(selectors[i]);
+        } catch (e) {
+            continue;
+        }
+        for (const el of elements) {
+            if (!el.disabled && (el.offsetWidth || el.offsetHeight || el.getClientRects().length)) {
+                return [i, el];
+            }
+        }
+    }
+    return null;
+    """
+
+    def __init__(self, selectors):
+        self.selectors = list(selectors)
+
+    def __call__(self, driver):
+        try:
+            match = driver.execute_script(self.SCRIPT, self.selectors)
+        except WebDriverException:
+            return False
+        return (match[0], match[1]) if match else False
+
+
+def wait_until(driver, condition, timeout=10, poll_frequency=0.1):
+    """Poll a condition quickly and return its first truthy value"""
+    return WebDriverWait(driver, timeout, poll_frequency=poll_frequency).until(condition)
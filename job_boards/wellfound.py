@@ -1,10 +1,8 @@
 """
 WellFound (formerly AngelList) job board implementation
 """
-import time
 import logging
 from selenium.webdriver.common.by import By
-from selenium.common.exceptions import NoSuchElementException
 from .base import JobBoardBase
 
 logger = logging.getLogger(__name__)
@@ -12,6 +10,15 @@ logger = logging.getLogger(__name__)
 class WellFoundBoard(JobBoardBase):
     """WellFound job board implementation"""
     
+    LOGIN_URL = "https://wellfound.com/login"
+    CARD_SELECTOR = "div.job-card"
+    CARD_FIELDS = {
+        "job_title": "h3.job-title",
+        "company": "div.company-name",
+        "location": "div.location",
+        "url": ("a.job-link", "href"),
+    }
+    
     @property
     def board_name(self):
         return "wellfound"
@@ -19,8 +26,8 @@ class WellFoundBoard(JobBoardBase):
     def login(self):
         """Login to WellFound"""
         try:
-            self.driver.get("https://wellfound.com/login")
-            time.sleep(2)
+            self.driver.get(self.LOGIN_URL)
+            self.wait_for_page_ready()
             
             # Check for CAPTCHA
             if self._handle_captcha():
@@ -48,10 +55,7 @@ class WellFoundBoard(JobBoardBase):
             sign_in_button.click()
             
             # Wait for login to complete
-            time.sleep(5)
-            
-            # Check if login was successful
-            if "dashboard" in self.driver.current_url:
+            if self.wait_for_url_contains("dashboard"):
                 logger.info("Successfully logged in to WellFound")
                 return True
             else:
@@ -65,6 +69,7 @@ class WellFoundBoard(JobBoardBase):
     def search_jobs(self, keywords, location):
         """Search for jobs on WellFound"""
         jobs = []
+        scan = self.incremental_scan(keywords, location)
         try:
             # Format keywords for URL
             if isinstance(keywords, list):
@@ -96,42 +101,33 @@ class WellFoundBoard(JobBoardBase):
                 return jobs
             
             # Wait for job listings to load
-            time.sleep(5)
+            self.wait_for_cards(By.CSS_SELECTOR, self.CARD_SELECTOR)
             
             # Get exclude keywords from config
             exclude_keywords = self._get_config_value("job_search.exclude_keywords", ["senior", "lead", "principal"])
             
-            # Find all job cards
-            job_cards = self.driver.find_elements(By.CSS_SELECTOR, "div.job-card")
-            
-            for job in job_cards[:20]:  # Limit to 20 jobs
-                try:
-                    title_elem = job.find_element(By.CSS_SELECTOR, "h3.job-title")
-                    company_elem = job.find_element(By.CSS_SELECTOR, "div.company-name")
-                    location_elem = job.find_element(By.CSS_SELECTOR, "div.location")
-                    link_elem = job.find_element(By.CSS_SELECTOR, "a.job-link")
-                    
-                    job_title = title_elem.text.strip()
-                    
-                    # Skip senior/lead positions
-                    if any(keyword.lower() in job_title.lower() for keyword in exclude_keywords):
-                        logger.info(f"Skipping senior/lead position: {job_title}")
-                        continue
-                    
-                    job_data = {
-                        "job_title": job_title,
-                        "company": company_elem.text.strip(),
-                        "location": location_elem.text.strip(),
-                        "url": link_elem.get_attribute("href"),
-                        "job_board": self.board_name
-                    }
-                    job_data["job_id"] = self._get_unique_job_id(job_data)
-                    jobs.append(job_data)
-                    
-                except NoSuchElementException:
+            # The listing loads more jobs as it is scrolled; read 20 by default
+            max_results = self._get_config_value("job_boards.wellfound.max_results", 20)
+            for job_data in self.paginate(
+                self.CARD_SELECTOR, self.CARD_FIELDS, scroll=True, max_results=max_results, scan=scan
+            ):
+                job_title = job_data["job_title"]
+                
+                # Skip senior/lead positions
+                if any(keyword.lower() in job_title.lower() for keyword in exclude_keywords):
+                    logger.info(f"Skipping senior/lead position: {job_title}")
+                    continue
+                
+                job_data["job_board"] = self.board_name
+                job_data["job_id"] = self._get_unique_job_id(job_data)
+                if scan and not scan.accept(job_data):
+                    if scan.done:
+                        break
                     continue
-                except Exception as e:
-                    logger.error(f"Error parsing WellFound job: {e}")
+                jobs.append(job_data)
+            
+            if scan:
+                jobs.extend(scan.commit())
             
         except Exception as e:
             logger.error(f"Error searching WellFound jobs: {e}")
@@ -159,85 +155,28 @@ class WellFoundBoard(JobBoardBase):
             apply_button.click()
             
             # Wait for application form
-            time.sleep(2)
-            
-            # Get personal info from config
-            name = self._get_config_value("personal_info.name", "")
-            email = self._get_config_value("personal_info.email", "")
-            phone = self._get_config_value("personal_info.phone", "")
-            
-            # Fill out application form
-            form_filled = False
-            
-            # Try to fill name fields
-            for name_selector in ["input[name='name']", "input[name='full_name']", "input[id*='name']"]:
-                name_field = self._wait_for_element(By.CSS_SELECTOR, name_selector, timeout=2)
-                if name_field:
-                    name_field.clear()
-                    name_field.send_keys(name)
-                    form_filled = True
-                    break
-            
-            # Try to fill email fields
-            for email_selector in ["input[name='email']", "input[type='email']", "input[id*='email']"]:
-                email_field = self._wait_for_element(By.CSS_SELECTOR, email_selector, timeout=2)
-                if email_field:
-                    email_field.clear()
-                    email_field.send_keys(email)
-                    form_filled = True
-                    break
-            
-            # Try to fill phone fields
-            for phone_selector in ["input[name='phone']", "input[type='tel']", "input[id*='phone']"]:
-                phone_field = self._wait_for_element(By.CSS_SELECTOR, phone_selector, timeout=2)
-                if phone_field:
-                    phone_field.clear()
-                    phone_field.send_keys(phone)
-                    form_filled = True
-                    break
-            
-            # Upload resume
-            for resume_selector in ["input[type='file']", "input[name='resume']", "input[accept='.pdf']"]:
-                resume_upload = self._wait_for_element(By.CSS_SELECTOR, resume_selector, timeout=2)
-                if resume_upload:
-                    resume_upload.send_keys(str(self.resume_path.absolute()))
-                    form_filled = True
-                    logger.info("Uploaded resume")
-                    break
-            
-            # Upload cover letter if configured
-            if self._get_config_value("use_cover_letter", True):
-                for cl_selector in ["input[name='cover_letter']", "input[name='coverLetter']", 
-                                  "input[type='file']:not([name='resume'])"]:
-                    cl_upload = self._wait_for_element(By.CSS_SELECTOR, cl_selector, timeout=2)
-                    if cl_upload:
-                        cl_upload.send_keys(str(self.cover_letter_path.absolute()))
-                        logger.info("Uploaded cover letter")
-                        break
+            self.wait_for_page_ready()
             
-            if not form_filled:
+            # Read the whole form in one round trip, then fill the fields it actually has
+            form = self.discover_form()
+            if not self.fill_form(form["fields"]):
                 logger.warning("Could not fill out any form fields")
                 return False
+            self.answer_questions(form["fields"])
             
-            # Try to submit the form
-            for submit_selector in ["button[type='submit']", "input[type='submit']", 
-                                  "button.submit-app-btn", "button:contains('Submit')"]:
-                submit_button = self._wait_for_clickable(By.CSS_SELECTOR, submit_selector, timeout=2)
-                if submit_button:
-                    submit_button.click()
-                    time.sleep(5)
-                    
-                    # Check for confirmation
-                    confirmation_texts = ["thank you", "application received", "application submitted"]
-                    page_text = self.driver.page_source.lower()
-                    
-                    for text in confirmation_texts:
-                        if text in page_text:
-                            logger.info(f"Application confirmed: '{text}' found on page")
-                            return True
-                    
-                    logger.info("Form submitted, no explicit confirmation found")
+            submit_button = form["submit"]
+            if submit_button:
+                submit_button.click()
+                
+                # Check for confirmation
+                confirmation_texts = ["thank you", "application received", "application submitted"]
+                confirmed = self.wait_for_page_text(confirmation_texts, timeout=5)
+                if confirmed:
+                    logger.info(f"Application confirmed: '{confirmed}' found on page")
                     return True
+                
+                logger.info("Form submitted, no explicit confirmation found")
+                return True
             
             logger.warning("Could not find submit button")
             return False
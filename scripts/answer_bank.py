@@ -0,0 +1,59 @@
+"""List screening questions that have no stored answer, and answer them.
+
+Answers given here are stored as confirmed and reused by every board on
+the next application that asks the same (or a similar) question.
+
+Usage:
+    python scripts/answer_bank.py pending
+    python scripts/answer_bank.py answer "Are you authorized to work in the US?" "Yes"
+    python scripts/answer_bank.py answers
+"""
+import argparse
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from job_boards.answer_bank import AnswerBank, CONFIRMED, resolve_path
+
+
+def print_pending(bank, limit):
+    pending = bank.pending(limit=limit)
+    if not pending:
+        print("No unanswered questions")
+        return
+    print(f"{'seen':>5}  {'board':<22} question")
+    for question in pending:
+        print(f"{question['seen_count']:>5}  {question['job_board']:<22} {question['question']}")
+        if question["options"]:
+            print(f"{'':>29} options: {' | '.join(question['options'])}")
+
+
+def print_answers(bank):
+    for answer in bank.answers():
+        print(f"{answer['uses']:>5}  {answer['source']:<10} {answer['question']} -> {answer['answer']}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--path", default=None, help="Answer bank database (default: ANSWER_BANK_PATH or data/answer_bank.db)")
+    commands = parser.add_subparsers(dest="command", required=True)
+    pending_parser = commands.add_parser("pending", help="List unanswered questions, most frequent first")
+    pending_parser.add_argument("--limit", type=int, default=None)
+    answer_parser = commands.add_parser("answer", help="Store a confirmed answer")
+    answer_parser.add_argument("question")
+    answer_parser.add_argument("answer")
+    commands.add_parser("answers", help="List stored answers")
+    args = parser.parse_args()
+
+    bank = AnswerBank(resolve_path(args.path))
+    try:
+        if args.command == "pending":
+            print_pending(bank, args.limit)
+        elif args.command == "answer":
+            bank.learn(args.question, args.answer, source=CONFIRMED)
+            print(f"Stored answer for {args.question!r}")
+        else:
+            print_answers(bank)
+    finally:
+        bank.close()
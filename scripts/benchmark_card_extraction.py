@@ -0,0 +1,88 @@
+"""Benchmark per-field card parsing against batched execute_script extraction.
+
+Loads the saved search-result fixtures in scripts/fixtures into a headless
+Chrome and counts the WebDriver commands (HTTP round trips) each approach
+needs to read every card.
+
+Usage:
+    python scripts/benchmark_card_extraction.py
+"""
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from selenium.webdriver.common.by import By
+from job_boards.driver_pool import create_chrome_driver
+from job_boards.extraction import extract_cards
+from job_boards.indeed import IndeedBoard
+from job_boards.linkedin import LinkedInBoard
+
+FIXTURES = Path(__file__).resolve().parent / "fixtures"
+
+BOARDS = {
+    "indeed": (IndeedBoard, FIXTURES / "indeed_search.html"),
+    "linkedin": (LinkedInBoard, FIXTURES / "linkedin_search.html"),
+}
+
+
+class RoundTripCounter:
+    """Counts commands sent through a driver's command executor"""
+
+    def __init__(self, driver):
+        self.count = 0
+        executor = driver.command_executor
+        original = executor.execute
+
+        def counting_execute(command, params):
+            self.count += 1
+            return original(command, params)
+
+        executor.execute = counting_execute
+
+
+def parse_per_field(driver, card_selector, fields):
+    """The previous approach: find_element and .text/get_attribute per field"""
+    jobs = []
+    for card in driver.find_elements(By.CSS_SELECTOR, card_selector):
+        job = {}
+        for name, spec in fields.items():
+            selector, attribute = (spec, "text") if isinstance(spec, str) else spec[:2]
+            element = card.find_element(By.CSS_SELECTOR, selector)
+            job[name] = element.text.strip() if attribute == "text" else element.get_attribute(attribute)
+        jobs.append(job)
+    return jobs
+
+
+def run_benchmark(driver, counter, board_class, fixture):
+    driver.get(fixture.as_uri())
+    card_selector, fields = board_class.CARD_SELECTOR, board_class.CARD_FIELDS
+
+    results = {}
+    for label, parse in (
+        ("per-field", lambda: parse_per_field(driver, card_selector, fields)),
+        ("batched", lambda: extract_cards(driver, card_selector, fields)),
+    ):
+        counter.count = 0
+        start = time.perf_counter()
+        jobs = parse()
+        results[label] = (len(jobs), counter.count, time.perf_counter() - start)
+    return results
+
+
+if __name__ == "__main__":
+    with tempfile.TemporaryDirectory() as profile_dir:
+        driver = create_chrome_driver({"headless": True, "network_idle_waits": False}, profile_dir)
+        counter = RoundTripCounter(driver)
+        try:
+            print(f"{'board':<10} {'method':<10} {'cards':>6} {'round trips':>12} {'ms':>9}")
+            for board_name, (board_class, fixture) in BOARDS.items():
+                results = run_benchmark(driver, counter, board_class, fixture)
+                for label, (cards, round_trips, elapsed) in results.items():
+                    print(f"{board_name:<10} {label:<10} {cards:>6} {round_trips:>12} {elapsed * 1000:>9.1f}")
+                reduction = results["per-field"][1] / max(results["batched"][1], 1)
+                print(f"{board_name:<10} {'':<10} {'':>6} {f'{reduction:.0f}x fewer':>12}")
+        finally:
+            driver.quit()
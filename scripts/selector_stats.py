@@ -0,0 +1,37 @@
+"""Show how often each board's learned selectors still match.
+
+A low hit rate or a growing invalidation count means the site's layout
+changed and the fallback selector list may need a new candidate.
+
+Usage:
+    python scripts/selector_stats.py
+    python scripts/selector_stats.py --board lever
+"""
+import argparse
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from job_boards.selector_cache import SelectorCache
+
+
+def print_stats(rows):
+    if not rows:
+        print("No selector lookups recorded")
+        return
+    print(f"{'hit rate':>8}  {'hits':>5}  {'misses':>6}  {'invalid':>7}  {'board':<16} {'domain':<28} key -> selector")
+    for row in rows:
+        print(
+            f"{row['hit_rate']:>8.0%}  {row['hits']:>5}  {row['misses']:>6}  {row['invalidations']:>7}  "
+            f"{row['board']:<16} {row['domain']:<28} {row['key']} -> {row['selector']}"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--path", default="data/selectors", help="Selector cache directory")
+    parser.add_argument("--board", default=None, help="Only show this board")
+    args = parser.parse_args()
+
+    print_stats(SelectorCache(args.path).stats(args.board))
@@ -0,0 +1,63 @@
+"""
+Answer bank lookups: exact, reworded and near-miss questions
+"""
+import pytest
+from job_boards.answer_bank import AnswerBank, CONFIG, CONFIRMED, normalize_question
+
+
+@pytest.fixture
+def bank():
+    bank = AnswerBank(":memory:")
+    bank.learn("How many years of experience do you have with Python?", "5")
+    bank.learn("Are you authorized to work in the US?", "Yes")
+    bank.learn("Will you now or in the future require visa sponsorship?", "No")
+    yield bank
+    bank.close()
+
+
+def test_normalize_drops_punctuation_stopwords_and_required_markers():
+    assert normalize_question("Are you authorized to work in the US? (Required)*") == "authorized work us"
+
+
+def test_exact_question(bank):
+    assert bank.lookup("Are you authorized to work in the US?") == "Yes"
+
+
+@pytest.mark.parametrize("question, answer", [
+    ("How many years of Python experience do you have?", "5"),
+    ("How many years experience with python (required)*", "5"),
+    ("Are you authorised to work in the US?", "Yes"),
+    ("Are you legally authorized to work in the US?", "Yes"),
+    ("Will you now or in the future require sponsorship for a visa?", "No"),
+])
+def test_reworded_question(bank, question, answer):
+    assert bank.lookup(question) == answer
+
+
+@pytest.mark.parametrize("question", [
+    "How many years of experience do you have with Java?",
+    "How many years of Kubernetes experience do you have?",
+    "How many years of experience do you have with JavaScript?",
+    "Are you authorized to work in the UK?",
+    "Do you require visa sponsorship?",
+    "What is your expected salary?",
+])
+def test_near_miss_question_has_no_answer(bank, question):
+    assert bank.lookup(question) is None
+
+
+def test_learned_answer_does_not_replace_configured_one(bank):
+    assert bank.learn("What is your notice period?", "2 weeks", source=CONFIG)
+    assert not bank.learn("What is your notice period?", "1 month")
+    assert bank.lookup("What is your notice period?") == "2 weeks"
+    assert bank.learn("What is your notice period?", "1 month", source=CONFIRMED)
+    assert bank.lookup("What is your notice period?") == "1 month"
+
+
+def test_answering_a_pending_question_clears_it(bank):
+    bank.record_pending("What is your expected salary?", "text", [], "lever")
+    bank.record_pending("What is your expected salary?", "text", [], "indeed")
+    assert [(row["question"], row["seen_count"]) for row in bank.pending()] == [("What is your expected salary?", 2)]
+
+    bank.learn("What is your expected salary?", "Negotiable", source=CONFIRMED)
+    assert bank.pending() == []
@@ -0,0 +1,51 @@
+"""
+Token-bucket rate limits of the apply scheduler
+"""
+import pytest
+from job_boards import apply_scheduler
+from job_boards.apply_scheduler import TokenBucket
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(apply_scheduler.time, "monotonic", clock)
+    return clock
+
+
+def test_burst_then_wait(clock):
+    bucket = TokenBucket(rate_per_hour=60, burst=2)
+    assert bucket.take() == 0
+    assert bucket.take() == 0
+    assert bucket.take() == pytest.approx(60)
+
+
+def test_refills_at_rate_up_to_burst(clock):
+    bucket = TokenBucket(rate_per_hour=60, burst=2)
+    bucket.take()
+    bucket.take()
+    clock.now += 30
+    assert bucket.take() == pytest.approx(30)
+    clock.now += 30
+    assert bucket.take() == 0
+
+    # A long idle period refills only up to the burst size
+    clock.now += 3600
+    assert bucket.take() == 0
+    assert bucket.take() == 0
+    assert bucket.take() > 0
+
+
+def test_zero_rate_never_refills(clock):
+    bucket = TokenBucket(rate_per_hour=0, burst=1)
+    assert bucket.take() == 0
+    clock.now += 3600
+    assert bucket.take() == float("inf")
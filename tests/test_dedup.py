@@ -0,0 +1,62 @@
+"""
+Cross-board duplicate detection
+"""
+from job_boards.dedup import JobDeduplicator, canonical_title, same_location, normalize_location
+
+
+def job(board, title, company="Acme Corp", location="Austin, TX", url=None):
+    return {
+        "job_board": board,
+        "job_title": title,
+        "company": company,
+        "location": location,
+        "url": url or f"https://{board}.example.com/{title.replace(' ', '-')}",
+        "job_id": f"{board}-{title}",
+    }
+
+
+def test_canonical_title_expands_abbreviations_and_drops_noise():
+    assert canonical_title("Sr. Software Eng (Remote)") == "senior software engineer"
+
+
+def test_same_location_allows_a_more_detailed_one():
+    assert same_location(normalize_location("Austin, TX"), normalize_location("Austin, TX, United States"))
+    assert not same_location(normalize_location("Austin, TX"), normalize_location("Boston, MA"))
+
+
+def test_same_posting_on_two_boards_is_merged():
+    jobs = [
+        job("indeed", "Senior Software Engineer"),
+        job("lever", "Sr Software Engineer", location="Austin, TX, USA"),
+    ]
+    deduped = JobDeduplicator().dedupe(jobs)
+    assert len(deduped) == 1
+    # Company boards are preferred as the canonical copy
+    assert deduped[0]["job_board"] == "lever"
+    assert sorted(source["job_board"] for source in deduped[0]["sources"]) == ["indeed", "lever"]
+
+
+def test_different_level_company_or_location_is_kept():
+    jobs = [
+        job("indeed", "Senior Software Engineer"),
+        job("linkedin", "Software Engineer"),
+        job("lever", "Senior Software Engineer", company="Globex"),
+        job("builtin", "Senior Software Engineer", location="Boston, MA"),
+    ]
+    assert len(JobDeduplicator().dedupe(jobs)) == 4
+
+
+def test_two_jobs_from_one_board_are_never_merged():
+    jobs = [
+        job("indeed", "Senior Software Engineer", url="https://indeed.example.com/1"),
+        job("indeed", "Senior Software Engineer", url="https://indeed.example.com/2"),
+        job("lever", "Senior Software Engineer"),
+    ]
+    deduped = JobDeduplicator().dedupe(jobs)
+    assert len(deduped) == 2
+    assert [len(group["sources"]) for group in deduped] == [2, 1]
+
+
+def test_keeps_first_seen_order():
+    jobs = [job("indeed", "Data Analyst"), job("indeed", "Backend Developer"), job("lever", "Data Analyst")]
+    assert [group["job_title"] for group in JobDeduplicator().dedupe(jobs)] == ["Data Analyst", "Backend Developer"]
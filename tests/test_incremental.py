@@ -0,0 +1,108 @@
+"""
+Incremental scans: high-water marks and the open-jobs backlog
+"""
+import pytest
+from job_boards.incremental import IncrementalScan
+from job_boards.job_store import JobStore
+from job_boards.linkedin import LinkedInBoard
+
+CONFIG = {
+    "pacing": {"enabled": False},
+    "selector_cache": {"enabled": False},
+    "sessions": {"enabled": False},
+}
+
+
+def make_jobs(count, start=0):
+    return [
+        {
+            "job_id": f"job-{i}",
+            "job_title": f"Engineer {i}",
+            "company": f"Company {i}",
+            "location": "Remote",
+            "url": f"https://jobs.example.com/{i}",
+            "job_board": "linkedin",
+        }
+        for i in range(start, start + count)
+    ]
+
+
+def run_scan(store, jobs, **kwargs):
+    """Scan jobs newest first like a board does; returns (new jobs, backlog)"""
+    scan = IncrementalScan(store, "linkedin", "query", **kwargs)
+    new_jobs = list(scan.filter(jobs))
+    store.upsert_jobs(new_jobs)
+    return new_jobs, scan.commit()
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = JobStore(tmp_path / "jobs.db")
+    yield store
+    store.close()
+
+
+def test_second_run_stops_at_the_mark(store):
+    jobs = make_jobs(5)
+    new_jobs, backlog = run_scan(store, jobs)
+    assert len(new_jobs) == 5
+    assert backlog == []
+
+    # Two postings appear on top of the list
+    new_jobs, _ = run_scan(store, make_jobs(2, start=10) + jobs)
+    assert [job["job_id"] for job in new_jobs] == ["job-10", "job-11"]
+
+
+def test_commit_merges_into_the_previous_mark(store):
+    run_scan(store, make_jobs(5), mark_size=4)
+    assert store.get_search_mark("linkedin", "query") == ["job-0", "job-1", "job-2", "job-3"]
+
+    # The scan stops at job-0, so only job-9 and job-0 are seen this run
+    run_scan(store, make_jobs(1, start=9) + make_jobs(5), mark_size=4)
+    assert store.get_search_mark("linkedin", "query") == ["job-9", "job-0", "job-1", "job-2"]
+
+
+def test_backlog_returns_jobs_neither_applied_nor_dismissed(store):
+    jobs = make_jobs(4)
+    run_scan(store, jobs)
+    store.record_application(jobs[0], "applied")
+    store.record_application(jobs[1], "failed")
+    store.dismiss_job(jobs[2])
+
+    new_jobs, backlog = run_scan(store, jobs)
+    assert new_jobs == []
+    assert sorted(job["job_id"] for job in backlog) == ["job-1", "job-3"]
+
+
+class FakeElement:
+    def click(self):
+        pass
+
+
+class FakeDriver:
+    def __init__(self):
+        self.visited = []
+
+    def get(self, url):
+        self.visited.append(url)
+
+
+def test_backlog_job_goes_through_linkedin_apply(store, monkeypatch):
+    jobs = make_jobs(1)
+    run_scan(store, jobs)
+    _, backlog = run_scan(store, jobs)
+    assert [job["job_id"] for job in backlog] == ["job-0"]
+
+    driver = FakeDriver()
+    board = LinkedInBoard(CONFIG, driver=driver, job_store=store)
+    monkeypatch.setattr(board, "wait_for_page_ready", lambda timeout=15: True)
+    monkeypatch.setattr(board, "wait_for_element", lambda *args, **kwargs: FakeElement())
+    monkeypatch.setattr(board, "_handle_application_form", lambda: True)
+
+    assert board.apply_if_new(backlog[0]) is True
+    assert driver.visited == ["https://jobs.example.com/0"]
+    assert store.already_applied("job-0")
+
+    # Applied to, so it no longer comes back
+    _, backlog = run_scan(store, jobs)
+    assert backlog == []
@@ -0,0 +1,63 @@
+"""
+Run journal replay after an interrupted run
+"""
+from job_boards.journal import APPLIED, APPLYING, FAILED, SCORED, RunJournal
+
+
+def make_job(job_id):
+    return {"job_id": job_id, "job_title": f"Engineer {job_id}", "company": "Acme", "url": f"https://x/{job_id}"}
+
+
+def test_fresh_journal_is_not_interrupted(tmp_path):
+    journal = RunJournal(tmp_path / "run.jsonl")
+    assert not journal.interrupted
+    assert journal.pending_jobs() == []
+    journal.close()
+
+
+def test_replay_restores_last_states(tmp_path):
+    path = tmp_path / "run.jsonl"
+    journal = RunJournal(path)
+    journal.record_board("indeed|python|remote|", [make_job("1"), make_job("2"), make_job("3")])
+    journal.record_job(dict(make_job("1"), match_score=0.9), SCORED)
+    journal.record_job(make_job("1"), APPLYING)
+    journal.record_job(make_job("1"), APPLIED)
+    journal.record_job(make_job("2"), APPLYING)
+    journal.record_job(make_job("3"), FAILED, error="no apply button")
+    journal.close()
+
+    resumed = RunJournal(path)
+    assert resumed.interrupted
+    assert resumed.state("1") == APPLIED
+    # Cut off mid-apply, and failed, jobs are both left to finish
+    assert resumed.state("2") == APPLYING
+    assert sorted(job["job_id"] for job in resumed.pending_jobs()) == ["2", "3"]
+    assert [job["job_id"] for job in resumed.board_jobs("indeed|python|remote|")] == ["1", "2", "3"]
+    assert resumed.board_jobs("lever|python|remote|") is None
+    assert resumed.board_jobs("indeed|python|remote|")[0]["match_score"] == 0.9
+    resumed.close()
+
+
+def test_torn_last_line_is_ignored(tmp_path):
+    path = tmp_path / "run.jsonl"
+    journal = RunJournal(path)
+    journal.record_job(make_job("1"), SCORED)
+    journal.close()
+    with open(path, "a", encoding="utf-8") as journal_file:
+        journal_file.write('{"type":"job","id":"2","sta')
+
+    resumed = RunJournal(path)
+    assert resumed.state("1") == SCORED
+    assert resumed.state("2") is None
+    resumed.close()
+
+
+def test_complete_removes_the_journal(tmp_path):
+    path = tmp_path / "run.jsonl"
+    journal = RunJournal(path)
+    journal.record_job(make_job("1"), SCORED)
+    journal.complete()
+    assert not path.exists()
+    fresh = RunJournal(path)
+    assert not fresh.interrupted
+    fresh.close()
@@ -0,0 +1,130 @@
+"""
+Lever search over HTTP against a local stand-in for the postings API and job pages
+"""
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import pytest
+from job_boards import http_fetch
+from job_boards.http_fetch import extract_cards_from_html, fetch_html
+from job_boards.lever import LeverBoard
+
+POSTINGS = {
+    "acme": [
+        {"text": "Software Engineer ", "categories": {"location": "Remote"}, "hostedUrl": "https://jobs.lever.co/acme/1"},
+        {"text": "Senior Software Engineer", "categories": {"location": "Remote"}, "hostedUrl": "https://jobs.lever.co/acme/2"},
+        {"text": "Office Manager", "categories": {"location": "Austin"}, "hostedUrl": "https://jobs.lever.co/acme/3"},
+        {"text": "Backend Developer", "categories": None, "hostedUrl": "https://jobs.lever.co/acme/4"},
+    ],
+}
+
+# Postings page of a company the API does not know, read by the browser fallback
+POSTINGS_PAGE = """
+<html><body>
+  <div class="posting">
+    <a class="posting-title" href="/globex/10"><h5>Platform Engineer</h5></a>
+    <span class="sort-by-location">Berlin</span>
+  </div>
+  <div class="posting">
+    <a class="posting-title" href="/globex/11"><h5>Recruiter</h5></a>
+    <span class="sort-by-location">Berlin</span>
+  </div>
+</body></html>
+"""
+
+
+class StandInHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        path = self.path.split("?", 1)[0]
+        if path.startswith("/v0/postings/"):
+            slug = path.rsplit("/", 1)[-1]
+            if slug not in POSTINGS:
+                self._send(404, "application/json", json.dumps({"ok": False}))
+            else:
+                self._send(200, "application/json", json.dumps(POSTINGS[slug]))
+        elif path == "/globex":
+            self._send(200, "text/html", POSTINGS_PAGE)
+        else:
+            self._send(404, "text/plain", "not found")
+
+    def _send(self, status, content_type, body):
+        data = body.encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture(scope="module")
+def server_url():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StandInHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_port}"
+    server.shutdown()
+    server.server_close()
+
+
+def make_board(server_url, companies):
+    config = {
+        "job_boards": {"lever": {"api_url": f"{server_url}/v0/postings"}},
+        "job_search": {
+            "lever_companies": companies,
+            "keywords": ["engineer", "developer"],
+            "exclude_keywords": ["senior"],
+        },
+    }
+    return LeverBoard(config)
+
+
+def test_api_postings_are_parsed_without_a_browser(server_url):
+    board = make_board(server_url, [{"name": "Acme", "url": "https://jobs.lever.co/acme"}])
+    before = http_fetch.fetch_stats().get("lever", {}).get("http", 0)
+
+    jobs = board.search_jobs("engineer", "Remote")
+
+    assert [(job["job_title"], job["location"], job["url"]) for job in jobs] == [
+        ("Software Engineer", "Remote", "https://jobs.lever.co/acme/1"),
+        ("Backend Developer", "", "https://jobs.lever.co/acme/4"),
+    ]
+    assert all(job["company"] == "Acme" and job["job_board"] == "lever_acme" for job in jobs)
+    assert len({job["job_id"] for job in jobs}) == 2
+    assert not board.has_driver
+    assert http_fetch.fetch_stats()["lever"]["http"] == before + 1
+
+
+def test_api_miss_falls_back_to_the_browser(server_url):
+    company = {"name": "Globex", "url": f"{server_url}/globex"}
+    board = make_board(server_url, [company])
+    loaded = []
+
+    def browser_search(company_data, search_keywords):
+        # Stands in for the browser: loads the same page and reads it with the board's card spec
+        loaded.append(company_data["url"])
+        html = fetch_html(company_data["url"])
+        return extract_cards_from_html(html, board.CARD_SELECTOR, board.CARD_FIELDS, base_url=company_data["url"])
+
+    board._search_selenium = browser_search
+    before = dict(http_fetch.fetch_stats().get("lever", {}))
+
+    jobs = board.search_jobs("engineer", "Berlin")
+
+    assert loaded == [company["url"]]
+    assert [(job["job_title"], job["location"], job["url"]) for job in jobs] == [
+        ("Platform Engineer", "Berlin", f"{server_url}/globex/10"),
+    ]
+    stats = http_fetch.fetch_stats()["lever"]
+    assert stats["http_fallback"] == before.get("http_fallback", 0) + 1
+    assert stats["selenium"] == before.get("selenium", 0) + 1
+
+
+def test_http_only_mode_never_falls_back(server_url):
+    board = make_board(server_url, [{"name": "Globex", "url": f"{server_url}/globex"}])
+    board.config["job_boards"]["lever"]["fetch_mode"] = "http"
+    board._search_selenium = lambda *args: pytest.fail("browser used in http mode")
+
+    assert board.search_jobs("engineer", "Berlin") == []
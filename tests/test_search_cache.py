@@ -0,0 +1,79 @@
+"""
+Search cache TTL, stale-while-revalidate and LRU eviction
+"""
+import pytest
+from job_boards import search_cache
+from job_boards.search_cache import HIT, MISS, STALE, SearchCache, search_key
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(search_cache.time, "monotonic", clock)
+    return clock
+
+
+def test_key_ignores_case_spacing_and_keyword_order():
+    assert search_key("indeed", ["Python", "Django"], " Remote ") == search_key("indeed", ["django", "python"], "remote")
+    assert search_key("indeed", "python", "remote") != search_key("lever", "python", "remote")
+
+
+def test_fresh_then_stale_then_expired(clock):
+    cache = SearchCache(ttl=60, stale_ttl=120)
+    key = search_key("indeed", "python", "remote")
+    assert cache.get(key) == (None, MISS, None)
+
+    cache.put(key, [{"job_title": "Engineer"}])
+    clock.now += 30
+    assert cache.get(key) == ([{"job_title": "Engineer"}], HIT, 30)
+    clock.now += 60
+    assert cache.get(key) == ([{"job_title": "Engineer"}], STALE, 90)
+    clock.now += 100
+    assert cache.get(key) == (None, MISS, None)
+    assert cache.stats()["entries"] == 0
+
+
+def test_callers_get_copies(clock):
+    cache = SearchCache()
+    cache.put("key", [{"job_title": "Engineer"}])
+    jobs, _, _ = cache.get("key")
+    jobs[0]["job_id"] = "changed"
+    assert cache.get("key")[0] == [{"job_title": "Engineer"}]
+
+
+def test_one_refresh_per_key(clock):
+    cache = SearchCache()
+    assert cache.begin_refresh("key")
+    assert not cache.begin_refresh("key")
+    cache.end_refresh("key")
+    assert cache.begin_refresh("key")
+
+
+def test_evicts_least_recently_used(clock):
+    cache = SearchCache(max_entries=2)
+    cache.put("a", [])
+    cache.put("b", [])
+    cache.get("a")
+    cache.put("c", [])
+    assert cache.get("b")[1] == MISS
+    assert cache.get("a")[1] == HIT
+    assert cache.stats()["evictions"] == 1
+
+
+def test_invalidate_one_board(clock):
+    cache = SearchCache()
+    indeed_key = search_key("indeed", "python", "remote")
+    lever_key = search_key("lever", "python", "remote")
+    cache.put(indeed_key, [])
+    cache.put(lever_key, [])
+    cache.invalidate("indeed")
+    assert cache.get(indeed_key)[1] == MISS
+    assert cache.get(lever_key)[1] == HIT
@@ -0,0 +1,52 @@
+"""
+Network-idle waits over a fake Chrome performance log
+"""
+import json
+import time
+from job_boards.waits import network_idle
+
+
+def log_entry(method, request_id, timestamp=None):
+    message = {"message": {"method": method, "params": {"requestId": request_id}}, "webview": "page"}
+    return {"message": json.dumps(message), "timestamp": timestamp or time.time() * 1000, "level": "INFO"}
+
+
+class FakeLogDriver:
+    def __init__(self):
+        self.pending = []
+
+    def get_log(self, log_type):
+        entries, self.pending = self.pending, []
+        return entries
+
+
+def test_idle_once_requests_finish():
+    driver = FakeLogDriver()
+    condition = network_idle(idle_time=0)
+    driver.pending = [log_entry("Network.requestWillBeSent", "1")]
+    assert not condition(driver)
+    driver.pending = [log_entry("Network.loadingFinished", "1")]
+    assert condition(driver)
+
+
+def test_extra_info_after_finish_is_not_a_new_request():
+    driver = FakeLogDriver()
+    condition = network_idle(idle_time=0)
+    driver.pending = [
+        log_entry("Network.requestWillBeSent", "1"),
+        log_entry("Network.loadingFinished", "1"),
+        log_entry("Network.requestWillBeSentExtraInfo", "1"),
+    ]
+    assert condition(driver)
+
+
+def test_requests_from_before_the_wait_are_ignored():
+    driver = FakeLogDriver()
+    since = time.time()
+    condition = network_idle(idle_time=0, since=since)
+    driver.pending = [
+        log_entry("Network.requestWillBeSent", "stream", timestamp=(since - 5) * 1000),
+        log_entry("Network.requestWillBeSent", "2"),
+        log_entry("Network.loadingFailed", "2"),
+    ]
+    assert condition(driver)